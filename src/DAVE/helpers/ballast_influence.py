@@ -0,0 +1,143 @@
+"""Influence of the fill of ballast tanks on the floating position of a vessel.
+
+Changing the fill of a tank changes the heel, trim and elevation of the vessel that carries the tank. For small
+changes this relation is linear. The influence coefficients of all tanks are measured once by changing the fill of
+every tank in turn and solving statics (finite differences). With those coefficients the fills that bring the vessel to
+a target heel, trim and elevation can be obtained for all tanks at once by solving a bounded linear least-squares
+problem. A few confirming full solves then remove the remaining non-linear error.
+
+This is used by marine.ballast_to_even_keel.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+RESPONSE_NAMES = ("heel", "trim", "elevation")
+
+
+def measure_response(frame) -> np.ndarray:
+    """Heel [deg], trim [deg] and global z-position [m] of frame"""
+    return np.array((frame.heel, frame.trim, frame.global_position[2]), dtype=float)
+
+
+@dataclass
+class TankInfluence:
+    tank_names: list
+    """Names of the tanks, one per column of matrix"""
+
+    fills: np.ndarray
+    """Fill [%] of the tanks at which the influence was measured"""
+
+    response: np.ndarray
+    """Heel, trim and elevation (see measure_response) at the measured fills"""
+
+    matrix: np.ndarray
+    """(3, n_tanks): change of heel [deg], trim [deg] and elevation [m] per % fill"""
+
+    def predict(self, fills) -> np.ndarray:
+        """Linear estimate of the response at the given fills"""
+        return self.response + self.matrix @ (np.asarray(fills, dtype=float) - self.fills)
+
+
+def measure_influence(
+    frame, tanks, solve_func, delta_fill=1, feedback_func=None, do_terminate=None
+) -> TankInfluence or None:
+    """Measures the influence coefficients of the tanks on frame by finite differences.
+
+    The scene is expected to be solved at entry. The fill of each tank is changed by delta_fill (or -delta_fill for
+    tanks that are nearly full), the scene is solved using solve_func and the fill is restored.
+
+    Returns:
+        TankInfluence or None if terminated
+    """
+    base = measure_response(frame)
+    fills = np.array([tank.fill_pct for tank in tanks], dtype=float)
+    matrix = np.zeros((len(RESPONSE_NAMES), len(tanks)))
+
+    for i, tank in enumerate(tanks):
+        step = delta_fill if fills[i] + delta_fill <= 100 else -delta_fill
+
+        tank.fill_pct = fills[i] + step
+        try:
+            solve_func()
+            matrix[:, i] = (measure_response(frame) - base) / step
+        finally:
+            tank.fill_pct = fills[i]
+
+        if feedback_func is not None:
+            feedback_func(
+                f"Influence of tank {tank.name} ({i + 1}/{len(tanks)}): "
+                + ", ".join(f"{n} {v:.3g}/%" for n, v in zip(RESPONSE_NAMES, matrix[:, i]))
+            )
+
+        if do_terminate is not None and do_terminate():
+            return None
+
+    solve_func()  # back to the base state
+
+    return TankInfluence(
+        tank_names=[tank.name for tank in tanks],
+        fills=fills,
+        response=base,
+        matrix=matrix,
+    )
+
+
+def solve_fills(
+    influence: TankInfluence,
+    current_fills,
+    current_response,
+    target,
+    lower,
+    upper,
+    weights=(1, 1, 1),
+    regularization=1e-3,
+) -> np.ndarray:
+    """Fills that bring the response to target according to the influence coefficients.
+
+    Solves the bounded least-squares problem
+
+        min || W (A dx + current_response - target) ||^2 + (r ||A||)^2 || dx ||^2   with lower <= current_fills + dx <= upper
+
+    The small regularization term r spreads the change over the tanks and makes the solution unique when there are
+    more tanks than targets.
+
+    Args:
+        influence: measured influence coefficients (A)
+        current_fills: fills of the tanks [%]
+        current_response: actual heel, trim and elevation at current_fills
+        target: target heel, trim and elevation. Use None for a component that is free.
+        lower, upper: bounds of the fills [%]
+        weights: weight per response component (W)
+        regularization: relative weight of the fill changes (r)
+
+    Returns:
+        fills [%]
+    """
+    from scipy.optimize import lsq_linear
+
+    current_fills = np.asarray(current_fills, dtype=float)
+    lower = np.asarray(lower, dtype=float)
+    upper = np.asarray(upper, dtype=float)
+
+    rows = [i for i, t in enumerate(target) if t is not None]
+    A = influence.matrix[rows, :] * np.array(weights, dtype=float)[rows, None]
+    b = (
+        np.array([target[i] for i in rows], dtype=float)
+        - np.asarray(current_response, dtype=float)[rows]
+    ) * np.array(weights, dtype=float)[rows]
+
+    n = len(current_fills)
+    scale = regularization * max(np.linalg.norm(A), 1e-12)
+    A = np.vstack((A, scale * np.eye(n)))
+    b = np.concatenate((b, np.zeros(n)))
+
+    lb = lower - current_fills
+    ub = upper - current_fills
+    fixed = ub - lb < 1e-9  # lsq_linear requires lb < ub
+    ub[fixed] = lb[fixed] + 1e-9
+
+    dx = lsq_linear(A, b, bounds=(lb, ub)).x
+    dx[fixed] = lb[fixed]
+
+    return np.clip(current_fills + dx, lower, upper)
@@ -0,0 +1,339 @@
+"""Ballast plans: tank fills for many stages (load cases) of a ballast system.
+
+See BallastSystem.plan for the user interface.
+
+Every stage defines a target elevation of the vessel (the parent of the ballast system) and optionally a set of
+property values (external loads, cargo weights, etc). For each stage the fills of the non-frozen tanks are solved such
+that the vessel floats even-keel at the target elevation.
+
+The influence of the tanks on heel, trim and elevation (see ballast_influence) is measured once on the scene and
+re-used for all stages. Per stage the fills are obtained by bounded least-squares followed by confirming solves.
+
+By default the stages are solved in this process. Optionally they are distributed over a pool of worker processes in
+contiguous chunks (see sweep.run_in_workers). Every worker builds its own copy of the scene from python code once.
+Within a chunk every stage starts from the fills and DOFs of the previous stage.
+"""
+import numpy as np
+
+from DAVE.helpers.sweep import run_in_workers, worker_scene
+
+
+def give_cases(cases) -> list[tuple]:
+    """Normalizes the cases to a list of (stage, target elevation, dict of (node-name, property-name) -> value)
+
+    cases may be a pandas DataFrame or a list of dicts. Every case has a "stage" and a "target_elevation". Property
+    values are given as a "loads" dict with (node-name, property-name) keys or as entries named "node.property".
+    """
+    if hasattr(cases, "to_dict"):  # DataFrame
+        cases = cases.to_dict("records")
+
+    normalized = []
+    for i, case in enumerate(cases):
+        case = dict(case)
+        stage = case.pop("stage", i)
+        try:
+            target = float(case.pop("target_elevation"))
+        except KeyError:
+            raise ValueError(f"No target_elevation given for stage {stage}")
+
+        loads = {tuple(k): v for k, v in case.pop("loads", dict()).items()}
+        for key, value in case.items():
+            if "." not in key:
+                raise ValueError(
+                    f"Unknown entry {key} for stage {stage}, use 'node.property' to set a property"
+                )
+            node_name, prop = key.rsplit(".", 1)
+            loads[(node_name, prop)] = value
+
+        normalized.append((stage, target, loads))
+
+    return normalized
+
+
+def solve_stage(
+    bs,
+    influence,
+    target,
+    loads: dict,
+    start_fills,
+    tolerance,
+    elevation_tolerance,
+    max_iterations,
+    do_terminate_func=None,
+) -> tuple:
+    """Applies the loads and solves the fills of the tanks in influence such that the parent of ballast-system bs
+    is even-keel at the target elevation.
+
+    Returns:
+        (converged, number of iterations, fills of all tanks of bs, heel, trim, elevation)
+    """
+    from DAVE.helpers.ballast_influence import measure_response, solve_fills
+
+    s = bs._scene
+    f = bs.parent
+
+    for (node_name, prop), value in loads.items():
+        setattr(s[node_name], prop, value)
+
+    tanks = [s[name] for name in influence.tank_names]
+    for tank, fill in zip(tanks, start_fills):
+        tank.fill_pct = fill
+
+    lower = np.zeros(len(tanks))
+    upper = np.full(len(tanks), 100.0)
+
+    def solve():
+        try:
+            return s._solve_statics_with_optional_control(
+                do_terminate_func=do_terminate_func
+            )
+        except ValueError:  # time-out or solver self-check failed
+            return False
+
+    converged = solve()
+    iterations = 0
+
+    while converged and iterations < max_iterations:
+        response = measure_response(f)
+        if (
+            abs(response[0]) < tolerance
+            and abs(response[1]) < tolerance
+            and abs(response[2] - target) < elevation_tolerance
+        ):
+            break
+
+        fills = solve_fills(
+            influence,
+            current_fills=[tank.fill_pct for tank in tanks],
+            current_response=response,
+            target=(0, 0, target),
+            lower=lower,
+            upper=upper,
+        )
+        for tank, fill in zip(tanks, fills):
+            tank.fill_pct = fill
+
+        converged = solve()
+        iterations += 1
+
+    heel, trim, elevation = measure_response(f)
+    within = (
+        converged
+        and abs(heel) < tolerance
+        and abs(trim) < tolerance
+        and abs(elevation - target) < elevation_tolerance
+    )
+
+    return (
+        within,
+        iterations,
+        [tank.fill_pct for tank in bs.tanks],
+        heel,
+        trim,
+        elevation,
+    )
+
+
+def _solve_chunk(chunk, bs_name, influence, base_loads, settings):
+    """Runs in a worker process, chunk is a list of (index, stage, target, loads)"""
+    return solve_chunk(worker_scene()[bs_name], chunk, influence, base_loads, settings)
+
+
+def solve_chunk(
+    bs, chunk, influence, base_loads, settings, feedback_func=None, do_terminate_func=None
+) -> list:
+    """Solves the stages in chunk one after the other, every stage starts from the fills and dofs of the previous one.
+
+    Returns:
+        list of (index, result of solve_stage), stops early if terminated
+    """
+    s = bs._scene
+    start_fills = influence.fills
+    dofs = None
+
+    results = []
+    for index, stage, target, loads in chunk:
+        if do_terminate_func is not None and do_terminate_func():
+            break
+
+        if dofs is not None and len(dofs) == s._vfc.n_dofs():
+            s._vfc.set_dofs(dofs)
+
+        r = solve_stage(
+            bs,
+            influence,
+            target,
+            {**base_loads, **loads},
+            start_fills,
+            **settings,
+        )
+        results.append((index, r))
+
+        if feedback_func is not None:
+            feedback_func(f"Solved stage {stage}")
+
+        if r[0]:
+            start_fills = [s[name].fill_pct for name in influence.tank_names]
+            dofs = s._vfc.get_dofs()
+
+    return results
+
+
+def run_plan(
+    bs,
+    cases,
+    tolerance=0.01,
+    elevation_tolerance=0.01,
+    delta_fill=1,
+    max_iterations=10,
+    n_workers=1,
+    feedback_func=None,
+    do_terminate_func=None,
+):
+    """See BallastSystem.plan"""
+    import pandas as pd
+    from DAVE.helpers.ballast_influence import measure_influence
+
+    def give_feedback(txt):
+        if feedback_func is not None:
+            feedback_func(txt)
+
+    scene = bs._scene
+
+    cases = give_cases(cases)
+    n_cases = len(cases)
+    if n_cases == 0:
+        raise ValueError("No stages to plan")
+
+    # check the input and record the current values of all properties that are changed by any of the stages
+    base_loads = dict()
+    for stage, target, loads in cases:
+        for node_name, prop in loads:
+            node = scene[node_name]
+            if not hasattr(node, prop):
+                raise ValueError(
+                    f"Node {node_name} does not have a property {prop} (stage {stage})"
+                )
+            base_loads[(node_name, prop)] = getattr(node, prop)
+
+    tanks = [tank for tank in bs.tanks if not bs.is_frozen(tank.name)]
+    if not tanks:
+        raise ValueError("No tanks available for ballasting, all tanks are frozen")
+
+    # influence coefficients, measured once on a copy of the scene
+    s = scene.copy()
+    s.solve_statics()
+    give_feedback("Measuring the influence of the tanks")
+    influence = measure_influence(
+        s[bs.parent.name],
+        [s[tank.name] for tank in tanks],
+        solve_func=s.solve_statics,
+        delta_fill=delta_fill,
+        feedback_func=feedback_func,
+        do_terminate=do_terminate_func,
+    )
+
+    settings = dict(
+        tolerance=tolerance,
+        elevation_tolerance=elevation_tolerance,
+        max_iterations=max_iterations,
+    )
+
+    indexed = [(i, *case) for i, case in enumerate(cases)]
+    results = [None] * n_cases
+
+    if influence is None:  # terminated, none of the stages is solved
+        give_feedback("Planning terminated while measuring the influence of the tanks")
+
+    elif n_workers == 1:
+        # in-process on the copy
+        for index, r in solve_chunk(
+            s[bs.name],
+            indexed,
+            influence,
+            base_loads,
+            settings,
+            feedback_func=feedback_func,
+            do_terminate_func=do_terminate_func,
+        ):
+            results[index] = r
+
+    else:
+        if n_workers is None:
+            from os import cpu_count
+
+            n_workers = max(1, min(cpu_count() or 1, n_cases))
+
+        chunk_size = int(np.ceil(n_cases / n_workers))
+        chunks = [
+            indexed[start : start + chunk_size]
+            for start in range(0, n_cases, chunk_size)
+        ]
+
+        def on_result(job_index, chunk_results):
+            for index, r in chunk_results:
+                results[index] = r
+            return len(chunk_results)
+
+        n_done = run_in_workers(
+            s,
+            _solve_chunk,
+            [(chunk, bs.name, influence, base_loads, settings) for chunk in chunks],
+            n_workers,
+            on_result,
+            n_items=n_cases,
+            progress_text="Solved {} of {} stages",
+            feedback_func=feedback_func,
+            do_terminate_func=do_terminate_func,
+        )
+
+        if n_done < n_cases:
+            give_feedback(f"Planning terminated after {n_done} of {n_cases} stages")
+
+    # ---- assemble the tables ----
+    stages = [case[0] for case in cases]
+    tank_names = bs.tank_names()
+
+    fills = []
+    report = []
+    for (stage, target, loads), r in zip(cases, results):
+        if r is None:  # not solved (terminated)
+            fills.append([np.nan] * len(tank_names))
+            report.append((target, np.nan, np.nan, np.nan, np.nan, False, 0, True))
+            continue
+
+        converged, iterations, tank_fills, heel, trim, elevation = r
+        fills.append(tank_fills)
+        report.append(
+            (
+                target,
+                elevation,
+                elevation - target,
+                heel,
+                trim,
+                converged,
+                iterations,
+                False,
+            )
+        )
+
+    df_fills = pd.DataFrame(fills, columns=tank_names, index=stages)
+    df_fills.index.name = "stage"
+
+    df_report = pd.DataFrame(
+        report,
+        columns=[
+            "target_elevation",
+            "elevation",
+            "elevation_error",
+            "heel",
+            "trim",
+            "converged",
+            "iterations",
+            "terminated",
+        ],
+        index=stages,
+    )
+    df_report.index.name = "stage"
+
+    return df_fills, df_report
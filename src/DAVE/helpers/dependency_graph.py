@@ -0,0 +1,148 @@
+"""Reverse dependencies between the nodes of a scene.
+
+Nodes only know what they depend on (Node.depends_on) and what their parent is. Questions like "which nodes depend
+on this node" or "which nodes have this node as parent" therefore require a scan over all nodes. The DependencyGraph
+does that scan once and stores the result as adjacency lists such that these questions can be answered in a time
+proportional to the size of the answer.
+
+The graph of a scene is obtained using Scene._give_dependency_graph. Dependencies can be changed without a node
+setter (for example ballast_system.tanks.append), so the graph is not cached between operations. It is only kept while
+Scene.delete runs: then it is re-used for the whole branch of deleted nodes and updated in-place for every deleted node.
+The graph is built once for operations that would otherwise need a scan per node (sorting, recursive tree queries),
+single queries outside a delete use a plain scan over the nodes.
+"""
+
+
+class DependencyGraph:
+    def __init__(self, nodes):
+        self.index = dict()
+        """node -> position in the list of nodes, used to return results in the order of the scene"""
+
+        self.depends_on = dict()
+        """node -> list of nodes that it depends on (Node.depends_on)"""
+
+        self.dependants = dict()
+        """node -> list of nodes that depend on it, reverse of depends_on. A node may occur multiple times if it depends
+        on the same node multiple times"""
+
+        self.children = dict()
+        """node -> list of nodes that have node as parent"""
+
+        for i, node in enumerate(nodes):
+            self.index[node] = i
+            self.dependants[node] = []
+            self.children[node] = []
+
+        for node in nodes:
+            self._add_edges(node)
+
+    def _add_edges(self, node):
+        try:
+            deps = node.depends_on()
+        except Exception as E:
+            raise Exception(
+                f"Error when checking dependencies of node {node.name} of type {type(node)}"
+                + ":"
+                + str(E)
+            )
+
+        self.depends_on[node] = list(deps)
+        for dep in deps:
+            if dep in self.dependants:
+                self.dependants[dep].append(node)
+
+        try:
+            parent = node.parent
+        except AttributeError:
+            return
+
+        if parent in self.children:
+            self.children[parent].append(node)
+
+    def remove(self, node):
+        """Removes node and all its edges from the graph. Call this before the node is invalidated."""
+
+        for dep in self.depends_on.pop(node, ()):
+            dependants = self.dependants.get(dep, None)
+            if dependants is not None:
+                self.dependants[dep] = [d for d in dependants if d is not node]
+
+        try:
+            parent = node.parent
+        except AttributeError:
+            parent = None
+
+        children = self.children.get(parent, None)
+        if children is not None and node in children:
+            children.remove(node)
+
+        self.dependants.pop(node, None)
+        self.children.pop(node, None)
+        self.index.pop(node, None)
+
+    def direct_dependants(self, nodes) -> list:
+        """Returns the nodes that directly depend on any of the given nodes, in scene order, without duplicates"""
+        found = dict()  # used as ordered set
+        for node in nodes:
+            for dependant in self.dependants.get(node, ()):
+                found[dependant] = None
+
+        return sorted(found, key=lambda n: self.index[n])
+
+    def descendants(self, node) -> list:
+        """Returns the children of node followed by the descendants of each of the children (see Scene.nodes_with_parent)"""
+        r = list(self.children.get(node, ()))
+        more = []
+        for n in r:
+            more.extend(self.descendants(n))
+        r.extend(more)
+        return r
+
+    def topological_order(self, created_by: dict) -> list:
+        """Returns the nodes such that every node comes after all the nodes it depends on (see Scene.sort_nodes_by_dependency).
+
+        Nodes that are created by a manager are placed directly after that manager.
+
+        Nodes are exported in rounds, every round contains the nodes of which all dependencies were exported in the
+        previous rounds. Within a round the original order is maintained.
+
+        Args:
+            created_by: dict of manager -> list of nodes created by that manager, see Scene.get_created_by_dict
+
+        Returns:
+            list of nodes. Nodes that can not be ordered (circular or missing dependencies) are not included.
+        """
+        implicitly_created = set()
+        for created in created_by.values():
+            implicitly_created.update(created)
+
+        # number of not-yet exported dependencies per node
+        n_remaining = {
+            node: len(set(self.depends_on[node])) for node in self.depends_on
+        }
+
+        exported = []
+        ready = [
+            node
+            for node in self.depends_on
+            if n_remaining[node] == 0 and node not in implicitly_created
+        ]
+
+        def export(node, next_round):
+            exported.append(node)
+            for dependant in dict.fromkeys(self.dependants[node]):
+                n_remaining[dependant] -= 1
+                if n_remaining[dependant] == 0 and dependant not in implicitly_created:
+                    next_round.append(dependant)
+
+            for created_node in created_by.get(node, ()):
+                export(created_node, next_round)
+
+        while ready:
+            ready.sort(key=lambda n: self.index[n])
+            next_round = []
+            for node in ready:
+                export(node, next_round)
+            ready = next_round
+
+        return exported
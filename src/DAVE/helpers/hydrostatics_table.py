@@ -0,0 +1,157 @@
+"""Hydrostatic lookup table of a Buoyancy node.
+
+The hydrostatic properties of a buoyancy shape (displacement, center of buoyancy, waterplane area, center of
+floatation and metacentric radii) only depend on the draft, heel and trim of the shape. Calculating them means
+chopping the mesh at the waterline for several positions (see marine.calculate_linearized_buoyancy_props).
+
+The table evaluates these properties once for a range of vertical positions of the parent at even keel. Queries are
+answered by linear interpolation. Small heel and trim angles are accounted for using the metacentric radii.
+
+Tables are obtained from Buoyancy.hydrostatics_table which builds them on first use and re-builds them when the mesh
+or the parent of the node changed.
+"""
+import math
+from warnings import warn
+
+import numpy as np
+
+_COLUMNS = ("displacement", "cob_x", "cob_y", "cob_z", "Awl", "COFX", "COFY", "BMT", "BML")
+
+
+class HydrostaticsTable:
+    def __init__(self, z, values: dict):
+        self.z = np.asarray(z, dtype=float)
+        """Vertical positions of the parent (global) [m], ascending"""
+
+        self.values = {key: np.asarray(values[key], dtype=float) for key in _COLUMNS}
+        """Column name -> value at each of z. Displacement in [m3], positions in the parent axis system [m]"""
+
+    @staticmethod
+    def build(node, stepsize=0.1, delta_draft=1e-3, delta_roll=1, delta_pitch=0.3):
+        """Evaluates the hydrostatic properties of Buoyancy node for parent elevations from fully submerged to
+        fully emerged in steps of stepsize [m]"""
+        from DAVE.marine import _prepare_hydrostatics_scene, _linearized_buoyancy_props_at
+
+        scene = node._scene
+        prepared = _prepare_hydrostatics_scene(
+            codes=[node.give_python_code()],
+            parent_name=node.parent.name,
+            resource_provider=scene.resource_provider,
+        )
+
+        copy = prepared[3][0]
+        xn, xp, yn, yp, zn, zp = copy.trimesh.get_extends()
+
+        n = max(2, int(math.ceil((zp - zn) / stepsize)) + 1)
+        elevations = np.linspace(-zp, -zn, n)
+
+        z = []
+        values = {key: [] for key in _COLUMNS}
+        for elevation in elevations:
+            r = _linearized_buoyancy_props_at(
+                prepared,
+                elevation,
+                scene.g,
+                scene.rho_water,
+                delta_draft,
+                delta_roll,
+                delta_pitch,
+            )
+            if r is None:  # no waterplane at this elevation (top or bottom of a box)
+                continue
+
+            z.append(elevation)
+            values["displacement"].append(r["displacement"])
+            values["cob_x"].append(r["cob"][0])
+            values["cob_y"].append(r["cob"][1])
+            values["cob_z"].append(r["cob"][2])
+            for key in ("Awl", "COFX", "COFY", "BMT", "BML"):
+                values[key].append(r[key])
+
+        if len(z) < 2:
+            raise ValueError(
+                f"Could not create a hydrostatics table for {node.name}, the mesh does not have a waterplane for a range of drafts"
+            )
+
+        return HydrostaticsTable(z, values)
+
+    @property
+    def z_range(self) -> tuple:
+        """Range of vertical positions of the parent that the table covers [m]"""
+        return self.z[0], self.z[-1]
+
+    def covers(self, z) -> bool:
+        """True if vertical position z [m] is within the range of the table"""
+        return self.z[0] <= z <= self.z[-1]
+
+    def at(self, z, heel=0, trim=0) -> dict or None:
+        """Interpolated hydrostatic properties for the parent at vertical position z [m] and small heel and trim [deg]
+
+        Returns a dict with the same keys as marine.calculate_linearized_buoyancy_props (without the force related
+        entries) plus "cob_global": the position of the center of buoyancy in an even-keel axis system at the origin
+        of the parent, corrected for heel and trim.
+
+        Outside the range of the table the shape is either fully submerged or fully emerged. Same as
+        marine.calculate_linearized_buoyancy_props this gives a warning and returns None.
+        """
+        if not self.covers(z):
+            warn(
+                f"Vertical position of {z}m is outside the range of the hydrostatics table ({self.z[0]} .. {self.z[-1]})"
+            )
+            return None
+
+        v = {key: float(np.interp(z, self.z, column)) for key, column in self.values.items()}
+
+        cob = np.array((v["cob_x"], v["cob_y"], v["cob_z"]))
+
+        # for small angles the cob moves over the metacentric radius
+        cob_global = cob + np.array(
+            (
+                v["BML"] * math.sin(math.radians(trim)),
+                -v["BMT"] * math.sin(math.radians(heel)),
+                z,
+            )
+        )
+
+        return {
+            "cob": cob,
+            "cob_global": cob_global,
+            "BMT": v["BMT"],
+            "BML": v["BML"],
+            "COFX": v["COFX"],
+            "COFY": v["COFY"],
+            "Awl": v["Awl"],
+            "displacement": v["displacement"],
+            "waterline": -(cob[2] + z),
+        }
+
+
+def combine(props: list, g, rho_water) -> dict:
+    """Combines the table results (HydrostaticsTable.at) of several buoyancy nodes on the same parent into the
+    result of marine.calculate_linearized_buoyancy_props"""
+    displacement = sum(p["displacement"] for p in props)
+    Awl = sum(p["Awl"] for p in props)
+
+    cob = sum(p["cob"] * p["displacement"] for p in props) / displacement
+    cob_global = sum(p["cob_global"] * p["displacement"] for p in props) / displacement
+
+    COFX = sum(p["COFX"] * p["Awl"] for p in props) / Awl
+    COFY = sum(p["COFY"] * p["Awl"] for p in props) / Awl
+
+    # waterplane inertia of each shape about its own center of floatation is BM * displacement,
+    # move to the combined center of floatation (parallel axis)
+    IT = sum(p["BMT"] * p["displacement"] + p["Awl"] * (p["COFY"] - COFY) ** 2 for p in props)
+    IL = sum(p["BML"] * p["displacement"] + p["Awl"] * (p["COFX"] - COFX) ** 2 for p in props)
+
+    return {
+        "cob": cob,
+        "BMT": IT / displacement,
+        "BML": IL / displacement,
+        "COFX": COFX,
+        "COFY": COFY,
+        "kHeave": Awl * g * rho_water,
+        "Awl": Awl,
+        "displacement_kN": displacement * g * rho_water,
+        "displacement": displacement,
+        "waterline": -cob_global[2],
+    }
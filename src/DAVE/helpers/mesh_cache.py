@@ -0,0 +1,170 @@
+"""Cache of loaded mesh files, shared by all trimeshes in the process.
+
+Loading an .obj or .stl file into a trimesh (TriMeshSource.load_file) means reading the file, cleaning and triangulating
+it using vtk, transforming it and checking its shape. The same file is often loaded many times with identical
+settings: many nodes using the same mesh, re-loading after a change of parent, throw-away scenes in calculations, etc.
+
+The cache stores the result of loading a file: the triangles (vertices and faces) and the results of check_shape.
+Entries are identified by the resolved file-name, the modification time and size of the file and the scale,
+rotation, offset and invert_normals settings.
+
+- The most recently used entries are kept in memory, the number of entries is limited to
+  settings.MESH_CACHE_MAX_ENTRIES
+- If settings.MESH_CACHE_DISK_PATH is set then entries are also stored as .npz files in that folder so later sessions
+  can skip vtk altogether.
+"""
+import hashlib
+import json
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+import DAVE.settings as ds
+
+_DISK_FORMAT_VERSION = 1
+
+
+@dataclass
+class MeshCacheEntry:
+    vertices: np.ndarray
+    """(N,3) float"""
+    faces: np.ndarray
+    """(M,3) int"""
+    messages: list
+    """as returned by check_shape"""
+    boundary_edges: list
+    """list of (vertex, vertex)"""
+    non_manifold_edges: list
+    """list of (vertex, vertex)"""
+    volume: float
+
+
+_entries = OrderedDict()
+"""key -> MeshCacheEntry, least recently used first"""
+
+_stats = dict(hits=0, disk_hits=0, misses=0)
+
+
+def _as_floats(values, default) -> tuple:
+    if values is None:
+        values = default
+    return tuple(float(v) for v in values)
+
+
+def mesh_key(filename, offset, rotation, scale, invert_normals) -> tuple:
+    """Key of a mesh loaded from filename with the given settings"""
+    path = Path(filename).resolve()
+    stat = path.stat()
+    return (
+        str(path),
+        stat.st_mtime_ns,
+        stat.st_size,
+        _as_floats(scale, (1, 1, 1)),
+        _as_floats(rotation, (0, 0, 0)),
+        _as_floats(offset, (0, 0, 0)),
+        bool(invert_normals),
+    )
+
+
+def _disk_file(key) -> Path or None:
+    if ds.MESH_CACHE_DISK_PATH is None:
+        return None
+    digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+    return Path(ds.MESH_CACHE_DISK_PATH) / f"{digest}.npz"
+
+
+def _edges_to_array(edges) -> np.ndarray:
+    return np.array(edges, dtype=float).reshape((-1, 2, 3))
+
+
+def _array_to_edges(array) -> list:
+    return [(tuple(e[0]), tuple(e[1])) for e in array.tolist()]
+
+
+def _write_to_disk(file: Path, entry: MeshCacheEntry):
+    header = dict(version=_DISK_FORMAT_VERSION, messages=entry.messages, volume=entry.volume)
+    file.parent.mkdir(parents=True, exist_ok=True)
+    with open(file, "wb") as f:  # np.savez would append .npz to the filename
+        np.savez(
+            f,
+            header=np.frombuffer(json.dumps(header).encode("utf-8"), dtype=np.uint8),
+            vertices=entry.vertices,
+            faces=entry.faces,
+            boundary_edges=_edges_to_array(entry.boundary_edges),
+            non_manifold_edges=_edges_to_array(entry.non_manifold_edges),
+        )
+
+
+def _read_from_disk(file: Path) -> MeshCacheEntry or None:
+    try:
+        with np.load(file, allow_pickle=False) as data:
+            header = json.loads(data["header"].tobytes().decode("utf-8"))
+            if header["version"] != _DISK_FORMAT_VERSION:
+                return None
+            return MeshCacheEntry(
+                vertices=data["vertices"],
+                faces=data["faces"],
+                messages=header["messages"],
+                boundary_edges=_array_to_edges(data["boundary_edges"]),
+                non_manifold_edges=_array_to_edges(data["non_manifold_edges"]),
+                volume=header["volume"],
+            )
+    except (OSError, KeyError, ValueError):
+        return None  # damaged or incompatible file, treat as miss
+
+
+def get(key) -> MeshCacheEntry or None:
+    """Returns the cached entry for key or None"""
+    entry = _entries.get(key, None)
+    if entry is not None:
+        _entries.move_to_end(key)
+        _stats["hits"] += 1
+        return entry
+
+    file = _disk_file(key)
+    if file is not None and file.exists():
+        entry = _read_from_disk(file)
+        if entry is not None:
+            _stats["disk_hits"] += 1
+            _store_in_memory(key, entry)
+            return entry
+
+    _stats["misses"] += 1
+    return None
+
+
+def _store_in_memory(key, entry: MeshCacheEntry):
+    _entries[key] = entry
+    _entries.move_to_end(key)
+    while len(_entries) > max(ds.MESH_CACHE_MAX_ENTRIES, 0):
+        _entries.popitem(last=False)
+
+
+def put(key, entry: MeshCacheEntry):
+    """Stores entry in the cache (memory and, if enabled, disk)"""
+    _store_in_memory(key, entry)
+
+    file = _disk_file(key)
+    if file is not None:
+        try:
+            _write_to_disk(file, entry)
+        except OSError:
+            pass  # the disk cache is optional
+
+
+def clear_mesh_cache(disk=False):
+    """Drops all entries from memory and, if disk is True, the .npz files from the disk cache folder"""
+    _entries.clear()
+    for key in _stats:
+        _stats[key] = 0
+
+    if disk and ds.MESH_CACHE_DISK_PATH is not None:
+        for file in Path(ds.MESH_CACHE_DISK_PATH).glob("*.npz"):
+            file.unlink()
+
+
+def mesh_cache_stats() -> dict:
+    """Number of hits (memory), disk-hits, misses and entries in memory"""
+    return dict(**_stats, entries=len(_entries))
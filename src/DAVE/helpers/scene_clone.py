@@ -0,0 +1,684 @@
+"""Native (structural) copying of scenes.
+
+Scene.copy used to export the complete scene to python code and then execute that code in a new scene.
+That works for every node-type but spends most of its time on formatting, parsing and exec-ing the code and on
+re-loading mesh files from disk.
+
+Copying is done in two steps:
+
+1. describe_scene : every node is described by a record containing the name of the Scene.new_xxx function to
+   call, the keyword arguments for that call and the properties to set afterwards. Trimeshes are described by their
+   vertices and faces instead of the file that they were loaded from.
+2. build_scene : the records are used to re-create the nodes in another scene.
+
+The description only contains plain values (numbers, strings, tuples, enums) and numpy arrays for the mesh data
+so it can also be written to disk. See DAVE.io.snapshot.
+
+Node-types for which no describer is registered (for example plugin nodes or nodes that are also managers) are
+described by their own python code, so the result is always identical to a code-based copy.
+
+The describers duplicate the properties that give_python_code exports. Values are copied at full precision whereas
+the python code rounds most of them to 6 significant digits. tests/test_scene/test_scene_copy.py copies a scene
+for every node-type in both ways and compares the code exported from the copies, so a property that is missing in
+a describer shows up there.
+
+Plugins may register a describer for their own node-types:
+
+    NODE_DESCRIBERS[MyNode] = my_describe_function  # signature: my_describe_function(node) -> record
+
+"""
+from copy import deepcopy
+from typing import Callable
+
+import numpy as np
+
+import DAVE.settings as ds
+from ..nds.core import (
+    DEFAULT_WINDING_ANGLE,
+    RigidBody,
+    Force,
+    WindArea,
+    CurrentArea,
+    ContactBall,
+    SPMT,
+    HydSpring,
+    ContactMesh,
+    Buoyancy,
+    Tank,
+    Cable,
+    LC6d,
+    Connector2d,
+    Beam,
+    SupportPoint,
+)
+from ..nds.enums import AreaKind
+from ..nds.geometry import Frame, Point, Circle
+from ..nds.pure import Visual
+from ..nds.trimesh import TriMeshSource
+
+
+def _parent_name(node):
+    parent = node.parent_for_export
+    if parent is None:
+        return None
+    return parent.name
+
+
+def _record(node, new, kwargs, set=None, trimesh=None, update=False):
+    """Creates a node record.
+
+    Args:
+        node: node that is described
+        new: name of the Scene method that creates the node, eg "new_frame"
+        kwargs: keyword arguments for that method (excluding name)
+        set: list of (property, value) that are set after creation (and after loading the trimesh)
+        trimesh: trimesh description (see describe_trimesh) or None
+        update: call node.update() after loading the trimesh
+    """
+    return dict(
+        type=type(node).__name__,
+        name=node.name,
+        new=new,
+        kwargs=kwargs,
+        set=set or [],
+        trimesh=trimesh,
+        update=update,
+    )
+
+
+def _footprint(node) -> list:
+    if node.footprint:
+        return [("footprint", node.footprint)]
+    return []
+
+
+def describe_trimesh(trimesh: TriMeshSource) -> dict:
+    """Describes a trimesh by reference. The mesh-data is read from the core when building, so no copy is made
+    here. Use trimesh_arrays to obtain the vertices and faces as numpy arrays."""
+    return dict(
+        source=trimesh,
+        path=trimesh._path,
+        scale=trimesh._scale,
+        rotation=trimesh._rotation,
+        offset=trimesh._offset,
+        invert_normals=trimesh._invert_normals,
+        messages=list(trimesh.messages),
+        boundary_edges=list(trimesh.boundary_edges),
+        non_manifold_edges=list(trimesh.non_manifold_edges),
+    )
+
+
+def trimesh_arrays(trimesh: TriMeshSource) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the vertices (n,3) [float] and faces (m,3) [int] of the trimesh"""
+    return np.array(trimesh.vertices, dtype=float), np.array(
+        trimesh.faces, dtype=np.int32
+    )
+
+
+def load_trimesh(target: TriMeshSource, description: dict):
+    """Fills trimesh target from a trimesh description"""
+    source = description.get("source", None)
+    if source is not None:
+        target._load_arrays(source.vertices, source.faces)
+    else:
+        target._load_arrays(description["vertices"], description["faces"])
+
+    target._path = description["path"]
+    target._scale = description["scale"]
+    target._rotation = description["rotation"]
+    target._offset = description["offset"]
+    target._invert_normals = description["invert_normals"]
+
+    target.messages = list(description["messages"])
+    target.boundary_edges = list(description["boundary_edges"])
+    target.non_manifold_edges = list(description["non_manifold_edges"])
+
+    target._new_mesh = True
+    target._version += 1
+
+
+# ========= describers per node-type
+
+
+def _describe_frame(node: Frame):
+    inertia = node.inertia if node.inertia > 0 else None
+    radii = node.inertia_radii if np.any(node.inertia_radii) else None
+    if inertia is None:
+        radii = None  # same as exported code, radii can not be set without inertia
+
+    return _record(
+        node,
+        "new_frame",
+        dict(
+            parent=_parent_name(node),
+            position=node.position,
+            rotation=node.rotation,
+            inertia=inertia,
+            inertia_radii=radii,
+            fixed=tuple(node.fixed),
+        ),
+        set=_footprint(node),
+    )
+
+
+def _describe_rigidbody(node: RigidBody):
+    radii = node.inertia_radii if np.any(node.inertia_radii) else None
+    return _record(
+        node,
+        "new_rigidbody",
+        dict(
+            mass=node.mass,
+            cog=node.cog,
+            parent=_parent_name(node),
+            position=node.position,
+            rotation=node.rotation,
+            inertia_radii=radii,
+            fixed=tuple(node.fixed),
+        ),
+        set=_footprint(node),
+    )
+
+
+def _describe_point(node: Point):
+    return _record(
+        node,
+        "new_point",
+        dict(parent=_parent_name(node), position=node.position),
+        set=_footprint(node),
+    )
+
+
+def _describe_circle(node: Circle):
+    props = []
+    if node.draw_start != -1:
+        props.append(("draw_start", node.draw_start))
+    if node.draw_stop != 1:
+        props.append(("draw_stop", node.draw_stop))
+
+    return _record(
+        node,
+        "new_circle",
+        dict(
+            parent=_parent_name(node),
+            axis=node.axis,
+            radius=node.radius,
+            roundbar=node.is_roundbar,
+        ),
+        set=props,
+    )
+
+
+def _describe_force(node: Force):
+    return _record(
+        node,
+        "new_force",
+        dict(
+            parent=_parent_name(node),
+            local=not node.is_global,
+            force=node.force,
+            moment=node.moment,
+        ),
+    )
+
+
+def _describe_area(node):
+    kwargs = dict(
+        parent=_parent_name(node),
+        A=node.A,
+        Cd=node.Cd,
+        areakind=node.areakind,
+    )
+    if node.areakind != AreaKind.SPHERE:
+        kwargs["direction"] = node.direction
+
+    if isinstance(node, WindArea):
+        return _record(node, "new_windarea", kwargs)
+    else:
+        return _record(node, "new_currentarea", kwargs)
+
+
+def _describe_contactball(node: ContactBall):
+    return _record(
+        node,
+        "new_contactball",
+        dict(
+            parent=_parent_name(node),
+            radius=node.radius,
+            k=node.k,
+            meshes=[m.name for m in node._meshes],
+        ),
+    )
+
+
+def _describe_spmt(node: SPMT):
+    return _record(
+        node,
+        "new_spmt",
+        dict(
+            parent=_parent_name(node),
+            reference_force=node.reference_force,
+            reference_extension=node.reference_extension,
+            k=node.k,
+            spacing_length=node.spacing_length,
+            spacing_width=node.spacing_width,
+            n_length=node.n_length,
+            n_width=node.n_width,
+            meshes=[m.name for m in node._meshes] if node._meshes else None,
+        ),
+    )
+
+
+def _describe_hydspring(node: HydSpring):
+    return _record(
+        node,
+        "new_hydspring",
+        dict(
+            parent=_parent_name(node),
+            cob=node.cob,
+            BMT=node.BMT,
+            BML=node.BML,
+            COFX=node.COFX,
+            COFY=node.COFY,
+            kHeave=node.kHeave,
+            waterline=node.waterline,
+            displacement_kN=node.displacement_kN,
+        ),
+    )
+
+
+def _describe_contactmesh(node: ContactMesh):
+    return _record(
+        node,
+        "new_contactmesh",
+        dict(parent=_parent_name(node)),
+        trimesh=describe_trimesh(node.trimesh),
+    )
+
+
+def _describe_buoyancy(node: Buoyancy):
+    return _record(
+        node,
+        "new_buoyancy",
+        dict(parent=_parent_name(node)),
+        trimesh=describe_trimesh(node.trimesh),
+        update=True,
+    )
+
+
+def _describe_tank(node: Tank):
+    return _record(
+        node,
+        "new_tank",
+        dict(
+            parent=_parent_name(node),
+            density=node.density,
+            free_flooding=node.free_flooding,
+        ),
+        set=[("volume", node.volume)],  # first load mesh, then set volume
+        trimesh=describe_trimesh(node.trimesh),
+        update=True,
+    )
+
+
+def _describe_cable(node: Cable):
+    poi_names = node._give_poi_names()
+
+    props = []
+    if np.any(node.reversed):
+        props.append(("reversed", node.reversed))
+
+    if np.any([_ != DEFAULT_WINDING_ANGLE for _ in node._max_winding_angle]):
+        props.append(("max_winding_angles", node._max_winding_angle))
+
+    if np.any([_ != 0 for _ in node._offsets]):
+        props.append(("offsets", node._offsets))
+
+    if np.any(node._friction):
+        props.append(("friction", node._friction))
+
+    if node._vfNode.explicit_cable_no_loop:
+        props.append(("_set_no_loop", None))  # method, see build_node
+
+    return _record(
+        node,
+        "new_cable",
+        dict(
+            endA=poi_names[0],
+            endB=poi_names[-1],
+            sheaves=poi_names[1:-1] if len(poi_names) > 2 else None,
+            length=node.length,
+            mass_per_length=node.mass_per_length,
+            diameter=node.diameter,
+            EA=node.EA,
+        ),
+        set=props,
+    )
+
+
+def _describe_lc6d(node: LC6d):
+    return _record(
+        node,
+        "new_linear_connector_6d",
+        dict(
+            main=node.main.name,
+            secondary=node.secondary.name,
+            stiffness=node.stiffness,
+        ),
+    )
+
+
+def _describe_connector2d(node: Connector2d):
+    return _record(
+        node,
+        "new_connector2d",
+        dict(
+            nodeA=node.nodeA.name,
+            nodeB=node.nodeB.name,
+            k_linear=node.k_linear,
+            k_angular=node.k_angular,
+        ),
+    )
+
+
+def _describe_beam(node: Beam):
+    return _record(
+        node,
+        "new_beam",
+        dict(
+            nodeA=node.nodeA.name,
+            nodeB=node.nodeB.name,
+            n_segments=node.n_segments,
+            tension_only=node.tension_only,
+            EIy=node.EIy,
+            EIz=node.EIz,
+            GIp=node.GIp,
+            EA=node.EA,
+            mass=node.mass,
+            L=node.L,
+        ),
+    )
+
+
+def _describe_supportpoint(node: SupportPoint):
+    return _record(
+        node,
+        "new_supportpoint",
+        dict(
+            frame=node.frame.name,
+            point=node.point.name,
+            kz=node.kz,
+            kx=node.kx,
+            ky=node.ky,
+            delta_z=node.delta_z,
+        ),
+    )
+
+
+def _describe_visual(node: Visual):
+    return _record(
+        node,
+        "new_visual",
+        dict(
+            path=node.path,
+            parent=node.parent.name if node.parent is not None else None,
+            offset=node.offset,
+            rotation=node.rotation,
+            scale=node.scale,
+        ),
+        set=[("visual_outline", node.visual_outline)],
+    )
+
+
+def _describe_using_code(node):
+    return dict(type=type(node).__name__, name=node.name, code=node.give_python_code())
+
+
+NODE_DESCRIBERS: dict[type, Callable] = {
+    Frame: _describe_frame,
+    RigidBody: _describe_rigidbody,
+    Point: _describe_point,
+    Circle: _describe_circle,
+    Force: _describe_force,
+    WindArea: _describe_area,
+    CurrentArea: _describe_area,
+    ContactBall: _describe_contactball,
+    SPMT: _describe_spmt,
+    HydSpring: _describe_hydspring,
+    ContactMesh: _describe_contactmesh,
+    Buoyancy: _describe_buoyancy,
+    Tank: _describe_tank,
+    Cable: _describe_cable,
+    LC6d: _describe_lc6d,
+    Connector2d: _describe_connector2d,
+    Beam: _describe_beam,
+    SupportPoint: _describe_supportpoint,
+    Visual: _describe_visual,
+}
+"""Describer functions per node-type. Looked-up using the exact type of the node so derived classes
+(which may add properties) fall back to their own python code unless they are registered explicitly.
+When adding a property to the exported code of one of these node-types, add it to its describer as well."""
+
+
+def describe_node(node) -> dict:
+    describer = NODE_DESCRIBERS.get(type(node), _describe_using_code)
+    return describer(node)
+
+
+def build_node(s, record: dict):
+    """Creates a node in scene s from a node record"""
+
+    if "code" in record:
+        s.run_code(record["code"])
+        return s[record["name"]]
+
+    new_node = getattr(s, record["new"])(name=record["name"], **record["kwargs"])
+
+    if record["trimesh"] is not None:
+        load_trimesh(new_node.trimesh, record["trimesh"])
+        if record["update"]:
+            new_node.update()
+
+    for prop, value in record["set"]:
+        if prop == "_set_no_loop":
+            new_node._set_no_loop()
+        else:
+            setattr(new_node, prop, value)
+
+    return new_node
+
+
+# ========= scene level
+
+
+def _is_created_by_a_manager(node) -> bool:
+    """Same logic as used in Scene.give_python_code"""
+    manager = node._manager
+    while manager is not None:
+        if manager.creates(node):
+            return True
+        manager = manager._manager
+    return False
+
+
+def describe_scene(
+    source,
+    nodes=None,
+    quick=False,
+    do_reports=True,
+    do_timeline=True,
+    export_environment_settings=True,
+) -> dict:
+    """Describes the nodes and settings of scene 'source'. This is the native equivalent of source.give_python_code(...)
+
+    Args:
+        source: Scene to be described
+        nodes [None] : describe only these nodes
+        quick [False] : describe only the nodes and settings, not the visibility, limits, tags, reports etc.
+        do_reports [True] : include reports
+        do_timeline [True] : include timelines
+        export_environment_settings [True] : include the environment (wind, gravity, etc)
+    """
+
+    source.sort_nodes_by_dependency()
+
+    if nodes is None:
+        nodes_to_be_described = source._nodes
+    else:
+        nodes_to_be_described = [node for node in source._nodes if node in nodes]
+
+    d = dict()
+
+    if export_environment_settings:
+        d["environment"] = {
+            prop: getattr(source, prop) for prop in ds.ENVIRONMENT_PROPERTIES
+        }
+    else:
+        d["environment"] = dict()
+    d["solver_settings"] = {
+        prop: getattr(source.solver_settings, prop)
+        for prop in source.solver_settings.non_default_props()
+    }
+
+    d["nodes"] = [
+        describe_node(node)
+        for node in nodes_to_be_described
+        if not _is_created_by_a_manager(node)
+    ]
+
+    d["quick"] = quick
+
+    if not quick:
+        d["invisible"] = [node.name for node in nodes_to_be_described if not node.visible]
+
+        # Limits, for managed nodes only the additional or overridden ones
+        limits = dict()
+        for node in nodes_to_be_described:
+            if node.manager is None:
+                if node.limits:
+                    limits[node.name] = dict(node.limits)
+            else:
+                lbm = getattr(node, "_limits_by_manager", None)
+                if lbm is None:
+                    continue
+                changed = {
+                    key: value
+                    for key, value in node.limits.items()
+                    if key not in lbm or value != lbm[key]
+                }
+                if changed:
+                    limits[node.name] = changed
+        d["limits"] = limits
+
+        d["watches"] = {
+            node.name: sorted(node._watches)
+            for node in nodes_to_be_described
+            if node._watches
+        }
+        d["tags"] = {
+            node.name: sorted(node.tags) for node in nodes_to_be_described if node.tags
+        }
+        d["colors"] = {
+            node.name: node.color
+            for node in nodes_to_be_described
+            if node.color is not None
+        }
+
+        d["unmanaged_property_values"] = {
+            node.name: node.unmanaged_property_values()
+            for node in source._nodes
+            if node.manager is not None and node.unmanaged_property_values()
+        }
+
+        # Reports, timelines and rao-requests live in plugins, describe those using their code
+        extras = []
+        if source.reports and do_reports:
+            for r in source.reports:
+                yml = r.to_yml()
+                extras.append(f'report_contents = r"""\n{yml}"""')
+                extras.append("s.reports.append(Report(s,yml=report_contents))")
+        if source.t and do_timeline:
+            extras.extend(source.t.give_python_code())
+        if source.rao_requests:
+            extras.extend(source.rao_requests.give_python_code())
+        d["extras_code"] = "\n".join(extras)
+
+    # Solved state of managed DOFs nodes
+    _modes = ("x", "y", "z", "rx", "ry", "rz")
+    dofs = []
+    for node in source.nodes_of_type(Frame):
+        if node.manager is not None:
+            values = [*node.position, *node.rotation]
+            for i, f in enumerate(node.fixed):
+                if f is False:
+                    dofs.append((node.name, _modes[i], values[i]))
+    d["solved_dofs"] = dofs
+
+    d["exposed"] = deepcopy(getattr(source, "exposed", []))
+
+    return d
+
+
+def build_scene(target, d: dict):
+    """Re-creates the nodes and settings of a scene description (see describe_scene) in scene 'target'"""
+
+    for prop, value in d["environment"].items():
+        setattr(target, prop, value)
+
+    for prop, value in d["solver_settings"].items():
+        setattr(target.solver_settings, prop, value)
+
+    for record in d["nodes"]:
+        build_node(target, record)
+
+    target.update()
+
+    if not d["quick"]:
+        for name in d["invisible"]:
+            target[name]._visible = False
+
+        for name, limits in d["limits"].items():
+            target[name].limits.update(limits)
+
+        for name, watches in d["watches"].items():
+            for w in watches:
+                target.try_add_watch(name, w)
+
+        for name, tags in d["tags"].items():
+            target._try_add_tags(name, tags)
+
+        for name, color in d["colors"].items():
+            target._try_add_color(name, color)
+
+        for name, pv in d["unmanaged_property_values"].items():
+            try:
+                node = target[name]
+                for p, v in pv:
+                    setattr(node, p, v)
+            except:
+                pass  # same as code-based import
+
+        if d["extras_code"]:
+            target.run_code(d["extras_code"])
+
+    for name, mode, value in d["solved_dofs"]:
+        try:
+            setattr(target[name], mode, value)
+        except:
+            pass  # some nodes or dofs may not be present anymore (eg changed components)
+
+    if d["exposed"]:
+        target.exposed = list(d["exposed"])
+
+
+def clone_into(source, target, nodes=None, quick=False):
+    """Re-creates the nodes and settings of scene 'source' in scene 'target'.
+
+    This is the native equivalent of target.run_code(source.give_python_code(...)).
+
+    Args:
+        source: Scene to be copied
+        target: Scene to copy into, typically empty
+        nodes [None] : copy only these nodes
+        quick [False] : copy only the nodes and settings, not the visibility, limits, tags, reports etc.
+    """
+    build_scene(target, describe_scene(source, nodes=nodes, quick=quick))
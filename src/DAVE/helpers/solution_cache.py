@@ -0,0 +1,177 @@
+"""Cache of recently solved equilibria, used to warm-start the static solver.
+
+Every solve_statics starts from the current DOFs. After changing the model the previous equilibrium is not always
+a good starting point, and after the layout of the DOFs changed it can not be used at all.
+
+The cache stores solved DOFs together with
+
+- the DOF signature of the model: the names of the elements and the modes of the DOFs (get_dof_elements and
+  get_dof_modes). Stored DOFs can only be re-used if the signature matches.
+- a hash of the non-state properties of the model (everything except the solved values), see property_hash.
+- optionally a continuation parameter: a single value that is being stepped by the caller (for example a heel angle)
+
+When a solve is started the cache picks a starting point:
+
+1. a stored solution of the exact same model (same signature and same property-hash) -> hit
+2. if a continuation parameter is set: the solutions with the same signature nearest to the parameter are
+   inter- or extrapolated linearly -> continuation
+3. nothing -> miss, the solver starts from the current DOFs as usual
+
+Example:
+    s.solution_cache = SolutionCache()
+    for x in np.linspace(0, 30, 31):
+        s['heel'].rx = x
+        s.solution_cache.parameter = x
+        s.solve_statics()
+    print(s.solution_cache.stats)
+"""
+import hashlib
+import re
+
+import numpy as np
+
+_solved_pattern = re.compile(r"solved\([^)]*\)")
+
+
+def dof_signature(scene) -> tuple:
+    """Names of the elements and modes of all DOFs of the scene"""
+    elements = tuple(e.name for e in scene._vfc.get_dof_elements())
+    modes = tuple(int(m) for m in scene._vfc.get_dof_modes())
+    return elements, modes
+
+
+def _node_code(node) -> str:
+    """Python code of node with the solved values removed.
+
+    The code is cached on the node and only re-generated when the node was changed using an observable property
+    setter (Node._version, see node_setter_observable), when it was renamed or when its mesh was changed. Setters that
+    change the model shall therefore be decorated with node_setter_observable."""
+    trimesh = getattr(node, "_trimesh", None)
+    key = (node._version, node.name, None if trimesh is None else trimesh._version)
+
+    cached = getattr(node, "_code_for_hash", None)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    code = _solved_pattern.sub("solved", node.give_python_code())
+    node._code_for_hash = (key, code)
+    return code
+
+
+def property_hash(scene) -> str:
+    """Hash of all non-state properties of the scene.
+
+    Obtained from the environment settings, the non-default solver settings and the python code of the nodes with the
+    solved values removed. The code of a node is only re-generated when the node changed, so this is cheap compared to
+    exporting the scene. Changes that are not made through a property setter (for example ballast_system.tanks.append)
+    are not detected.
+    """
+    import DAVE.settings as ds
+
+    parts = [f"{prop}={getattr(scene, prop)}" for prop in ds.ENVIRONMENT_PROPERTIES]
+    for prop in scene.solver_settings.non_default_props():
+        parts.append(f"solver_settings.{prop}={getattr(scene.solver_settings, prop)}")
+
+    store = scene._export_code_with_solved_function
+    scene._export_code_with_solved_function = True
+    try:
+        parts.extend(_node_code(node) for node in scene._nodes)
+    finally:
+        scene._export_code_with_solved_function = store
+
+    return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+class SolutionCache:
+    def __init__(self, max_entries=32):
+        self.max_entries = max_entries
+        """Maximum number of stored solutions, the oldest are dropped first"""
+
+        self.parameter: float or None = None
+        """Value of the continuation parameter (if any). Set this before solving when stepping a single parameter"""
+
+        self._entries = []
+        """list of (signature, property-hash, parameter, dofs), most recent last"""
+
+        self.hits = 0
+        self.continuations = 0
+        self.misses = 0
+
+    def clear(self):
+        self._entries.clear()
+        self.parameter = None
+        self.hits = 0
+        self.continuations = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def stats(self) -> dict:
+        """Hit/miss statistics"""
+        return dict(
+            hits=self.hits,
+            continuations=self.continuations,
+            misses=self.misses,
+            entries=len(self._entries),
+        )
+
+    def store(self, scene):
+        """Stores the current DOFs of the scene, typically called after a successful solve"""
+        signature = dof_signature(scene)
+        if self.parameter is None:
+            phash = property_hash(scene)
+        else:
+            phash = None  # continuation entries are found using the parameter
+        dofs = np.array(scene._vfc.get_dofs(), dtype=float)
+
+        # replace existing entry of the same model
+        self._entries = [
+            e
+            for e in self._entries
+            if not (e[0] == signature and e[1] == phash and e[2] == self.parameter)
+        ]
+
+        self._entries.append((signature, phash, self.parameter, dofs))
+
+        if len(self._entries) > self.max_entries:
+            self._entries.pop(0)
+
+    def give_start(self, scene) -> np.ndarray or None:
+        """Returns the best known starting point for solving the scene, or None. Updates the statistics."""
+        signature = dof_signature(scene)
+        candidates = [e for e in self._entries if e[0] == signature]
+
+        if candidates and self.parameter is None:
+            phash = property_hash(scene)
+            for e in reversed(candidates):
+                if e[1] == phash:
+                    self.hits += 1
+                    return e[3]
+
+        if candidates and self.parameter is not None:
+            with_parameter = [e for e in candidates if e[2] is not None]
+            if with_parameter:
+                with_parameter.sort(key=lambda e: abs(e[2] - self.parameter))
+                if len(with_parameter) == 1 or with_parameter[0][2] == self.parameter:
+                    self.continuations += 1
+                    return with_parameter[0][3]
+
+                (_, _, p1, d1), (_, _, p2, d2) = with_parameter[:2]
+                if p1 != p2:
+                    self.continuations += 1
+                    return d1 + (d2 - d1) * (self.parameter - p1) / (p2 - p1)
+
+        self.misses += 1
+        return None
+
+    def warm_start(self, scene) -> bool:
+        """Sets the DOFs of the scene to the best known starting point. Returns True if a starting point was found"""
+        dofs = self.give_start(scene)
+        if dofs is None:
+            return False
+
+        scene._vfc.set_dofs(dofs)
+        scene._vfc.state_update()
+        return True
@@ -0,0 +1,155 @@
+"""Telemetry of a static solve.
+
+A SolveReport is created by every call to Scene.solve_statics (and solve_statics_async) and stored
+as scene.last_solve_report.
+
+It records:
+
+- wall-time per phase:
+    - "linear" : background solver running its linear phase (BackgroundSolver.RunningLinear)
+    - "nonlinear" : background solver running any of the non-linear phases (local/newton/global/deterministic)
+    - "update" : time spent in Scene.update (including verify_equilibrium)
+    - "geometric_contacts" : time spent checking and re-orienting geometric contacts
+- the number of background solver runs and geometric-contact re-orientation rounds
+- the residual history (error norm and max-abs error) as sampled while the background solver was running
+
+The background solver does not expose its internal iteration count; instead the residual history is sampled
+while polling the solver (at most every history_interval seconds), the number of samples is reported as n_samples.
+
+Example:
+    s.solve_statics()
+    print(s.last_solve_report)
+    s.last_solve_report.to_json("solve.json")
+"""
+import json
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+
+
+@dataclass
+class SolveReport:
+    converged: bool = False
+    terminated: bool = False
+
+    total_time: float = 0.0
+    """Wall-time of the complete solve [s]"""
+
+    phase_times: dict = field(
+        default_factory=lambda: dict(
+            linear=0.0, nonlinear=0.0, update=0.0, geometric_contacts=0.0
+        )
+    )
+    """Wall-time per phase [s]"""
+
+    n_dofs: int = 0
+    n_solver_runs: int = 0
+    n_geometric_contact_rounds: int = 0
+    n_update_calls: int = 0
+
+    residual_history: list = field(default_factory=list)
+    """List of (time since start [s], phase, Enorm, Emaxabs)"""
+
+    Enorm: float or None = None
+    Emaxabs: float or None = None
+    Emaxabs_where: str = ""
+
+    history_interval: float = 0.005
+    """Minimum time between two entries in the residual history [s]"""
+
+    def __post_init__(self):
+        self._t0 = time.perf_counter()
+        self._last_sample = None
+        self._last_history = None
+
+    @property
+    def n_samples(self) -> int:
+        return len(self.residual_history)
+
+    @contextmanager
+    def phase(self, name):
+        """Adds the time spent in the context to the given phase"""
+        tic = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_times[name] = self.phase_times.get(name, 0.0) + (
+                time.perf_counter() - tic
+            )
+            if name == "update":
+                self.n_update_calls += 1
+
+    def solver_started(self):
+        self.n_solver_runs += 1
+        self._last_sample = time.perf_counter()
+
+    def sample(self, background_solver):
+        """Records the state of a running background solver and adds the time since the previous sample to the
+        phase that the solver is in"""
+        now = time.perf_counter()
+
+        if background_solver.RunningLinear:
+            phase = "linear"
+        else:
+            phase = "nonlinear"
+
+        if self._last_sample is not None:
+            self.phase_times[phase] += now - self._last_sample
+        self._last_sample = now
+
+        if (
+            self._last_history is not None
+            and now - self._last_history < self.history_interval
+        ):
+            return
+        self._last_history = now
+
+        self.residual_history.append(
+            (
+                now - self._t0,
+                phase,
+                float(background_solver.Enorm),
+                float(background_solver.Emaxabs),
+            )
+        )
+
+    def solver_finished(self, background_solver):
+        now = time.perf_counter()
+        if self._last_sample is not None:
+            self.phase_times["nonlinear"] += now - self._last_sample
+        self._last_sample = None
+
+        self.Enorm = float(background_solver.Enorm)
+        self.Emaxabs = float(background_solver.Emaxabs)
+        self.Emaxabs_where = str(background_solver.Emaxabs_where)
+
+    def finish(self):
+        self.total_time = time.perf_counter() - self._t0
+
+    def to_dict(self) -> dict:
+        d = asdict(self)
+        d["n_samples"] = self.n_samples
+        return d
+
+    def to_json(self, filename=None) -> str:
+        """Returns the report as json string. If a filename is given then the json is written to that file as well."""
+        js = json.dumps(self.to_dict(), indent=2)
+        if filename is not None:
+            Path(filename).write_text(js)
+        return js
+
+    def __str__(self):
+        lines = [
+            f"Solve {'converged' if self.converged else 'did not converge'} in {self.total_time:.3f}s ({self.n_dofs} dofs)"
+        ]
+        for name, t in self.phase_times.items():
+            lines.append(f"  {name:20s}: {t:.3f}s")
+        lines.append(
+            f"  solver runs: {self.n_solver_runs}, geometric contact rounds: {self.n_geometric_contact_rounds}, update calls: {self.n_update_calls}, samples: {self.n_samples}"
+        )
+        if self.Emaxabs is not None:
+            lines.append(
+                f"  final error: {self.Enorm:.6e}(norm) / {self.Emaxabs:.6e}(max-abs) in {self.Emaxabs_where}"
+            )
+        return "\n".join(lines)
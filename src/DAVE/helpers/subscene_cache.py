@@ -0,0 +1,76 @@
+"""Process-wide cache of the scenes loaded by components (HasSubScene).
+
+Models often contain many components that are loaded from the same file (shackles, hooks, etc). Loading a component
+means loading the file, which executes its python code and re-loads its meshes. With the cache the file is only loaded
+once, the loaded scene is kept as a template and every component gets a (native) copy of that template.
+
+Templates are keyed by the resolved file-name. A template is re-loaded when the modification time of its file, or of
+the file of any component inside the template, has changed.
+
+Example:
+    from DAVE.helpers.subscene_cache import subscene_cache_stats, clear_subscene_cache
+    print(subscene_cache_stats())
+"""
+from pathlib import Path
+
+_templates = dict()
+"""resolved file-name -> (template scene, tuple of (file-name, mtime) of all files that the template was loaded from)"""
+
+_stats = dict(hits=0, misses=0)
+
+
+def _mtime(filename):
+    try:
+        return Path(filename).stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _source_files(template, filename) -> tuple:
+    """(file-name, mtime) of the file of the template and of all components inside it"""
+    from DAVE.nds.mixins import HasSubScene
+
+    files = [str(filename)]
+    for node in template._nodes:
+        if isinstance(node, HasSubScene) and node.path:
+            try:
+                files.append(str(template.get_resource_path(node.path)))
+            except Exception:
+                pass  # unresolvable paths can not be monitored
+
+    return tuple((file, _mtime(file)) for file in files)
+
+
+def give_subscene(filename, resource_provider):
+    """Returns a new scene with the contents of filename.
+
+    The returned scene is a copy of the cached template and may be modified.
+    """
+    from DAVE.scene import Scene
+
+    key = str(Path(filename).resolve())
+
+    entry = _templates.get(key, None)
+    if entry is not None:
+        template, files = entry
+        if all(_mtime(file) == mtime for file, mtime in files):
+            _stats["hits"] += 1
+            return template.copy()
+
+    _stats["misses"] += 1
+    template = Scene(filename=filename, resource_provider=resource_provider)
+    _templates[key] = (template, _source_files(template, filename))
+
+    return template.copy()
+
+
+def clear_subscene_cache():
+    """Drops all cached templates"""
+    _templates.clear()
+    _stats["hits"] = 0
+    _stats["misses"] = 0
+
+
+def subscene_cache_stats() -> dict:
+    """Number of cache hits, misses and cached templates"""
+    return dict(**_stats, templates=len(_templates))
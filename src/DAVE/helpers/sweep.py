@@ -0,0 +1,290 @@
+"""Parameter sweeps: solve the statics of a scene for many combinations of property values.
+
+See Scene.sweep for the user interface.
+
+By default the cases are solved in this process. Optionally they are distributed over a pool of worker processes.
+Every worker builds its own copy of the scene from python code once (in the pool initializer) and then solves the
+cases that it receives one by one. Before solving a case the DOFs of the nearest (in normalized parameter space)
+already solved case of that worker are used as starting point. Cases are handed out in small contiguous batches so
+neighbouring cases typically end up in the same worker.
+
+The pool itself (run_in_workers, worker_scene) is also used for ballast plans, GZ curves and batch rendering.
+"""
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+import numpy as np
+
+_worker_scene = None
+"""Scene of this worker process, created by _init_worker"""
+
+_worker_solved = []
+"""List of (normalized parameters, dofs) of the cases solved by this worker"""
+
+
+def parameter_name(node_name, property_name) -> str:
+    """Column name used in the results of a sweep"""
+    return f"{node_name}.{property_name}"
+
+
+def give_cases(parameters: dict) -> list[tuple]:
+    """All combinations of the parameter values.
+
+    The combinations are ordered such that subsequent cases differ in only one parameter by one step (snake order),
+    which makes the previous case a good starting point for the next.
+    """
+    values = [list(v) for v in parameters.values()]
+
+    cases = [()]
+    for vals in values:
+        new_cases = []
+        for i, case in enumerate(cases):
+            ordered = vals if i % 2 == 0 else vals[::-1]
+            for v in ordered:
+                new_cases.append((*case, v))
+        cases = new_cases
+
+    return cases
+
+
+def _normalize(cases: np.ndarray) -> np.ndarray:
+    span = cases.max(axis=0) - cases.min(axis=0)
+    span[span == 0] = 1
+    return (cases - cases.min(axis=0)) / span
+
+
+def _init_worker(code, resource_provider, worker_setup=None):
+    global _worker_scene, _worker_solved
+    from DAVE.scene import Scene
+
+    _worker_scene = Scene(code=code, resource_provider=resource_provider)
+    _worker_solved = []
+
+    if worker_setup is not None:
+        worker_setup(_worker_scene)
+
+
+def worker_scene():
+    """The scene of this worker process, see run_in_workers"""
+    return _worker_scene
+
+
+def scene_code_for_workers(scene) -> str:
+    """Python code that re-creates scene in a worker process"""
+    store_export_code_with_solved_function = scene._export_code_with_solved_function
+    scene._export_code_with_solved_function = False  # solved() is not needed
+    try:
+        return scene.give_python_code()
+    finally:
+        scene._export_code_with_solved_function = store_export_code_with_solved_function
+
+
+def run_in_workers(
+    scene,
+    func,
+    jobs,
+    n_workers,
+    on_result,
+    n_items,
+    progress_text,
+    feedback_func=None,
+    do_terminate_func=None,
+    worker_setup=None,
+) -> int:
+    """Calls func(*args) for every args in jobs using a pool of n_workers worker processes.
+
+    Every worker builds its own copy of scene from python code once (in the pool initializer), func obtains it using
+    worker_scene(). If given, worker_setup(scene) is called in the worker after creating the scene; it needs to be
+    picklable (a module level function or a functools.partial of one).
+
+    on_result(job_index, result) is called in this process for every finished job and returns the number of items
+    (cases, stages, frames) that the job completed. After every finished job feedback_func is called with
+    progress_text.format(n_done, n_items). If do_terminate_func returns True then the pending jobs are cancelled.
+
+    Returns:
+        the number of completed items, less than n_items if terminated
+    """
+    code = scene_code_for_workers(scene)
+
+    n_done = 0
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        initializer=_init_worker,
+        initargs=(code, scene.resource_provider, worker_setup),
+    ) as pool:
+        futures = {pool.submit(func, *args): i for i, args in enumerate(jobs)}
+        pending = set(futures)
+
+        while pending:
+            done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                n_done += on_result(futures[future], future.result())
+
+            if done and feedback_func is not None:
+                feedback_func(progress_text.format(n_done, n_items))
+
+            if do_terminate_func is not None and do_terminate_func():
+                for future in pending:
+                    future.cancel()
+                break
+
+    return n_done
+
+
+def solve_case(
+    s, keys, values, normalized, evaluate, solved: list, do_terminate_func=None
+):
+    """Applies the parameter values to scene s, warm-starts from the nearest solved case and solves.
+
+    Args:
+        s: Scene
+        keys: list of (node-name, property-name)
+        values: values for each of the keys
+        normalized: normalized parameter values, used to find the nearest solved case
+        evaluate: list of (node-name, property-name) to be evaluated after solving
+        solved: list of (normalized, dofs) of previously solved cases; the current case is added if solved.
+        do_terminate_func: passed to the solver
+
+    Returns:
+        (converged, list of evaluated values)
+    """
+
+    for (node_name, prop), value in zip(keys, values):
+        setattr(s[node_name], prop, value)
+
+    s.update()
+
+    # warm start from the nearest solved neighbour
+    if solved:
+        distances = [np.linalg.norm(normalized - p) for p, _ in solved]
+        _, dofs = solved[int(np.argmin(distances))]
+        if len(dofs) == s._vfc.n_dofs():
+            s._vfc.set_dofs(dofs)
+
+    try:
+        converged = s._solve_statics_with_optional_control(
+            do_terminate_func=do_terminate_func
+        )
+    except ValueError:  # time-out or solver self-check failed
+        converged = False
+
+    if converged:
+        solved.append((normalized, s._vfc.get_dofs()))
+        results = [getattr(s[node_name], prop) for node_name, prop in evaluate]
+    else:
+        results = [np.nan for _ in evaluate]
+
+    return converged, results
+
+
+def _solve_batch(batch, keys, evaluate):
+    """Runs in a worker process, batch is a list of (index, values, normalized)"""
+    results = []
+    for index, values, normalized in batch:
+        converged, r = solve_case(
+            _worker_scene, keys, values, normalized, evaluate, _worker_solved
+        )
+        results.append((index, converged, r))
+    return results
+
+
+def run_sweep(
+    scene,
+    parameters: dict,
+    evaluate: list,
+    n_workers=1,
+    batch_size=None,
+    feedback_func=None,
+    do_terminate_func=None,
+):
+    """See Scene.sweep"""
+    import pandas as pd
+
+    keys = [tuple(k) for k in parameters.keys()]
+    evaluate = [tuple(e) for e in evaluate]
+
+    # check the input before starting the pool
+    for node_name, prop in (*keys, *evaluate):
+        node = scene[node_name]
+        if not hasattr(node, prop):
+            raise ValueError(f"Node {node_name} does not have a property {prop}")
+
+    cases = give_cases({k: v for k, v in zip(keys, parameters.values())})
+    n_cases = len(cases)
+    if n_cases == 0:
+        raise ValueError("No cases to sweep, supply at least one value per parameter")
+
+    normalized = _normalize(np.array(cases, dtype=float))
+
+    def give_feedback(txt):
+        if feedback_func is not None:
+            feedback_func(txt)
+
+    def should_terminate():
+        if do_terminate_func is not None:
+            return do_terminate_func()
+        else:
+            return False
+
+    converged = [False] * n_cases
+    results = [[np.nan] * len(evaluate) for _ in range(n_cases)]
+
+    if n_workers == 1:
+        # in-process on a copy
+        s = scene.copy()
+        solved = []
+        for i, case in enumerate(cases):
+            if should_terminate():
+                give_feedback(f"Sweep terminated after {i} of {n_cases} cases")
+                break
+            converged[i], results[i] = solve_case(
+                s, keys, case, normalized[i], evaluate, solved, do_terminate_func
+            )
+            give_feedback(f"Solved {i+1} of {n_cases} cases")
+
+    else:
+        if n_workers is None:
+            from os import cpu_count
+
+            n_workers = max(1, min(cpu_count() or 1, n_cases))
+
+        if batch_size is None:
+            batch_size = max(1, n_cases // (4 * n_workers))
+
+        batches = []
+        for start in range(0, n_cases, batch_size):
+            batches.append(
+                [
+                    (i, cases[i], normalized[i])
+                    for i in range(start, min(start + batch_size, n_cases))
+                ]
+            )
+
+        def on_result(job_index, batch_results):
+            for index, conv, r in batch_results:
+                converged[index] = conv
+                results[index] = r
+            return len(batch_results)
+
+        n_done = run_in_workers(
+            scene,
+            _solve_batch,
+            [(batch, keys, evaluate) for batch in batches],
+            n_workers,
+            on_result,
+            n_items=n_cases,
+            progress_text="Solved {} of {} cases",
+            feedback_func=feedback_func,
+            do_terminate_func=do_terminate_func,
+        )
+
+        if n_done < n_cases:
+            give_feedback(f"Sweep terminated after {n_done} of {n_cases} cases")
+
+    columns = [parameter_name(*k) for k in keys]
+    df = pd.DataFrame(cases, columns=columns)
+    df["converged"] = converged
+    for j, (node_name, prop) in enumerate(evaluate):
+        df[parameter_name(node_name, prop)] = [r[j] for r in results]
+
+    return df
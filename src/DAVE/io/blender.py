@@ -38,6 +38,7 @@
 import time
 
 from vtkmodules.vtkCommonDataModel import vtkLine
+from vtkmodules.util.numpy_support import vtk_to_numpy
 
 from DAVE.tools import running_in_gui
 
@@ -489,11 +490,10 @@ def _wavefield_to_blender(wavefield, frames_per_step=1, export_only_1_in_x_frame
     code = "\n"
     code += "\nvertices = np.array(["
 
-    for i in range(data.GetNumberOfPoints()):
-        point = data.GetPoint(i)
-        code += "\n    {}, {}, {},".format(*point)
-
-    code = code[:-1]  # remove the last ,
+    code += ",".join(
+        "\n    {}, {}, {}".format(*point)
+        for point in vtk_to_numpy(data.GetPoints().GetData()).tolist()
+    )
 
     code += """], dtype=np.float32)
 
@@ -589,13 +589,7 @@ mesh.polygons.foreach_set("loop_total", loop_total)
         filename = consts.PATH_TEMP / "waves_frame{}.npy".format(i_frame)
         # data = v.actor.GetMapper().GetInputAsDataSet()
 
-        # pre-allocate data
-        n_points = data.GetNumberOfPoints()
-        points = np.zeros((n_points, 3))
-
-        for i in range(n_points):
-            point = data.GetPoint(i)
-            points[i, :] = point
+        points = vtk_to_numpy(data.GetPoints().GetData()).astype(float)
 
         np.save(filename, np.ravel(points))
 
@@ -0,0 +1,111 @@
+"""
+Binary snapshots (.daveb) of a scene.
+
+The python-code format (.dave) is the canonical exchange format: it is human-readable and robust against
+changes in DAVE. Loading it, however, means executing the code which is slow for large scenes.
+
+A snapshot stores the same information as the python code but in a form that can be loaded without
+executing code:
+
+- a json header with the node records as created by DAVE.helpers.scene_clone.describe_scene
+- the vertices and faces of all trimeshes as typed numpy arrays
+
+Both are stored in a single numpy .npz (zip) container. Nodes that can not be described natively (managers and
+plugin nodes) are stored as python code inside the header and executed when loading.
+
+Snapshots are written and read by Scene.save_scene and Scene.load_scene when the file-name ends with .daveb:
+
+    s.save_scene("my_model.daveb")
+    s2 = Scene("my_model.daveb")
+
+"""
+import json
+from enum import Enum
+from pathlib import Path
+
+import numpy as np
+
+import DAVE.nds.enums
+from DAVE.helpers.scene_clone import describe_scene, build_scene, trimesh_arrays
+
+SNAPSHOT_EXTENSION = ".daveb"
+SNAPSHOT_VERSION = 1
+
+
+def _to_plain(value):
+    """Converts a value to something that can be stored as json while keeping tuples and enums"""
+    if isinstance(value, Enum):
+        return {"__enum__": type(value).__name__, "name": value.name}
+    if isinstance(value, tuple):
+        return {"__tuple__": [_to_plain(v) for v in value]}
+    if isinstance(value, (list, set)):
+        return [_to_plain(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _to_plain(v) for k, v in value.items()}
+    if isinstance(value, np.ndarray):
+        return {"__tuple__": [_to_plain(v) for v in value.tolist()]}
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _from_plain(d: dict):
+    """json object hook, reverse of _to_plain"""
+    if "__enum__" in d:
+        return getattr(DAVE.nds.enums, d["__enum__"])[d["name"]]
+    if "__tuple__" in d:
+        return tuple(d["__tuple__"])
+    return d
+
+
+def save_snapshot(scene, filename, do_reports=True, do_timeline=True) -> Path:
+    """Writes a binary snapshot of the scene to filename (.daveb)"""
+
+    d = describe_scene(scene, do_reports=do_reports, do_timeline=do_timeline)
+
+    arrays = dict()
+    for record in d["nodes"]:
+        trimesh = record.get("trimesh", None)
+        if trimesh is None:
+            continue
+
+        i_mesh = len(arrays) // 2
+        vertices, faces = trimesh_arrays(trimesh.pop("source"))
+        arrays[f"vertices_{i_mesh}"] = vertices
+        arrays[f"faces_{i_mesh}"] = faces
+        trimesh["mesh"] = i_mesh
+
+    header = dict(version=SNAPSHOT_VERSION, scene=_to_plain(d))
+    arrays["header"] = np.frombuffer(json.dumps(header).encode("utf-8"), dtype=np.uint8)
+
+    filename = Path(filename)
+    with open(filename, "wb") as f:  # np.savez would append .npz to the filename
+        np.savez_compressed(f, **arrays)
+
+    return filename
+
+
+def load_snapshot(scene, filename):
+    """Loads a binary snapshot (.daveb) into scene"""
+
+    with np.load(filename, allow_pickle=False) as data:
+        header = json.loads(
+            data["header"].tobytes().decode("utf-8"), object_hook=_from_plain
+        )
+
+        if header["version"] > SNAPSHOT_VERSION:
+            raise ValueError(
+                f"Snapshot {filename} was written with a newer version of DAVE (snapshot version {header['version']}), please use the .dave file instead"
+            )
+
+        d = header["scene"]
+        for record in d["nodes"]:
+            trimesh = record.get("trimesh", None)
+            if trimesh is None:
+                continue
+
+            i_mesh = trimesh["mesh"]
+            trimesh["vertices"] = data[f"vertices_{i_mesh}"]
+            trimesh["faces"] = data[f"faces_{i_mesh}"]
+
+    build_scene(scene, d)
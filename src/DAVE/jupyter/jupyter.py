@@ -229,44 +229,7 @@ def pil_image(
 
     c = vp.camera
 
-    if isinstance(lookat, str):  # go to 2d mode
-        c.SetPosition(*camera_pos)
-
-        if lookat == "x":
-            c.SetViewUp(0, 0, 1)
-            c.SetFocalPoint(camera_pos[0] + 1, camera_pos[1], camera_pos[2])
-        elif lookat == "-x":
-            c.SetViewUp(0, 0, 1)
-            c.SetFocalPoint(camera_pos[0] - 1, camera_pos[1], camera_pos[2])
-        elif lookat == "y":
-            c.SetViewUp(0, 0, 1)
-            c.SetFocalPoint(camera_pos[0], camera_pos[1] + 1, camera_pos[2])
-        elif lookat == "-y":
-            c.SetViewUp(0, 0, 1)
-            c.SetFocalPoint(camera_pos[0], camera_pos[1] - 1, camera_pos[2])
-        elif lookat == "z":
-            c.SetViewUp(0, -1, 0)
-            c.SetFocalPoint(camera_pos[0], camera_pos[1], camera_pos[2] + 1)
-        elif lookat == "-z":
-            c.SetViewUp(0, 1, 0)
-            c.SetFocalPoint(camera_pos[0], camera_pos[1], camera_pos[2] - 1)
-        else:
-            raise ValueError('Value for "lookat" shall be x, -x, y, -y, z, -z')
-
-        projection = "2d"
-
-    else:
-        c.SetPosition(*camera_pos)
-        c.SetFocalPoint(*lookat)
-        c.SetViewUp(0, 0, 1)
-
-    if projection == "2d":
-        c.ParallelProjectionOn()
-        if scale is not None:
-            c.SetParallelScale(scale)
-    else:
-        if scale is not None:
-            warnings.warn("Scale parameter is only used for 2d projections")
+    vp.set_camera(camera_pos=camera_pos, lookat=lookat, projection=projection, scale=scale)
 
     vp.update_visibility()
 
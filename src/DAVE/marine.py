@@ -22,12 +22,19 @@ import math
 """
 
 from DAVE.scene import *
+from DAVE.helpers.solution_cache import SolutionCache
 import matplotlib.pyplot as plt
 from warnings import warn
 
 
+
 def linearize_buoyancy(
-    scene: Scene, node: Buoyancy = None, delta_draft=1e-3, delta_roll=1, delta_pitch=0.3
+    scene: Scene,
+    node: Buoyancy = None,
+    delta_draft=1e-3,
+    delta_roll=1,
+    delta_pitch=0.3,
+    use_table=False,
 ):
     """Replaces the given Buoyancy node with a HydSpring node using even-keel (rotation = (0,0,0) ) as reference.
 
@@ -37,6 +44,7 @@ def linearize_buoyancy(
         delta_draft: draft difference used in linearization [m]
         delta_roll: roll difference used in linearization [deg]
         delta_pitch pitch difference used in linearization [deg]
+        use_table: interpolate the properties from the hydrostatics table of the node (see Buoyancy.hydrostatics_table)
 
     See Also: calculate_linearized_buoyancy_props
 
@@ -47,7 +55,9 @@ def linearize_buoyancy(
     if node is None:
         r = None
         for node in scene.nodes_of_type(Buoyancy):
-            r = linearize_buoyancy(scene, node, delta_draft, delta_roll, delta_pitch)
+            r = linearize_buoyancy(
+                scene, node, delta_draft, delta_roll, delta_pitch, use_table
+            )
         return r
 
     props = calculate_linearized_buoyancy_props(
@@ -56,6 +66,7 @@ def linearize_buoyancy(
         delta_draft=delta_draft,
         delta_roll=delta_roll,
         delta_pitch=delta_pitch,
+        use_table=use_table,
     )
 
     parent = node.parent
@@ -83,6 +94,7 @@ def calculate_linearized_buoyancy_props(
     delta_draft=1e-3,
     delta_roll=1,
     delta_pitch=0.3,
+    use_table=False,
 ):
     """Obtains the linearized buoyancy properties of a buoyant shape. The properties are derived for the current
     vertical position of the parent body (draft at origin) and even-keel.
@@ -93,6 +105,10 @@ def calculate_linearized_buoyancy_props(
     BMT, BML are evaluated by increasing the roll/pitch by delta_roll/delta_pitch [deg]. So roll to sb, pitch to bow.
     Note: negative values are allowed. Zero is not allowed and will result in division by zero.
 
+    If use_table is True then the properties are interpolated from the hydrostatics tables of the nodes
+    (see Buoyancy.hydrostatics_table). The tables are built on first use and re-used for subsequent queries.
+    Vertical positions outside the range of a table are evaluated directly.
+
         cob,"Center of buoyancy in parent axis system (m,m,m)"
         BMT,Vertical distance between cob and metacenter for roll [m]
         BML,Vertical distance between cob and metacenter for pitch [m]
@@ -112,24 +128,92 @@ def calculate_linearized_buoyancy_props(
                 f"Node {node.name} should be a 'buoyancy' type of node but is a {type(node)}."
             )
 
+    z = nodes[0].parent.global_position[2]
+
+    if use_table:
+        tables = [
+            node.hydrostatics_table(
+                delta_draft=delta_draft, delta_roll=delta_roll, delta_pitch=delta_pitch
+            )
+            for node in nodes
+        ]
+        if not all(table.covers(z) for table in tables):
+            use_table = False  # fully submerged or emerged shapes, evaluate directly
+
+    if use_table:
+        from DAVE.helpers.hydrostatics_table import combine
+
+        props = [table.at(z) for table in tables]
+
+        if sum(p["Awl"] for p in props) < 1e-6 / delta_draft:
+            warn(f"Zero displacement change detected for vertical position of {z}m")
+            return None
+
+        return combine(props, g=scene.g, rho_water=scene.rho_water)
+
+    prepared = _prepare_hydrostatics_scene(
+        codes=[node.give_python_code() for node in nodes],
+        parent_name=nodes[0].parent.name,
+        resource_provider=scene.resource_provider,
+    )
+
+    return _linearized_buoyancy_props_at(
+        prepared,
+        z=z,
+        g=scene.g,
+        rho_water=scene.rho_water,
+        delta_draft=delta_draft,
+        delta_roll=delta_roll,
+        delta_pitch=delta_pitch,
+    )
+
+
+def _prepare_hydrostatics_scene(codes, parent_name, resource_provider) -> tuple:
+    """Creates a scene with copies of buoyancy nodes for evaluating hydrostatic properties at many drafts.
+
+    The buoyancy nodes are placed on a fixed frame with the name of their parent. That frame is placed on a second
+    fixed frame ("rot") which is used to impose heel and trim.
+
+    Args:
+        codes: python code of the buoyancy nodes
+        parent_name: name of the parent of the buoyancy nodes
+        resource_provider: resource provider for loading the meshes
+
+    Returns:
+        (scene, parent frame, rotation frame, buoyancy nodes)
+    """
     s = Scene()
-    s.resource_provider = scene.resource_provider
+    s.resource_provider = resource_provider
 
-    # Note that parent is created at 0,0,0 and under zero rotations
-    # that means that the global axis system is the local axis system at target draft and even keel
+    a = s.new_frame(parent_name, fixed=True)
 
-    a = s.new_frame(nodes[0].parent.name, fixed=True)
-    a.z = nodes[0].parent.global_position[2]
+    for code in codes:
+        s.run_code(code)  # place a copy of the buoyancy node in scene "s"
 
-    for node in nodes:
-        exec(node.give_python_code())  # place a copy of the buoyancy node in scene "s"
+    nodes = [node for node in s._nodes if isinstance(node, Buoyancy)]
 
-    # get buoyancy
-    s.update()
+    rot = s.new_frame(s.available_name_like("rot"), fixed=True)
+    a.parent = rot
+
+    return s, a, rot, nodes
+
+
+def _linearized_buoyancy_props_at(
+    prepared, z, g, rho_water, delta_draft, delta_roll, delta_pitch
+) -> dict or None:
+    """Linearized buoyancy properties (see calculate_linearized_buoyancy_props) of the buoyancy nodes in the prepared
+    scene (see _prepare_hydrostatics_scene) with their parent at vertical position z and even-keel.
+    """
+    s, a, rot, n2 = prepared
 
-    n2 = [s[node.name] for node in nodes]  # nodes in new scene
+    # Note that parent is placed at 0,0,z and under zero rotations
+    # that means that the global axis system is the local axis system at target draft and even keel
+    rot.position = (0, 0, 0)
+    rot.rotation = (0, 0, 0)
+    a.position = (0, 0, z)
 
-    del nodes  # to make sure it is not used again
+    # get buoyancy
+    s.update()
 
     displacement_m3 = np.sum([node.displacement for node in n2])
     cob_local = (
@@ -142,9 +226,7 @@ def calculate_linearized_buoyancy_props(
     )
 
     # increase draft
-    old_z = a.z
-
-    a.z = a.z - delta_draft
+    a.z = z - delta_draft
     s.update()
 
     new_disp = np.sum([node.displacement for node in n2])
@@ -155,7 +237,7 @@ def calculate_linearized_buoyancy_props(
         return None
 
     Awl = delta_disp / delta_draft
-    kHeave = Awl * scene.g * scene.rho_water
+    kHeave = Awl * g * rho_water
 
     # calcualte cofx and cofy from change of cob position
     # x_old * x_disp + cofx * dis_change = x_new * dis_new
@@ -168,12 +250,9 @@ def calculate_linearized_buoyancy_props(
     COFX = (new_cob_local[0] * new_disp - cob_local[0] * displacement_m3) / delta_disp
     COFY = (new_cob_local[1] * new_disp - cob_local[1] * displacement_m3) / delta_disp
 
-    a.z = old_z  # restore draft
-
     # calculate BMT and BML by rotating about cob
-
-    rot = s.new_frame("rot", position=cob_global)
-    a.change_parent_to(rot)
+    rot.position = cob_global
+    a.position = np.array((0, 0, z)) - cob_global  # restore draft, relative to rot
 
     rot.rotation = (delta_roll, 0, 0)  # impose heel
     s.update()
@@ -205,16 +284,41 @@ def calculate_linearized_buoyancy_props(
         "COFY": COFY,
         "kHeave": kHeave,
         "Awl": Awl,
-        "displacement_kN": displacement_m3 * scene.g * scene.rho_water,
+        "displacement_kN": displacement_m3 * g * rho_water,
         "displacement": displacement_m3,
         "waterline": -cob_global[2],
     }
 
-    del s
-
     return results
 
 
+def _carene_rows(
+    codes,
+    parent_name,
+    resource_provider,
+    drafts,
+    g,
+    rho_water,
+    delta_draft,
+    delta_roll,
+    delta_pitch,
+) -> list:
+    """Evaluates the linearized buoyancy properties for all drafts on a single prepared scene.
+    Returns a list of (draft, results or None). Runs in a worker process when carene_table is evaluated in parallel."""
+
+    prepared = _prepare_hydrostatics_scene(codes, parent_name, resource_provider)
+
+    return [
+        (
+            z,
+            _linearized_buoyancy_props_at(
+                prepared, z, g, rho_water, delta_draft, delta_roll, delta_pitch
+            ),
+        )
+        for z in drafts
+    ]
+
+
 def carene_table(
     scene,
     buoyancy_nodes,
@@ -222,6 +326,7 @@ def carene_table(
     delta_draft=1e-3,
     delta_roll=1,
     delta_pitch=0.3,
+    n_workers=1,
 ):
     """Creates a carene table for buoyancy node.
 
@@ -234,6 +339,12 @@ def carene_table(
         stepsize: Stepsize for drafts
 
         delta_draft, delta_roll, delta_pitch: deltas used for derivation of linearized properties (see calculate_linearized_buoyancy_props)
+        n_workers [1]: number of worker processes, None for the number of cpus. Default is to evaluate all drafts in
+                       this process. Worker processes require the calling script to be protected by
+                       if __name__ == "__main__" on platforms that spawn processes (Windows, macOS).
+
+    The buoyancy shapes are copied into a single hydrostatics scene (the meshes are loaded once) which is then
+    evaluated at every draft.
 
     **
     - If Buoyancy is a list, then all buoyancy nodes shall have the same parent.
@@ -292,26 +403,19 @@ def carene_table(
     for bn in buoyancy_nodes:
         assert bn.parent == parent, "All nodes need to have the same parent"
 
-    s = Scene()
-    s.resource_provider = scene.resource_provider
-    parent_node = s.new_frame(buoyancy_nodes[0].parent.name, fixed=True)
+    codes = [node.give_python_code() for node in buoyancy_nodes]
+    parent_name = buoyancy_nodes[0].parent.name
 
-    for buoyancy_node in buoyancy_nodes:
-        s.run_code(
-            buoyancy_node.give_python_code()
-        )  # place a copy of the buoyancy node in scene "s"
+    prepared = _prepare_hydrostatics_scene(
+        codes, parent_name, resource_provider=scene.resource_provider
+    )
+    nodes = prepared[3]  # nodes in the prepared scene
 
     zn = 1e10
     zp = -1e10
 
-    for bn in buoyancy_nodes:
-        node = s[bn.name]
-
-        # now we have a frame (a) at 0,0,0 / 0,0,0
-        # with a buoyancy shape attached to it
-
+    for node in nodes:
         # determine range
-
         xn, xp, yn, yp, zzn, zzp = node.trimesh.get_extends()
 
         zn = min(zn, zzn)
@@ -341,21 +445,51 @@ def carene_table(
 
     import pandas as pd
 
-    nodes = [s[node.name] for node in buoyancy_nodes]  # nodes in copy of s
+    drafts = list(reversed(drafts))
+    deltas = (delta_draft, delta_roll, delta_pitch)
 
-    a = []
-    for z in reversed(drafts):
-        print(z)
+    if n_workers is None:
+        from os import cpu_count
 
-        parent_node.z = z
-        r = calculate_linearized_buoyancy_props(
-            s,
-            nodes,
-            delta_roll=delta_roll,
-            delta_pitch=delta_pitch,
-            delta_draft=delta_draft,
-        )
+        n_workers = max(1, min(cpu_count() or 1, len(drafts)))
 
+    if n_workers == 1:
+        rows = [
+            (
+                z,
+                _linearized_buoyancy_props_at(
+                    prepared, z, scene.g, scene.rho_water, *deltas
+                ),
+            )
+            for z in drafts
+        ]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        # contiguous chunks, one per worker. Every worker prepares the geometry once.
+        chunk_size = math.ceil(len(drafts) / n_workers)
+        chunks = [
+            drafts[i : i + chunk_size] for i in range(0, len(drafts), chunk_size)
+        ]
+
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            futures = [
+                pool.submit(
+                    _carene_rows,
+                    codes,
+                    parent_name,
+                    scene.resource_provider,
+                    chunk,
+                    scene.g,
+                    scene.rho_water,
+                    *deltas,
+                )
+                for chunk in chunks
+            ]
+            rows = [row for future in futures for row in future.result()]
+
+    a = []
+    for z, r in rows:
         if r is None:
             continue
 
@@ -404,6 +538,8 @@ def GZcurve_DisplacementDriven(
     fig=None,
     feedback=None,
     check_terminate=None,
+    continuation=False,
+    n_workers=None,
 ):
     """This works for vessels without a parent.
 
@@ -436,6 +572,11 @@ def GZcurve_DisplacementDriven(
         noplot:         Do not plot results [False]
         noshow:         Do plot but do not do plt.show() [False]
         fig:            Figure instance to plot in
+        continuation:   Start solving each heel angle from the solution extrapolated from the previous heel angles
+                        (predictor) instead of from the initial equilibrium. This is faster but may find a different
+                        equilibrium branch for shapes with multiple equilibria. [False]
+        n_workers:      Split the heel range in contiguous chunks and solve those in this number of worker processes,
+                        each on its own copy of the scene. None or 1: solve in this process [None]
 
         feedback : func(str) for providing feedback during reporting
         check_terminate : func() -> bool : for providing a terminate signal
@@ -448,21 +589,14 @@ def GZcurve_DisplacementDriven(
 
     """
 
-    # Two quick helper functions for running in controlled mode
+    # Quick helper function for running in controlled mode
     def give_feedback(txt):
         if feedback is not None:
             feedback(txt)
 
-    def should_terminate():
-        if check_terminate is not None:
-            return check_terminate()
-        else:
-            return False
-
     # --------- verify input -----------
 
     s = scene  # alias
-    doflog = []
 
     if minimum_heel > maximum_heel:
         raise ValueError("Minimum heel should be smaller than maximum heel")
@@ -571,61 +705,41 @@ def GZcurve_DisplacementDriven(
     # ----------------- do the calcs ---------------
 
     heel = np.linspace(minimum_heel, maximum_heel, num=steps)
-    moment = list()
-    moment_wind = list()
-    trim = list()
-
-    for x in heel:
-        give_feedback(f"Setting heel angle {x} deg")
 
-        s._vfc.set_dofs(D0)
-        heel_node.rx = x
-
-        give_feedback(f"Solving without wind")
-        s._solve_statics_with_optional_control(
-            feedback_func=feedback, do_terminate_func=check_terminate
+    if n_workers is None or n_workers == 1 or len(heel) < 2:
+        result = _gz_solve_heel_angles(
+            s,
+            vessel,
+            global_motion,
+            trim_motion,
+            heel_node,
+            heel,
+            D0,
+            wind_velocity=wind_velocity,
+            continuation=continuation,
+            feedback=feedback,
+            check_terminate=check_terminate,
         )
 
-        if should_terminate():
-            return None
-
-        # moment.append(-heel_node.applied_force[3])  # No, applied force is in global axis system
-        moment.append(
-            -vessel.connection_moment_x
-        )  # this is the connection moment in the axis system of the heel node
-
-        trim.append(trim_motion.ry)
-
-        # activate wind
-        if do_wind:
-            s.wind_velocity = wind_velocity
-            give_feedback(f"Solving with wind")
-
-            # We need to solve, suspended cargo may change position. But fix the vessel such that is does not change position due to wind
-            old_fixes = global_motion.fixed
-            global_motion.fixed = True
-
-            s._solve_statics_with_optional_control(
-                feedback_func=feedback, do_terminate_func=check_terminate
-            )
-
-            # print(global_motion.rotation)
-
-            moment_wind.append(-vessel.connection_moment_x)
-
-            # restore
-            s.wind_velocity = 0
-            global_motion.fixed = old_fixes
+    else:
+        result = _gz_solve_heel_angles_parallel(
+            s,
+            vessel,
+            global_motion,
+            trim_motion,
+            heel_node,
+            heel,
+            wind_velocity=wind_velocity,
+            continuation=continuation,
+            n_workers=n_workers,
+            feedback=feedback,
+            check_terminate=check_terminate,
+        )
 
-            if should_terminate():
-                return None
+    if result is None:  # terminated
+        return None
 
-        # for movie replay (temporary add of dof to heel)
-        heel_node.fixed = (True, True, True, False, True, True)
-        s._vfc.state_update()
-        dofs = s._vfc.get_dofs()
-        doflog.append(dofs)
-        heel_node.set_fixed()
+    moment, moment_wind, trim, doflog = result
 
     # --------- collect return values --------
     r = dict()
@@ -792,30 +906,318 @@ def GZcurve_DisplacementDriven(
     return r
 
 
+def _gz_solve_heel_angles(
+    s: Scene,
+    vessel: Frame,
+    global_motion: Frame,
+    trim_motion: Frame,
+    heel_node: Frame,
+    heels,
+    D0,
+    wind_velocity,
+    continuation,
+    feedback=None,
+    check_terminate=None,
+):
+    """Imposes the heel angles one by one on heel_node and solves statics, see GZcurve_DisplacementDriven.
+
+    If continuation is True then the starting point for every heel angle is extrapolated from the solutions of the
+    previous heel angles (predictor) after which statics is solved (corrector). Else every heel angle is solved starting
+    from the initial dofs D0.
+
+    Returns:
+        (moment, moment_wind, trim, doflog) or None if terminated
+    """
+
+    def give_feedback(txt):
+        if feedback is not None:
+            feedback(txt)
+
+    def should_terminate():
+        if check_terminate is not None:
+            return check_terminate()
+        else:
+            return False
+
+    do_wind = wind_velocity > 0
+
+    # solved states are re-used as starting point for the next heel angle
+    cache = SolutionCache()
+
+    moment = list()
+    moment_wind = list()
+    trim = list()
+    doflog = list()
+
+    for x in heels:
+        give_feedback(f"Setting heel angle {x} deg")
+
+        heel_node.rx = x
+
+        cache.parameter = x
+        if not (continuation and cache.warm_start(s)):
+            s._vfc.set_dofs(D0)
+
+        give_feedback(f"Solving without wind")
+        s._solve_statics_with_optional_control(
+            feedback_func=feedback, do_terminate_func=check_terminate
+        )
+
+        if should_terminate():
+            return None
+
+        if continuation:
+            cache.store(s)
+
+        # moment.append(-heel_node.applied_force[3])  # No, applied force is in global axis system
+        moment.append(
+            -vessel.connection_moment_x
+        )  # this is the connection moment in the axis system of the heel node
+
+        trim.append(trim_motion.ry)
+
+        # activate wind
+        if do_wind:
+            s.wind_velocity = wind_velocity
+            give_feedback(f"Solving with wind")
+
+            # We need to solve, suspended cargo may change position. But fix the vessel such that is does not change position due to wind
+            old_fixes = global_motion.fixed
+            global_motion.fixed = True
+
+            s._solve_statics_with_optional_control(
+                feedback_func=feedback, do_terminate_func=check_terminate
+            )
+
+            moment_wind.append(-vessel.connection_moment_x)
+
+            # restore
+            s.wind_velocity = 0
+            global_motion.fixed = old_fixes
+
+            if should_terminate():
+                return None
+
+        # for movie replay (temporary add of dof to heel)
+        heel_node.fixed = (True, True, True, False, True, True)
+        s._vfc.state_update()
+        dofs = s._vfc.get_dofs()
+        doflog.append(dofs)
+        heel_node.set_fixed()
+
+    return moment, moment_wind, trim, doflog
+
+
+_gz_worker_D0 = None
+"""Initial dofs of the scene of a GZ worker process, see _gz_worker_setup"""
+
+
+def _gz_worker_setup(s: Scene):
+    """Runs in a worker process after the scene has been created"""
+    global _gz_worker_D0
+    s.verbose = False
+    s._vfc.state_update()
+    _gz_worker_D0 = s._vfc.get_dofs()
+
+
+def _gz_heel_chunk(node_names, heels, wind_velocity, continuation):
+    """Solves a chunk of heel angles on the scene of the worker process. Runs in a worker process.
+
+    Returns:
+        (moment, moment_wind, trim, doflog, dof signature of the logged dofs)
+    """
+    from DAVE.helpers.solution_cache import dof_signature
+    from DAVE.helpers.sweep import worker_scene
+
+    s = worker_scene()
+    vessel, global_motion, trim_motion, heel_node = (s[name] for name in node_names)
+
+    D0 = _gz_worker_D0
+
+    moment, moment_wind, trim, doflog = _gz_solve_heel_angles(
+        s,
+        vessel,
+        global_motion,
+        trim_motion,
+        heel_node,
+        heels,
+        D0,
+        wind_velocity=wind_velocity,
+        continuation=continuation,
+    )
+
+    heel_node.fixed = (True, True, True, False, True, True)
+    s._vfc.state_update()
+    signature = dof_signature(s)
+
+    # the worker may receive another chunk
+    heel_node.set_fixed()
+    s._vfc.state_update()
+
+    return moment, moment_wind, trim, doflog, signature
+
+
+def _remap_dofs(dofs, source_signature, target_signature) -> list:
+    """Re-orders dofs from the dof layout of one scene to the dof layout of an identical scene.
+
+    The signatures are obtained using solution_cache.dof_signature. Dofs are matched by element name and mode.
+    """
+    if source_signature == target_signature:
+        return list(dofs)
+
+    position = dict()
+    counts = dict()
+    for i, key in enumerate(zip(*source_signature)):
+        n = counts.get(key, 0)
+        position[(key, n)] = i
+        counts[key] = n + 1
+
+    counts = dict()
+    remapped = []
+    for key in zip(*target_signature):
+        n = counts.get(key, 0)
+        remapped.append(dofs[position[(key, n)]])
+        counts[key] = n + 1
+
+    return remapped
+
+
+def _gz_solve_heel_angles_parallel(
+    s: Scene,
+    vessel: Frame,
+    global_motion: Frame,
+    trim_motion: Frame,
+    heel_node: Frame,
+    heels,
+    wind_velocity,
+    continuation,
+    n_workers,
+    feedback=None,
+    check_terminate=None,
+):
+    """As _gz_solve_heel_angles but the heel angles are split in contiguous chunks which are solved in worker
+    processes. Every worker builds its own copy of the scene (including the helper frames) from python code.
+
+    The scene s is left in the solved state of the last heel angle, same as for _gz_solve_heel_angles.
+    """
+    from DAVE.helpers.solution_cache import dof_signature
+    from DAVE.helpers.sweep import run_in_workers
+
+    n_workers = min(n_workers, len(heels))
+    chunk_size = math.ceil(len(heels) / n_workers)
+    chunks = [heels[i : i + chunk_size] for i in range(0, len(heels), chunk_size)]
+
+    node_names = (vessel.name, global_motion.name, trim_motion.name, heel_node.name)
+
+    results = [None] * len(chunks)
+
+    def on_result(job_index, result):
+        results[job_index] = result
+        return len(chunks[job_index])
+
+    n_done = run_in_workers(
+        s,
+        _gz_heel_chunk,
+        [(node_names, chunk, wind_velocity, continuation) for chunk in chunks],
+        n_workers,
+        on_result,
+        n_items=len(heels),
+        progress_text="Solved {} of {} heel angles",
+        feedback_func=feedback,
+        do_terminate_func=check_terminate,
+        worker_setup=_gz_worker_setup,
+    )
+
+    if n_done < len(heels):  # terminated
+        return None
+
+    # the dofs are logged with the heel dof free, use that layout in this scene as well
+    heel_node.fixed = (True, True, True, False, True, True)
+    s._vfc.state_update()
+    signature = dof_signature(s)
+
+    moment, moment_wind, trim, doflog = [], [], [], []
+    for chunk_moment, chunk_moment_wind, chunk_trim, chunk_doflog, chunk_signature in results:
+        moment.extend(chunk_moment)
+        moment_wind.extend(chunk_moment_wind)
+        trim.extend(chunk_trim)
+        doflog.extend(
+            _remap_dofs(dofs, chunk_signature, signature) for dofs in chunk_doflog
+        )
+
+    # leave the scene in the state of the last heel angle
+    s._vfc.set_dofs(doflog[-1])
+    heel_node.set_fixed()
+    s._vfc.state_update()
+
+    return moment, moment_wind, trim, doflog
+
+
 def ballast_to_even_keel(
     bs: BallastSystem, delta_fill=1, tolerance=0.01, passive_only=False, deballast=False,
-    feedback_func = None, do_terminate = None, solve_func = None
+    feedback_func = None, do_terminate = None, solve_func = None, method="incremental", max_iterations=10
 ):
-    """Adds `delta_fill` fill to the tank at the highest projected elevation until parent
-    of ballast-system is within heel and trim tolerance.
+    """Changes the fills of the tanks of the ballast system until parent of ballast-system is within heel and trim
+    tolerance.
 
-    Warning: delta_fill should be matched to tolerance else the the algorithm will fail
+    Only water is added to tanks, or, if deballast is True, only drained from tanks. Frozen tanks are not changed.
+    If passive_only is True then only tanks below the waterline are filled (or above the waterline are drained).
+
+    Methods:
+        "incremental" (default) : Adds `delta_fill` fill to the tank at the highest projected elevation (or drains the
+                      lowest) until within tolerance.
+                      Warning: delta_fill should be matched to tolerance else the the algorithm will fail
+        "influence" : The influence of every tank on heel, trim and elevation is obtained by changing the fill of each
+                      tank by delta_fill [%] and solving. The fills of all tanks are then solved at once using bounded
+                      least-squares, followed by confirming solves until the tolerance is reached (at most
+                      max_iterations). Typically needs far fewer solves than "incremental".
+
+    Returns:
+        log (list of str)
     """
     if feedback_func is None:
         feedback_func = lambda x: None
 
     if do_terminate is None:
-        do_terminate = lambda x: False
+        do_terminate = lambda: False
 
     if solve_func is None:
         solve_func = lambda: s.solve_statics()
 
-
     f = bs.parent
     s = f._scene
 
+    # undoing an overshoot returns to a previously solved state, the cache re-uses that solution.
+    # The cache key is cheap (see solution_cache.property_hash), only the changed tanks are re-exported
+    cache = SolutionCache()
+    _solve_func = solve_func
+
+    def solve_func():
+        cache.warm_start(s)
+        converged = _solve_func()
+        if converged:  # do not re-use failed or terminated solves
+            cache.store(s)
+        return converged
+
     solve_func()
 
+    if method == "influence":
+        return _ballast_to_even_keel_influence(
+            bs,
+            delta_fill=delta_fill,
+            tolerance=tolerance,
+            passive_only=passive_only,
+            deballast=deballast,
+            feedback_func=feedback_func,
+            do_terminate=do_terminate,
+            solve_func=solve_func,
+            max_iterations=max_iterations,
+        )
+    elif method != "incremental":
+        raise ValueError(
+            f"Unknown method {method}, use 'influence' or 'incremental'"
+        )
+
     log = ["Staring ballast to even keel operation"]
 
     while True:
@@ -825,26 +1227,23 @@ def ballast_to_even_keel(
         lowest = 1e6
         lowest_tank = None
 
-        for tank in bs.tanks:
+        # vertical position of each tank if it was as zero local elevation
+        local = np.array([tank.cog_when_full for tank in bs.tanks], dtype=float)
+        local[:, 2] = 0
+        tank_gz = f.to_glob_positions(local)[:, 2]
+
+        for tank, gz in zip(bs.tanks, tank_gz):
             if bs.is_frozen(tank.name):
                 continue
 
             if not passive_only or (tank.level_global < 0):  # only passive filling
                 if tank.fill_pct <= 100 - (delta_fill + 1e-6):
-                    gz = f.to_glob_position((*tank.cog_when_full[:2], 0))[
-                        2
-                    ]  # vertical position of tank if it was as zero local elevation
-
                     if gz > highest:
                         highest_tank = tank
                         highest = gz
 
             if not passive_only or (tank.level_global > 0):  # only passive emptying
                 if tank.fill_pct >= (delta_fill + 1e-6):
-                    gz = f.to_glob_position((*tank.cog_when_full[:2], 0))[
-                        2
-                    ]  # vertical position of tank if it was as zero local elevation
-
                     if gz < lowest:
                         lowest_tank = tank
                         lowest = gz
@@ -911,3 +1310,117 @@ def ballast_to_even_keel(
             log.append("No change in heel and trim")
 
     return log
+
+
+def _ballast_to_even_keel_influence(
+    bs: BallastSystem,
+    delta_fill,
+    tolerance,
+    passive_only,
+    deballast,
+    feedback_func,
+    do_terminate,
+    solve_func,
+    max_iterations,
+):
+    """See ballast_to_even_keel, method "influence". The scene is solved at entry."""
+    from DAVE.helpers.ballast_influence import measure_influence, solve_fills
+
+    f = bs.parent
+
+    log = ["Staring ballast to even keel operation using tank influence coefficients"]
+
+    # select the tanks that may be changed and the direction in which they may be changed
+    tanks = []
+    lower = []
+    upper = []
+    for tank in bs.tanks:
+        if bs.is_frozen(tank.name):
+            continue
+
+        fill = tank.fill_pct
+        if deballast:
+            if passive_only and tank.level_global <= 0:
+                continue
+            if fill < 1e-6:
+                continue
+            lower.append(0)
+            upper.append(fill)
+        else:
+            if passive_only and tank.level_global >= 0:
+                continue
+            if fill > 100 - 1e-6:
+                continue
+            lower.append(fill)
+            upper.append(100)
+        tanks.append(tank)
+
+    if not tanks:
+        if deballast:
+            raise ValueError("No drainable tanks found")
+        else:
+            raise ValueError("No fillable tanks found")
+
+    if abs(f.heel) < tolerance and abs(f.trim) < tolerance:
+        log.append("Already within tolerance")
+        return log
+
+    influence = measure_influence(
+        f,
+        tanks,
+        solve_func,
+        delta_fill=delta_fill,
+        feedback_func=feedback_func,
+        do_terminate=do_terminate,
+    )
+    if influence is None:  # terminated
+        return log
+
+    log.append(f"Obtained influence coefficients of {len(tanks)} tanks")
+
+    for iteration in range(max_iterations):
+        current = np.array([tank.fill_pct for tank in tanks], dtype=float)
+
+        fills = solve_fills(
+            influence,
+            current_fills=current,
+            current_response=(f.heel, f.trim, f.global_position[2]),
+            target=(0, 0, None),  # draft is free
+            lower=lower,
+            upper=upper,
+        )
+
+        for tank, fill, old_fill in zip(tanks, fills, current):
+            if abs(fill - old_fill) > 1e-9:
+                tank.fill_pct = fill
+
+        old_heel = f.heel
+        old_trim = f.trim
+
+        solve_func()
+
+        changed = [
+            f"{tank.name} {old_fill:.2f}% -> {fill:.2f}%"
+            for tank, fill, old_fill in zip(tanks, fills, current)
+            if abs(fill - old_fill) > 1e-6
+        ]
+        log.append(
+            f"Iteration {iteration + 1}: changed {len(changed)} tanks: "
+            + ", ".join(changed)
+        )
+
+        feedback_func(f"heel: {f.heel:.2f} trim: {f.trim:.2f} - {log[-1]}")
+        if do_terminate():
+            return log
+
+        if abs(f.heel) < tolerance and abs(f.trim) < tolerance:
+            return log
+
+        if abs(f.heel - old_heel) < 1e-6 and abs(f.trim - old_trim) < 1e-6:
+            raise ValueError(
+                "Could not reach even keel with the available tanks - use different tanks or change method?"
+            )
+
+    raise ValueError(
+        f"Even keel not reached within tolerance after {max_iterations} iterations; heel = {f.heel:.3f}, trim = {f.trim:.3f}"
+    )
@@ -85,6 +85,12 @@ class Node(DAVENodeBase, ABC):
 
         self._tags = set()
 
+        self._dirty = True
+        """Set by node_setter_observable, cleared by Scene.update. See _needs_update"""
+
+        self._version = getattr(self, "_version", 0)
+        """Incremented by node_setter_observable, used by solution_cache.property_hash"""
+
         scene.add_node(self)  # adds the node to the scene
 
         # some custom properties for gui interaction
@@ -243,11 +249,27 @@ class Node(DAVENodeBase, ABC):
 
         pass
 
+    _update_is_state_dependent = True
+    """If True then update is executed on every Scene.update. If False then update is only executed if
+    the node has changed (see _needs_update)."""
+
     def update(self):
         """Performs internal updates relevant for physics. Called before solving statics or getting results such as
         forces or inertia"""
         pass
 
+    def _has_update(self) -> bool:
+        """Returns True if the node-type implements update"""
+        return type(self).update is not Node.update
+
+    def _needs_update(self) -> bool:
+        """Returns True if update needs to be called in Scene.update"""
+        if not self._has_update():
+            return False  # nothing to do
+        if self._update_is_state_dependent:
+            return True
+        return self._dirty
+
     def _notify_observers(self):
         for obs in self.observers:
             obs.on_observed_node_changed(self)
@@ -441,7 +463,9 @@ class NodeCoreConnected(Node):
 
         if not name == self._vfNode.name:
             self._scene._verify_name_available(name)
+            old_name = self._vfNode.name
             self._vfNode.name = name
+            self._scene._on_node_renamed(self, old_name)
 
         self._on_name_changed()
 
@@ -476,7 +500,9 @@ class NodePurePython(Node):
         # verify that the name is available
         self._scene._verify_name_available(name)
 
+        old_name = self._name
         self._name = name
+        self._scene._on_node_renamed(self, old_name)
         self._on_name_changed()
 
     def _delete_vfc(self):
@@ -72,6 +72,7 @@ class RigidBody(Frame):
         return Frame.footprint.fget(self)
 
     @footprint.setter
+    @node_setter_observable
     def footprint(self, value):
         Frame.footprint.fset(self, value)  # https://bugs.python.org/issue14965
 
@@ -347,6 +348,7 @@ class Force(NodeCoreConnected, HasParentCore):
         return self._vfNode.is_global
 
     @is_global.setter
+    @node_setter_observable
     def is_global(self, value: bool):
         assertBool(value, "is_global")
         self._vfNode.is_global = value
@@ -443,6 +445,7 @@ class WindOrCurrentArea(NodeCoreConnected, HasParentCore):
         return self._vfNode.A0
 
     @A.setter
+    @node_setter_observable
     def A(self, value):
         assert1f_positive_or_zero(value, "Area")
         self._vfNode.A0 = value
@@ -458,6 +461,7 @@ class WindOrCurrentArea(NodeCoreConnected, HasParentCore):
         return self._vfNode.Cd
 
     @Cd.setter
+    @node_setter_observable
     def Cd(self, value):
         assert1f_positive_or_zero(value, "Cd")
         self._vfNode.Cd = value
@@ -469,6 +473,7 @@ class WindOrCurrentArea(NodeCoreConnected, HasParentCore):
         return self._vfNode.direction
 
     @direction.setter
+    @node_setter_observable
     def direction(self, value):
         assert3f(value, "direction")
         assert np.linalg.norm(value) > 0, ValueError("direction can not be 0,0,0")
@@ -482,6 +487,7 @@ class WindOrCurrentArea(NodeCoreConnected, HasParentCore):
         return AreaKind(self._vfNode.type)
 
     @areakind.setter
+    @node_setter_observable
     def areakind(self, value):
         if not isinstance(value, AreaKind):
             raise ValueError("kind shall be an instance of Area")
@@ -906,6 +912,7 @@ class SPMT(NodeCoreConnected, HasParentCore):
         return self._vfNode.use_friction
 
     @use_friction.setter
+    @node_setter_observable
     def use_friction(self, value):
         assertBool(value, "use friction")
         self._vfNode.use_friction = value
@@ -1192,16 +1199,25 @@ class Buoyancy(NodeCoreConnected, HasParentCore, HasTrimesh, HasVolumeTrimeshChe
         scene.assert_name_available(name)
 
         self._vfNode = scene._vfc.new_buoyancy(name)
+        self._trimesh_version_loaded = -1
+        self._hydrostatics_table = None
+        self._hydrostatics_table_key = None
         super().__init__(scene=scene, name=name)
 
+    _update_is_state_dependent = False
+
     def depends_on(self) -> list:
         return HasParentCore.depends_on(self)
 
     def change_parent_to(self, new_parent):
         HasTrimesh.change_parent_to(self, new_parent)
 
+    def _needs_update(self) -> bool:
+        return self._dirty or self.trimesh._version != self._trimesh_version_loaded
+
     def update(self):
         self._vfNode.reloadTrimesh()
+        self._trimesh_version_loaded = self.trimesh._version
 
     @property
     def node_errors(self) -> list[str]:
@@ -1225,6 +1241,41 @@ class Buoyancy(NodeCoreConnected, HasParentCore, HasTrimesh, HasVolumeTrimeshChe
         """Displaced volume of fluid [m^3]"""
         return self._vfNode.displacement
 
+    def hydrostatics_table(
+        self, stepsize=0.1, delta_draft=1e-3, delta_roll=1, delta_pitch=0.3
+    ) -> "HydrostaticsTable":
+        """Hydrostatic properties of this shape as function of the vertical position of the parent at even keel.
+
+        The table is built on first use and re-used until the mesh or the parent of this node changes.
+
+        Args:
+            stepsize: vertical distance between the table entries [m]
+            delta_draft, delta_roll, delta_pitch: see marine.calculate_linearized_buoyancy_props
+
+        See Also: marine.calculate_linearized_buoyancy_props(use_table=True)
+        """
+        from DAVE.helpers.hydrostatics_table import HydrostaticsTable
+
+        key = (
+            self.trimesh._version,
+            self.parent,
+            stepsize,
+            delta_draft,
+            delta_roll,
+            delta_pitch,
+        )
+        if self._hydrostatics_table is None or self._hydrostatics_table_key != key:
+            self._hydrostatics_table = HydrostaticsTable.build(
+                self,
+                stepsize=stepsize,
+                delta_draft=delta_draft,
+                delta_roll=delta_roll,
+                delta_pitch=delta_pitch,
+            )
+            self._hydrostatics_table_key = key
+
+        return self._hydrostatics_table
+
     def give_python_code(self):
         code = "# code for {}".format(self.name)
         code += "\nmesh = s.new_buoyancy(name='{}',".format(self.name)
@@ -1268,6 +1319,7 @@ class Tank(NodeCoreConnected, HasParentCore, HasTrimesh, HasVolumeTrimeshCheck):
         scene.assert_name_available(name)
 
         self._vfNode = scene._vfc.new_tank(name)
+        self._trimesh_version_loaded = -1
         super().__init__(scene=scene, name=name)
 
         self._inertia = scene._vfc.new_pointmass(self.name + VF_NAME_SPLIT + "inertia")
@@ -1279,7 +1331,11 @@ class Tank(NodeCoreConnected, HasParentCore, HasTrimesh, HasVolumeTrimeshCheck):
         HasTrimesh.change_parent_to(self, new_parent)
 
     def update(self):
-        self._vfNode.reloadTrimesh()
+        # the mesh only needs to be re-loaded if it, or the tank, changed.
+        # The inertia depends on the fluid level and thus on the state; always update
+        if self._dirty or self.trimesh._version != self._trimesh_version_loaded:
+            self._vfNode.reloadTrimesh()
+            self._trimesh_version_loaded = self.trimesh._version
 
         # update inertia
         self._inertia.parent = self.parent._vfNode
@@ -1305,6 +1361,7 @@ class Tank(NodeCoreConnected, HasParentCore, HasTrimesh, HasVolumeTrimeshCheck):
         return self._vfNode.free_flooding
 
     @free_flooding.setter
+    @node_setter_observable
     def free_flooding(self, value):
         assert isinstance(value, bool), ValueError(
             f"free_flooding shall be a bool, you passed a {type(value)}"
@@ -1668,6 +1725,7 @@ class Cable(NodeCoreConnected):
         return self._vfNode.solve_section_lengths
 
     @solve_segment_lengths.setter
+    @node_setter_observable
     def solve_segment_lengths(self, value):
         assertBool(value, "solve_segment_lengths")
         self._vfNode.solve_section_lengths = value
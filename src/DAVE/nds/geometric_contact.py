@@ -203,6 +203,7 @@ class GeometricContact(
         return self._child_circle
 
     @child.setter
+    @node_setter_observable
     def child(self, value):
         new_child = self._scene._node_from_node_or_str(value)
         if not isinstance(new_child, Circle):
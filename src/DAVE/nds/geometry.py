@@ -17,6 +17,11 @@ from ..settings import VF_NAME_SPLIT
 from ..tools import *
 
 
+def _as_points(values) -> np.ndarray:
+    """values as (N,3) float array, a single 3-vector becomes (1,3)"""
+    return np.asarray(values, dtype=float).reshape(-1, 3)
+
+
 class Frame(NodeCoreConnected, HasParentCore, HasFootprint):
     """
     Frame
@@ -791,6 +796,62 @@ class Frame(NodeCoreConnected, HasParentCore, HasFootprint):
         """
         return np.rad2deg(self._vfNode.local_to_global_rotation(np.deg2rad(value)))
 
+    # ---- batched versions of the transformations above ----
+    # These take an (N,3) array (or a single 3-vector) and return an (N,3) array. The global transform is obtained
+    # from the core once per call.
+
+    @property
+    def global_transform_matrix(self) -> np.ndarray:
+        """Read-only: The global transform as 4x4 matrix such that global = M @ (local, 1) [matrix]
+        #NOGUI"""
+        return np.array(self._vfNode.global_transform, dtype=float).reshape(4, 4).T
+
+    def to_glob_positions(self, values) -> np.ndarray:
+        """Returns the global positions of points in the local axis system as (N,3) array.
+        See Also: to_glob_position
+        """
+        M = self.global_transform_matrix
+        return _as_points(values) @ M[:3, :3].T + M[:3, 3]
+
+    def to_loc_positions(self, values) -> np.ndarray:
+        """Returns the local positions of points in the global axis system as (N,3) array.
+        See Also: to_loc_position
+        """
+        M = self.global_transform_matrix
+        return (_as_points(values) - M[:3, 3]) @ M[:3, :3]
+
+    def to_glob_directions(self, values) -> np.ndarray:
+        """Returns the global directions of vectors in the local axis system as (N,3) array.
+        See Also: to_glob_direction
+        """
+        return _as_points(values) @ self.global_transform_matrix[:3, :3].T
+
+    def to_loc_directions(self, values) -> np.ndarray:
+        """Returns the local directions of vectors in the global axis system as (N,3) array.
+        See Also: to_loc_direction
+        """
+        return _as_points(values) @ self.global_transform_matrix[:3, :3]
+
+    def to_glob_rotations(self, values) -> np.ndarray:
+        """Returns the global rotations [deg] of rotation vectors [deg] in the local axis system as (N,3) array.
+        See Also: to_glob_rotation
+        """
+        from scipy.spatial.transform import Rotation
+
+        frame = Rotation.from_matrix(self.global_transform_matrix[:3, :3])
+        local = Rotation.from_rotvec(_as_points(values), degrees=True)
+        return (frame * local).as_rotvec(degrees=True).reshape(-1, 3)
+
+    def to_loc_rotations(self, values) -> np.ndarray:
+        """Returns the local rotations [deg] of rotation vectors [deg] in the global axis system as (N,3) array.
+        See Also: to_loc_rotation
+        """
+        from scipy.spatial.transform import Rotation
+
+        frame = Rotation.from_matrix(self.global_transform_matrix[:3, :3])
+        glob = Rotation.from_rotvec(_as_points(values), degrees=True)
+        return (frame.inv() * glob).as_rotvec(degrees=True).reshape(-1, 3)
+
     def give_load_shear_moment_diagram(
         self, axis_system=None
     ) -> "LoadShearMomentDiagram":
@@ -1421,6 +1482,7 @@ class Circle(NodeCoreConnected, HasParentCore):
         return self._vfNode.is_roundbar
 
     @is_roundbar.setter
+    @node_setter_observable
     def is_roundbar(self, value):
         # See issue 144
         # we should prohibit changing the type of a circle when it is in use.
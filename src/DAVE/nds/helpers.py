@@ -15,11 +15,17 @@ def node_setter_manageable(func):
 
 
 # Wrapper (decorator) observed nodes
+# Also marks the node as dirty such that it is updated in the next Scene.update,
+# increments the version of the node (see solution_cache.property_hash)
+# and drops the cached dependency graph of the scene as dependencies may have changed
 def node_setter_observable(func):
     @functools.wraps(func)
     def wrapper_decorator(self, *args, **kwargs):
         value = func(self, *args, **kwargs)
         # Do something after
+        self._dirty = True
+        self._version = getattr(self, "_version", 0) + 1
+        self._scene._dependency_graph = None
         self._notify_observers()
 
         return value
@@ -94,6 +94,7 @@ class Measurement(NodePurePython):
         return self._reference_frame
 
     @reference_frame.setter
+    @node_setter_observable
     def reference_frame(self, value : Frame or None):
         assert value is None or isinstance(value, Frame), f'Error when setting refernce_frame on {self.name}: Reference frame should be a Frame or None'
         self._reference_frame = value
@@ -136,35 +137,42 @@ class Measurement(NodePurePython):
         if self.reference == MeasurementDirection.Total:
             return None
 
-        if not self.reference.is_plane(): # not a plane, so a vector
-
+        # reference direction and direction guide in global coordinates, transformed in one go
+        if self._positive_direction_guide is not None:
+            direction, positive_direction = self._in_global(
+                [self.reference.as_vector(), self._positive_direction_guide]
+            )
+        else:
             direction = self._in_global(self.reference.as_vector())
+            positive_direction = None
+
+        if not self.reference.is_plane(): # not a plane, so a vector
 
             direction = np.dot(self.measurement_vector, direction) * direction
-            return self._apply_direction_guide(direction)
+            return self._apply_direction_guide(direction, positive_direction)
 
         # we have a plane, calculate the projection
 
-        normal = self._in_global(self.reference.as_vector())
+        normal = direction
 
         # calculate the projection of the measurement vector onto the plane (normal is a unit vector)
 
         projection = self.measurement_vector - np.dot(self.measurement_vector, normal) * normal
 
-        return self._apply_direction_guide(projection)
+        return self._apply_direction_guide(projection, positive_direction)
 
 
-    def _in_global(self, vector) -> np.ndarray:
-        """Vector in global coordinates using reference_frame (if any)"""
+    def _in_global(self, vectors) -> np.ndarray:
+        """Vector, or (N,3) array of vectors, in global coordinates using reference_frame (if any)"""
+        vectors = np.asarray(vectors, dtype=float)
         if self._reference_frame is not None:
-            return np.array(self._reference_frame.to_glob_direction(vector))
+            return self._reference_frame.to_glob_directions(vectors).reshape(vectors.shape)
         else:
-            return np.array(vector)
-
-    def _apply_direction_guide(self, vector):
-        if self._positive_direction_guide is not None:
+            return vectors
 
-            positive_direction = self._in_global(self._positive_direction_guide)
+    def _apply_direction_guide(self, vector, positive_direction):
+        """positive_direction is the positive direction guide in global coordinates (or None)"""
+        if positive_direction is not None:
 
             # make sure the direction is in the same direction as the positive direction guide
             if np.dot(vector, positive_direction) < 0:
@@ -210,6 +218,7 @@ class Measurement(NodePurePython):
         return self._reference
 
     @reference.setter
+    @node_setter_observable
     def reference(self, value : MeasurementDirection):
         if value != self._reference:
             self._reference = value
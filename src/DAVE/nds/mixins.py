@@ -459,6 +459,7 @@ class HasSubScene(HasContainer):
 
     @path.setter
     @node_setter_manageable
+    @node_setter_observable
     def path(self, value):
         self.load_subscene(value)
         self._path = value
@@ -475,11 +476,11 @@ class HasSubScene(HasContainer):
 
     def load_subscene(self, value):
         """Load the subscene into self._nodes"""
-        from ..scene import Scene
+        from ..helpers.subscene_cache import give_subscene
 
         # first see if we can load
         filename = self._scene.get_resource_path(value)
-        t = Scene(
+        t = give_subscene(
             filename=filename,
             resource_provider=self._scene.resource_provider,
         )
@@ -533,6 +534,7 @@ class HasSubScene(HasContainer):
             do_reports=False,  # do not import reports
             do_timeline=False,
             inplace_scene_modification_ok=True,
+            native=True,
         )
 
     @property
@@ -60,6 +60,7 @@ class Visual(NodePurePython, HasParentPure):
         return self._path
 
     @path.setter
+    @node_setter_observable
     def path(self, value):
         valid_value = self._scene.get_valid_resource_url(value)
 
@@ -166,6 +167,7 @@ class BallastSystem(NodePurePython, HasParentPure):
         return self._target_elevation
 
     @target_elevation.setter
+    @node_setter_observable
     def target_elevation(self, value):
         assert1f(value, "target elevation")
 
@@ -219,6 +221,67 @@ class BallastSystem(NodePurePython, HasParentPure):
                 "Could not obtain tank fillings to satisfy required condition - requesting a different draft may help"
             )
 
+    def plan(
+        self,
+        cases,
+        tolerance=0.01,
+        elevation_tolerance=0.01,
+        delta_fill=1,
+        max_iterations=10,
+        n_workers=1,
+        feedback_func=None,
+        do_terminate_func=None,
+    ):
+        """Solves the tank fills for many stages, for example the stages of a load-out sequence.
+
+        Every stage defines a target elevation for the parent and optionally property values to be applied for that
+        stage (external loads, cargo weights, etc). For each stage the fills of the non-frozen tanks are solved such
+        that the parent floats even-keel at the target elevation.
+
+        The influence of the tanks on heel, trim and elevation is determined once and re-used for all stages.
+        Optionally the stages are solved in parallel in a pool of worker processes, each holding its own copy of the
+        scene.
+
+        The scene itself is not changed.
+
+        Args:
+            cases: pandas DataFrame or list of dicts with "stage", "target_elevation" and optionally "loads"; a dict with
+                   (node-name, property-name) as key. Properties may also be given as "node.property" columns.
+            tolerance: allowable residual heel and trim [deg]
+            elevation_tolerance: allowable difference with the target elevation [m]
+            delta_fill: fill change used to determine the influence of the tanks [%]
+            max_iterations: maximum number of confirming solves per stage
+            n_workers [1]: number of worker processes, None for the number of cpus. Default is to solve all stages in
+                           this process. Worker processes require the calling script to be protected by
+                           if __name__ == "__main__" on platforms that spawn processes (Windows, macOS).
+            feedback_func: func(str), called with progress information
+            do_terminate_func: func() -> bool, return True to cancel the remaining stages
+
+        Returns:
+            (fills, report) : pandas DataFrames indexed by stage.
+            fills has a column with the fill [%] of every tank.
+            report has the target and obtained elevation, the elevation error, the residual heel and trim, whether
+            the stage converged, the number of iterations used and whether the stage was not solved because the
+            planning was terminated (do_terminate_func). Fills of stages that were not solved are NaN.
+
+        Examples:
+            >>> fills, report = bs.plan([{"stage": "lift-off", "target_elevation": -4.0, "loads": {("cargo", "mass"): 0}},
+            ...                          {"stage": "skid 50%", "target_elevation": -4.2, "cargo.mass": 500}])
+        """
+        from DAVE.helpers.ballast_plan import run_plan
+
+        return run_plan(
+            self,
+            cases,
+            tolerance=tolerance,
+            elevation_tolerance=elevation_tolerance,
+            delta_fill=delta_fill,
+            max_iterations=max_iterations,
+            n_workers=n_workers,
+            feedback_func=feedback_func,
+            do_terminate_func=do_terminate_func,
+        )
+
     def new_tank(
         self, name, position, capacity_kN, rho=1.025, frozen=False, actual_fill=0
     ):
@@ -34,6 +34,7 @@ class Component(Frame, HasSubScene):
             do_reports=False,  # do not import reports
             do_timeline=False,
             inplace_scene_modification_ok=True,
+            native=True,
         )
 
     def dissolve(self):
@@ -9,6 +9,55 @@ from vtkmodules.vtkCommonTransforms import vtkTransform
 from vtkmodules.vtkFiltersCore import vtkTriangleFilter, vtkCleanPolyData
 from vtkmodules.vtkFiltersGeneral import vtkTransformPolyDataFilter
 from vtkmodules.vtkIOGeometry import vtkOBJReader, vtkSTLReader
+from vtkmodules.util.numpy_support import vtk_to_numpy
+
+from ..helpers import mesh_cache
+
+
+def _polydata_to_arrays(data, offset, invert_normals) -> tuple[np.ndarray, np.ndarray]:
+    """Returns the vertices (N,3) and triangular faces (M,3) of vtkPolyData data as numpy arrays.
+
+    Vertices (points) and lines are skipped, of polygons only the first three points are used.
+    This is the vectorized equivalent of TriMeshSource._load_polydata_per_element.
+
+    Raises:
+        ValueError if the data can not be converted (triangle strips), use the per-element method instead.
+    """
+
+    if data.GetNumberOfStrips() > 0:
+        raise ValueError("Triangle strips are not supported")
+
+    points = data.GetPoints()
+    if points is None:
+        vertices = np.zeros((0, 3), dtype=float)
+    else:
+        vertices = vtk_to_numpy(points.GetData()).astype(float)
+        vertices += np.asarray(offset, dtype=float)
+
+    polys = data.GetPolys()
+    if polys.GetNumberOfCells() == 0:
+        return vertices, np.zeros((0, 3), dtype=int)
+
+    if hasattr(polys, "GetOffsetsArray"):  # vtk 9+
+        offsets = vtk_to_numpy(polys.GetOffsetsArray())
+        connectivity = vtk_to_numpy(polys.GetConnectivityArray())
+        starts = offsets[:-1][np.diff(offsets) >= 3]
+    else:  # legacy format [n, id0, id1, .. id_n-1, n, ...]
+        legacy = vtk_to_numpy(polys.GetData())
+        if len(legacy) % 4 != 0 or np.any(legacy[::4] != 3):
+            raise ValueError("Legacy cell-array contains non-triangular cells")
+        connectivity = legacy.reshape((-1, 4))[:, 1:].ravel()
+        starts = np.arange(0, len(connectivity), 3)
+
+    faces = np.stack(
+        (connectivity[starts], connectivity[starts + 1], connectivity[starts + 2]),
+        axis=1,
+    ).astype(int)
+
+    if invert_normals:
+        faces = faces[:, ::-1]
+
+    return vertices, faces
 
 
 class TriMeshSource:  # not an instance of Node
@@ -38,6 +87,12 @@ class TriMeshSource:  # not an instance of Node
 
         self._invert_normals = False
 
+        self._version = 0
+        """Incremented every time the mesh data changes, used by nodes to detect that the core needs to be updated"""
+
+        self._arrays = None
+        """Cached (vertices, faces) of the mesh in the core, see vertices and faces"""
+
         # These are used to store the results of the check_shape method
         # which is executed when the mesh is loaded
         # they can safely be read
@@ -55,10 +110,45 @@ class TriMeshSource:  # not an instance of Node
     def AddVertex(self, x, y, z):
         """Adds a vertex (point)"""
         self._TriMesh.AddVertex(x, y, z)
+        self._arrays = None
+        self._new_mesh = True
+        self._version += 1
 
     def AddFace(self, i, j, k):
         """Adds a triangular face between vertex numbers i,j and k"""
         self._TriMesh.AddFace(i, j, k)
+        self._arrays = None
+        self._new_mesh = True
+        self._version += 1
+
+    @property
+    def vertices(self) -> np.ndarray:
+        """Vertices of the mesh as (N,3) array (read-only) [m,m,m]
+        #NOGUI"""
+        return self._give_arrays()[0]
+
+    @property
+    def faces(self) -> np.ndarray:
+        """Faces of the mesh as (M,3) array of vertex indices (read-only)
+        #NOGUI"""
+        return self._give_arrays()[1]
+
+    def _give_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        t = self._TriMesh
+        if self._arrays is not None:
+            vertices, faces = self._arrays
+            if len(vertices) == t.nVertices and len(faces) == t.nFaces:
+                return self._arrays
+
+        self._set_arrays(*self._arrays_from_core())
+        return self._arrays
+
+    def _set_arrays(self, vertices, faces):
+        vertices = np.array(vertices, dtype=float).reshape((-1, 3))
+        faces = np.array(faces, dtype=int).reshape((-1, 3))
+        vertices.setflags(write=False)
+        faces.setflags(write=False)
+        self._arrays = (vertices, faces)
 
     def get_extends(self):
         """Returns the extends of the mesh in global coordinates
@@ -67,43 +157,29 @@ class TriMeshSource:  # not an instance of Node
 
         """
 
-        t = self._TriMesh
-
-        if t.nFaces == 0:
+        if self._TriMesh.nFaces == 0:
             return (0, 0, 0, 0, 0, 0)
 
-        v = t.GetVertex(0)
-        xn = v[0]
-        xp = v[0]
-        yn = v[1]
-        yp = v[1]
-        zn = v[2]
-        zp = v[2]
-
-        for i in range(t.nVertices):
-            v = t.GetVertex(i)
-            x = v[0]
-            y = v[1]
-            z = v[2]
-
-            if x < xn:
-                xn = x
-            if x > xp:
-                xp = x
-            if y < yn:
-                yn = y
-            if y > yp:
-                yp = y
-            if z < zn:
-                zn = z
-            if z > zp:
-                zp = z
-
-        return (xn, xp, yn, yp, zn, zp)
+        vertices = self.vertices
+        mins = vertices.min(axis=0)
+        maxs = vertices.max(axis=0)
+
+        return (
+            float(mins[0]),
+            float(maxs[0]),
+            float(mins[1]),
+            float(maxs[1]),
+            float(mins[2]),
+            float(maxs[2]),
+        )
 
     def _fromVTKpolydata(
         self, polydata, offset=None, rotation=None, scale=None, invert_normals=False
     ):
+        """Loads the mesh from the output port of a vtk poly-data source.
+
+        Returns the loaded (vertices, faces) as numpy arrays, or (None, None) if the data was loaded element by element
+        """
         tri = vtkTriangleFilter()
 
         tri.SetInputConnection(polydata)
@@ -147,7 +223,56 @@ class TriMeshSource:  # not an instance of Node
         clean.Update()
         data = clean.GetOutput()
 
+        try:
+            vertices, faces = _polydata_to_arrays(data, offset, invert_normals)
+        except ValueError:
+            vertices, faces = None, None
+
+        if vertices is None:
+            self._load_polydata_per_element(data, offset, invert_normals)
+        else:
+            self._load_arrays(vertices, faces)
+
+        self._on_mesh_loaded()
+
+        return vertices, faces
+
+    def _on_mesh_loaded(self):
+        # check if anything was loaded
+        if self._TriMesh.nFaces == 0:
+            raise Exception(
+                "No faces in poly-data - no geometry added (hint: empty obj file?)"
+            )
+        self._new_mesh = True
+        self._version += 1
+        self._scene.update()
+
+    def _arrays_from_core(self) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the vertices (N,3) and faces (M,3) as stored in the core"""
+        t = self._TriMesh
+        vertices = np.array([t.GetVertex(i) for i in range(t.nVertices)], dtype=float)
+        faces = np.array([t.GetFace(i) for i in range(t.nFaces)], dtype=int)
+        return vertices.reshape((-1, 3)), faces.reshape((-1, 3))
+
+    def _load_arrays(self, vertices, faces):
+        """Replaces the mesh by the given vertices (N,3) and faces (M,3)"""
         self._TriMesh.Clear()
+        self._set_arrays(vertices, faces)
+        vertices, faces = self._arrays
+
+        # the core only accepts one vertex or face at a time, keep the loops as tight as possible
+        add_vertex = self._TriMesh.AddVertex
+        for x, y, z in np.asarray(vertices, dtype=float).tolist():
+            add_vertex(x, y, z)
+
+        add_face = self._TriMesh.AddFace
+        for i, j, k in np.asarray(faces, dtype=int).tolist():
+            add_face(i, j, k)
+
+    def _load_polydata_per_element(self, data, offset, invert_normals):
+        """Replaces the mesh by the triangles in vtkPolyData data, cell by cell. Slow, see _polydata_to_arrays"""
+        self._TriMesh.Clear()
+        self._arrays = None
 
         for i in range(data.GetNumberOfPoints()):
             point = data.GetPoint(i)
@@ -175,14 +300,6 @@ class TriMeshSource:  # not an instance of Node
             else:
                 self._TriMesh.AddFace(id0, id1, id2)
 
-        # check if anything was loaded
-        if self._TriMesh.nFaces == 0:
-            raise Exception(
-                "No faces in poly-data - no geometry added (hint: empty obj file?)"
-            )
-        self._new_mesh = True
-        self._scene.update()
-
     def check_shape(self) -> list[str]:
         """Performs some checks on the shape in the trimesh
         - Boundary edges (edge with only one face attached)
@@ -206,15 +323,11 @@ class TriMeshSource:  # not an instance of Node
         #         vertices.append(vertex)
 
         # Make a list of all boundaries using their vertex IDs
-        boundaries = np.zeros((3 * tm.nFaces, 2), dtype=int)
-        for i in range(tm.nFaces):
-            face = tm.GetFace(i)
-            boundaries[3 * i] = [face[0], face[1]]
-            boundaries[3 * i + 1] = [face[1], face[2]]
-            boundaries[3 * i + 2] = [face[2], face[0]]
+        vertices, faces = self._give_arrays()
+        boundaries = faces[:, [0, 1, 1, 2, 2, 0]].reshape((-1, 2))
 
         # For an edge is doesn't matter in which direction it runs
-        boundaries.sort(axis=1)
+        boundaries = np.sort(boundaries, axis=1)
 
         # every boundary should be present twice
 
@@ -233,21 +346,18 @@ class TriMeshSource:  # not an instance of Node
         if n_boundary > 0:
             messages.append(f"Mesh contains {n_boundary} boundary edges")
 
-            i_boundary = np.argwhere(rows_occurance_count == 1)
-            for i in i_boundary:
-                edge = values[i][0]
-                v1 = tm.GetVertex(edge[0])
-                v2 = tm.GetVertex(edge[1])
-                boundary_edges.append((v1, v2))
+            edges = values[rows_occurance_count == 1]
+            boundary_edges = [
+                (tuple(v1), tuple(v2)) for v1, v2 in vertices[edges].tolist()
+            ]
 
         if n_nonmanifold > 0:
             messages.append(f"Mesh contains {n_nonmanifold} non-manifold edges")
-            i_boundary = np.argwhere(rows_occurance_count > 2)
-            for i in i_boundary:
-                edge = values[i][0]
-                v1 = tm.GetVertex(edge[0])
-                v2 = tm.GetVertex(edge[1])
-                non_manifold_edges.append((v1, v2))
+
+            edges = values[rows_occurance_count > 2]
+            non_manifold_edges = [
+                (tuple(v1), tuple(v2)) for v1, v2 in vertices[edges].tolist()
+            ]
 
         # if len(messages) == 2:
         #     messages.append("Boundary edges are shown in Red")
@@ -308,12 +418,57 @@ class TriMeshSource:  # not an instance of Node
             rotation:  : rotation
             scale:  scale
 
+        Loaded meshes are cached, see DAVE.helpers.mesh_cache
         """
 
         self._path = str(url)
 
         filename = str(self._scene.get_resource_path(url))
 
+        key = mesh_cache.mesh_key(filename, offset, rotation, scale, invert_normals)
+        cached = mesh_cache.get(key)
+
+        if cached is None:
+            vertices, faces = self._load_file_using_vtk(
+                filename, offset, rotation, scale, invert_normals
+            )
+        else:
+            self._load_arrays(cached.vertices, cached.faces)
+            self._on_mesh_loaded()
+
+        self._scale = scale
+        self._offset = offset
+        self._rotation = rotation
+
+        if self._scale is None:
+            self._scale = (1.0, 1.0, 1.0)
+        if self._offset is None:
+            self._offset = (0.0, 0.0, 0.0)
+        if self._rotation is None:
+            self._rotation = (0.0, 0.0, 0.0)
+        self._invert_normals = invert_normals
+
+        if cached is None:
+            self.messages = self.check_shape()
+            if vertices is None:
+                vertices, faces = self._arrays_from_core()
+            mesh_cache.put(
+                key,
+                mesh_cache.MeshCacheEntry(
+                    vertices=vertices,
+                    faces=faces,
+                    messages=list(self.messages),
+                    boundary_edges=list(self.boundary_edges),
+                    non_manifold_edges=list(self.non_manifold_edges),
+                    volume=float(self._TriMesh.Volume()),
+                ),
+            )
+        else:
+            self.messages = list(cached.messages)
+            self.boundary_edges = list(cached.boundary_edges)
+            self.non_manifold_edges = list(cached.non_manifold_edges)
+
+    def _load_file_using_vtk(self, filename, offset, rotation, scale, invert_normals):
         ext = filename.lower()[-3:]
         if ext == "obj":
             obj = vtkOBJReader()
@@ -332,7 +487,7 @@ class TriMeshSource:  # not an instance of Node
         cln = vtkCleanPolyData()
         cln.SetInputConnection(obj.GetOutputPort())
 
-        self._fromVTKpolydata(
+        return self._fromVTKpolydata(
             cln.GetOutputPort(),
             offset=offset,
             rotation=rotation,
@@ -340,20 +495,6 @@ class TriMeshSource:  # not an instance of Node
             invert_normals=invert_normals,
         )
 
-        self._scale = scale
-        self._offset = offset
-        self._rotation = rotation
-
-        if self._scale is None:
-            self._scale = (1.0, 1.0, 1.0)
-        if self._offset is None:
-            self._offset = (0.0, 0.0, 0.0)
-        if self._rotation is None:
-            self._rotation = (0.0, 0.0, 0.0)
-        self._invert_normals = invert_normals
-
-        self.messages = self.check_shape()
-
     def _load_from_privates(self):
         """(Re)Loads the mesh using the values currently stored in _scale, _offset, _rotation and _invert_normals"""
         self.load_file(
@@ -6,6 +6,7 @@
   Ruben de Bruin - 2019
 """
 
+import asyncio
 import graphlib
 import itertools
 import logging
@@ -37,6 +38,7 @@ from DAVE.settings import (
     NodePropertyInfo,
     MANAGED_NODE_IDENTIFIER,
     DAVE_NODEPROP_INFO,
+    VF_NAME_SPLIT,
 )
 
 from .exceptions import ModelInvalidException
@@ -45,6 +47,8 @@ from .nds.base import NodeSingleton
 
 from .resource_provider import DaveResourceProvider
 from .helpers.string_functions import increment_string_end, code_to_blocks
+from .helpers.solve_report import SolveReport
+from .helpers.dependency_graph import DependencyGraph
 from .nds.mixins import Manager
 
 from .tools import *
@@ -96,6 +100,28 @@ class NodeSelector:
     fixed_to: Node or str or None = None
 
 
+def _wait_for_background_solver(
+    background_solver, timeout_s=None, report: SolveReport = None, do_terminate_func=None
+) -> bool:
+    """Blocks until the background solver has finished. Returns False if the time-out passed or do_terminate_func
+    returned True first.
+
+    Polls every half millisecond, so the result is available almost immediately after the solver finished.
+    Used directly by Scene.solve_statics and from a helper thread by Scene.solve_statics_async.
+    """
+    start = datetime.datetime.now()
+    while background_solver.Running:
+        if report is not None:
+            report.sample(background_solver)
+        if do_terminate_func is not None and do_terminate_func():
+            return False
+        if timeout_s is not None:
+            if (datetime.datetime.now() - start).total_seconds() > timeout_s:
+                return False
+        sleep(0.0005)
+    return True
+
+
 class Scene:
     """
     A Scene is the main component of DAVE.
@@ -155,7 +181,11 @@ class Scene:
         """Contains a list of all nodes in the scene"""
 
         self._node_dict = {}
-        """Temporary dict of nodes and names - for internal use only"""
+        """Dict of node-name -> node for all nodes in the scene, kept in sync by add_node, delete and
+        _on_node_renamed - for internal use only"""
+
+        self._dependency_graph = None
+        """DependencyGraph that is re-used while a delete is in progress, see _give_dependency_graph - for internal use only"""
 
         self.resource_provider = resource_provider or DaveResourceProvider()
         """Resource provider for this scene, will be passed as ref to all implicitly created scenes (components etc)"""
@@ -196,6 +226,15 @@ class Scene:
         self.solver_settings = SolverSettings()
         """Settings for the solver"""
 
+        self.solution_cache: "SolutionCache" or None = None
+        """Optional cache of solved equilibria used to warm-start the solver, see DAVE.helpers.solution_cache"""
+
+        self.n_skipped_updates = 0
+        """Number of node updates skipped by update() because the node did not change (diagnostics)"""
+
+        self.last_solve_report: SolveReport or None = None
+        """Timings and convergence history of the last solve, see DAVE.helpers.solve_report"""
+
         self.errors_during_load: list[Exception] = []
         """List of errors that occurred during loading"""
 
@@ -246,6 +285,8 @@ class Scene:
             node._delete_vfc()
 
         self._nodes = []
+        self._node_dict = {}
+        self._dependency_graph = None
         del self._vfc
 
         # clear reports
@@ -397,9 +438,7 @@ class Scene:
         if name == "":
             raise ValueError("Name can not be empty")
 
-        names = [n.name for n in self._nodes]
-        names.extend(self._vfc.names)
-        if name in names:
+        if not self.name_available(name):
             raise ValueError(
                 "The name '{}' is already in use. Pick a unique name".format(name)
             )
@@ -793,36 +832,19 @@ class Scene:
     def node_by_name(self, node_name, silent=False, req_type=None):
         """Returns a node with the given name. Raises an error if no node is found."""
 
-        # For faster lookup we keep a dict with node names as keys and node indices as values
-        # (Keeping the index instead of the node itself assures that the node in indeed in the _nodes list
-        # if not then a node with the same name may be returned by accident)
-        #
-        # This has a good chance of quickly returning the node
-        # to verify that it is indeed the correct node we check the name
-        #
-        # There is nothing keeping the dict in sync with _nodes, so we rebuild it
-        # when we can not find the node that we're looking for.
+        # For faster lookup we keep a dict with node names as keys and nodes as values.
+        # This dict is kept in sync with _nodes by add_node, delete and _on_node_renamed
         #
         # req_type may be provided to help the function find the suggested node if the given node name is not available
 
-        # the quick way
-        if node_name in self._node_dict:
-            index = self._node_dict[node_name]
-            if index < len(self._nodes):
-                node = self._nodes[index]
-                if node.name == node_name:
-                    return node
+        node = self._node_dict.get(node_name, None)
+        if node is not None:
+            return node
 
         assert isinstance(
             node_name, str
         ), f"Node name should be a string, but is a {type(node_name)}"
 
-        # rebuild nodes dict
-
-        self._node_dict = {node.name: index for index, node in enumerate(self._nodes)}
-        if node_name in self._node_dict:
-            return self._nodes[self._node_dict[node_name]]  # return directly
-
         # The requested node does not exist!
 
         # # work-around for renames
@@ -959,6 +981,7 @@ class Scene:
             )
 
         self._nodes = list(ts.static_order())
+        self._dependency_graph = None
 
     def get_created_by_dict(self) -> dict:
         """Returns a dictionary containing the nodes created by each manager.
@@ -970,21 +993,27 @@ class Scene:
         See Also: get_implicitly_created_nodes
         """
 
+        # A manager always manages the nodes that it creates, so only the managed nodes need to be checked
+        managed = dict()
+        for node in self._nodes:
+            if node.manager is not None:
+                managed.setdefault(node.manager, []).append(node)
+
         creates = dict()
+        created_by = dict()
         for node in self._nodes:
             if isinstance(node, Manager):
                 c = []
-                for n in self._nodes:
+                for n in managed.get(node, ()):
                     if node.creates(n):
                         c.append(n)
 
                         # check if not already created by another manager
-                        for k, v in creates.items():
-                            for vnode in v:
-                                if vnode == n:
-                                    raise Exception(
-                                        f"Node {n} is already created by {k} , can not be created by {node} as well"
-                                    )
+                        if n in created_by:
+                            raise Exception(
+                                f"Node {n} is already created by {created_by[n]} , can not be created by {node} as well"
+                            )
+                        created_by[n] = node
 
                 if c:
                     # print(f"Manager {node.name} creates:")
@@ -1016,74 +1045,47 @@ class Scene:
 
         self.assert_unique_names()
 
-        exported = []
-        to_be_exported = self._nodes.copy()
-        counter = 0
-
-        originally_present = tuple(to_be_exported)  # for check
+        originally_present = tuple(self._nodes)  # for check
 
         # Some of the nodes are created by another node in this list.
-        # Remove those nodes from the to_be_exported list and add
-        # them to exported when the node that creates them is exported
+        # Those are placed directly after the node that creates them.
 
         # create a dict "creates" that contains the nodes that are created by a manager as values of the manager as key.
 
         creates = self.get_created_by_dict()
 
-        for v in creates.values():
-            for node in v:
-                to_be_exported.remove(node)
-
-        # Move from the to_be_exported list to the exported list when all dependencies are exported
-
-        while to_be_exported:
-            counter += 1
-            if counter > len(self._nodes):
-                print("Error when exporting, could not resolve dependencies:")
-
-                for node in to_be_exported:
-                    print(f"Node : {node.name}")
-                    for d in node.depends_on():
-                        print(f"  depends on: {d.name}")
-                    if node._manager:
-                        print(f"   managed by: {node._manager.name}")
-                    if node in node.depends_on():
-                        raise Exception(
-                            f"Node {node.name} depends on itself - that is not possible"
-                        )
-
-                raise Exception(
-                    "Could not sort nodes by dependency, circular references exist?"
-                )
+        # Sort such that nodes are placed after all their dependencies, linear in the number of nodes and dependencies
 
-            can_be_exported = []
+        exported = self._give_dependency_graph().topological_order(creates)
 
-            for node in to_be_exported:
-                if all(el in exported for el in node.depends_on()):
-                    can_be_exported.append(node)
+        if len(exported) != len(originally_present):
+            print("Error when exporting, could not resolve dependencies:")
 
-            # remove exported nodes from
-            for n in can_be_exported:
-                to_be_exported.remove(n)
-
-            # check for nodes that are created by the can_be_exported nodes
-            #   and then recursively check on the nodes created by those nodes as well
-
-            def expand_by_using_creates(node):
-                nodes = [node]
-                if node in creates:
-                    for created_node in creates[node]:
-                        nodes.extend(expand_by_using_creates(created_node))
-                return nodes
+            exported_set = set(exported)
+            for node in originally_present:
+                if node in exported_set:
+                    continue
+                print(f"Node : {node.name}")
+                for d in node.depends_on():
+                    print(f"  depends on: {d.name}")
+                if node._manager:
+                    print(f"   managed by: {node._manager.name}")
+                if node in node.depends_on():
+                    raise Exception(
+                        f"Node {node.name} depends on itself - that is not possible"
+                    )
 
-            for node in can_be_exported:
-                exported.extend(expand_by_using_creates(node))
+            raise Exception(
+                "Could not sort nodes by dependency, circular references exist?"
+            )
 
         # self-check
+        exported_set = set(exported)
         for n in originally_present:
-            assert n in exported, f"Node {n.name} got lost during the sorting process"
+            assert n in exported_set, f"Node {n.name} got lost during the sorting process"
 
         self._nodes = exported  # set the sorted list
+        self._dependency_graph = None
 
     def assert_name_available(self, name):
         """Raises an error is name is not available"""
@@ -1091,29 +1093,55 @@ class Scene:
 
     @property
     def node_names(self) -> tuple:
-        """Returns a tuple of all node names"""
-        return tuple([n.name for n in self._nodes])
+        """Returns a tuple of all node names, in the order of the nodes in the scene"""
+        return tuple(n.name for n in self._nodes)
 
     def name_available(self, name):
         """Returns True if the name is still available. See Also: node_exists"""
-        names = [n.name for n in self._nodes]
-        names.extend(self._vfc.names)
-        return not (name in names)
+        if name in self._node_dict:
+            return False
+
+        # Core elements that are not nodes (cogs, point-masses, etc) are named <node-name><VF_NAME_SPLIT><something>
+        # so only names containing VF_NAME_SPLIT need to be checked against the core.
+        if isinstance(name, str) and VF_NAME_SPLIT in name:
+            return name not in self._vfc.names
+
+        return True
 
     def node_exists(self, name_or_node):
         """Returns True if a node with this name exists. See Also: name_available"""
         if isinstance(name_or_node, Node):
-            return name_or_node in self._nodes
+            return self._node_dict.get(name_or_node.name, None) is name_or_node
         else:
             return not self.name_available(name_or_node)
 
     def add_node(self, node):
         """Adds a node to the scene"""
-        # called by base constructor, name property may not be set yet hence supplied separately
-        assert node.name not in [
-            node.name for node in self._nodes
-        ], f"Node with name {node.name} already exists in the scene"
+        # called by base constructor
+        assert (
+            node.name not in self._node_dict
+        ), f"Node with name {node.name} already exists in the scene"
         self._nodes.append(node)
+        self._node_dict[node.name] = node
+        self._dependency_graph = None
+
+    def _give_dependency_graph(self) -> DependencyGraph:
+        """Returns the reverse dependencies of all nodes in the scene.
+
+        The graph is built in a single pass over all nodes. It is only kept while a delete is in progress (see delete),
+        then it is re-used for all nodes that are deleted. Outside a delete a new graph is built on every call because
+        dependencies can also be changed without using a node property (for example ballast_system.tanks.append).
+        So only use this for operations that would otherwise need a scan per node (sorting, recursive queries).
+        """
+        if self._dependency_graph is not None:
+            return self._dependency_graph
+        return DependencyGraph(self._nodes)
+
+    def _on_node_renamed(self, node, old_name):
+        """Called by the name setter of node after its name has been changed from old_name"""
+        if self._node_dict.get(old_name, None) is node:
+            del self._node_dict[old_name]
+        self._node_dict[node.name] = node
 
     def available_name_like(self, like, _additional_names=()):
         """Returns an available name like the one given, for example Axis23
@@ -1195,8 +1223,7 @@ class Scene:
                 names = self._vfc.elements_depending_directly_on(node_name)
 
             # filter to only the nodes that are in the scene (remove pointmasses etc)
-            nodes_names_in_scene = self.node_names
-            r = [n for n in names if n in nodes_names_in_scene]
+            r = [n for n in names if n in self._node_dict]
 
         # check all other nodes in the scene
         #
@@ -1205,8 +1232,17 @@ class Scene:
         #
         # This is only a single pass as there are no nodes depending on a node that is not core-connected
 
-        dependants_and_self = r.copy()
-        dependants_and_self.append(node_name)
+        dependants_and_self = [self._node_dict[name] for name in r]
+        dependants_and_self.append(_node)
+        lookup = set(dependants_and_self)
+
+        graph = self._dependency_graph
+        if graph is not None:  # delete in progress, only visit the dependants
+            for n in graph.direct_dependants(dependants_and_self):
+                for pre in graph.depends_on[n]:
+                    if pre in lookup:
+                        r.append(n.name)
+            return r
 
         for n in self._nodes:
             try:
@@ -1217,10 +1253,9 @@ class Scene:
                     + ":"
                     + str(E)
                 )
-            nodes_names = [node.name for node in nodes]
 
-            for pre in nodes_names:
-                if pre in dependants_and_self:
+            for pre in nodes:
+                if pre in lookup:
                     r.append(n.name)
 
         return r
@@ -1323,8 +1358,14 @@ class Scene:
         if isinstance(node, str):
             node = self[node]
 
-        r = []
+        if recursive:
+            # a single pass over all nodes instead of a scan per node of the branch
+            return self._give_dependency_graph().descendants(node)
 
+        if self._dependency_graph is not None:
+            return list(self._dependency_graph.children.get(node, ()))
+
+        r = []
         for n in self._nodes:
             try:
                 parent = n.parent
@@ -1334,12 +1375,6 @@ class Scene:
             if parent == node:
                 r.append(n)
 
-        if recursive:
-            more = []
-            for n in r:
-                more.extend(self.nodes_with_parent(n, recursive=True))
-            r.extend(more)
-
         return r
 
     def nodes_with_dependencies_in_and_satifsfied_by(self, nodes):
@@ -1521,16 +1556,31 @@ class Scene:
         if isinstance(node, str):
             node = self[node]
 
-        if node not in self._nodes:
+        if not self.node_exists(node):
             raise ValueError(
                 "Can not delete node because it is not a node of this scene"
             )
 
+        # Deleting a node typically deletes a whole branch of nodes,
+        # build the dependency graph once and re-use it for all of them
+        outer = self._dependency_graph is None
+        if outer:
+            self._dependency_graph = DependencyGraph(self._nodes)
+
+        try:
+            self._delete(node)
+        finally:
+            if outer:
+                self._dependency_graph = None
+
+    def _delete(self, node):
+        """See delete"""
+
         if node._manager:  # managed node, delete its manager
             self.delete(node._manager)
 
             # after deleting the manager, the node itself may still be here but now un-managed
-            if node in self._nodes:
+            if self.node_exists(node):
                 self.delete(node)
             return
 
@@ -1564,6 +1614,7 @@ class Scene:
                 if node in dep_node.tanks:
                     dep_node.tanks.remove(node)
                     depending_nodes.remove(dep)
+                    self._dependency_graph = None  # tanks changed without setter
 
             elif isinstance(dep_node, ContactBall):
                 if node in dep_node.meshes:
@@ -1579,6 +1630,9 @@ class Scene:
 
         # then remove the vtk node itself
         # self._print('removing vfc node')
+        if self._dependency_graph is not None:
+            self._dependency_graph.remove(node)
+        self._node_dict.pop(node.name, None)
         node.invalidate()
         node._delete_vfc()
         self._nodes.remove(node)
@@ -1882,9 +1936,16 @@ class Scene:
     def update(self):
         """Updates the interface between the nodes and the core. This includes the re-calculation of all forces,
         buoyancy positions, ballast-system cogs etc.
+
+        Nodes that did not change since the previous update are skipped (see Node._needs_update), the number of
+        skipped node updates is counted in n_skipped_updates. Nodes without an update are not counted.
         """
         for n in self._nodes:
-            n.update()
+            if n._needs_update():
+                n.update()
+                n._dirty = False
+            elif n._has_update():
+                self.n_skipped_updates += 1
         self._vfc.state_update()
 
     def _solve_statics_with_optional_control(
@@ -1901,28 +1962,87 @@ class Scene:
 
         feedback_func     : func(str)
         do_terminate_func : func() -> bool
+
+        A SolveReport with timings and convergence history is stored in self.last_solve_report
+        """
+
+        report = SolveReport()
+        self.last_solve_report = report
+
+        try:
+            result = self._solve_statics_and_report(
+                report, feedback_func=feedback_func, do_terminate_func=do_terminate_func
+            )
+            report.converged = result
+            report.terminated = not result
+            return result
+        finally:
+            report.finish()
+
+    def _solve_statics_and_report(
+        self, report: SolveReport, feedback_func=None, do_terminate_func=None
+    ):
+        """See _solve_statics_with_optional_control. Blocks while the background solver is running"""
+
+        steps = self._solve_statics_steps(report, feedback_func)
+        try:
+            request = next(steps)
+            while True:
+                background_solver, remaining = request
+                finished = _wait_for_background_solver(
+                    background_solver, remaining, report, do_terminate_func
+                )
+
+                # terminated while waiting, or right after the solver finished
+                if do_terminate_func is not None and do_terminate_func():
+                    background_solver.Stop()
+                    settings.SOLVER_TERMINATED_SCENE = self
+                    print("Terminating solver")
+                    return False
+
+                request = steps.send(finished)
+        except StopIteration as result:
+            return result.value
+        finally:
+            steps.close()
+
+    def _solve_statics_steps(self, report: SolveReport, feedback_func=None):
+        """The steps of solving statics, shared by the blocking (_solve_statics_and_report) and the asyncio
+        (solve_statics_async) api. Only the waiting for the background solver differs between those.
+
+        This is a generator. Whenever a background solver has been started it yields
+        (background solver, remaining time in seconds or None). The caller waits till the solver has finished and
+        sends back True, or False if the time-out passed first. To terminate, the caller stops the background solver
+        and closes the generator.
+
+        Returns (as value of StopIteration) True if solved.
         """
 
-        self.update()  # <-- needed to get the correct initial state including number of DOFs
+        with report.phase("update"):
+            self.update()  # <-- needed to get the correct initial state including number of DOFs
 
-        if self._vfc.n_dofs() == 0:  # check for the trivial case
+        report.n_dofs = self._vfc.n_dofs()
+        if report.n_dofs == 0:  # check for the trivial case
             return True
 
-        # Two quick helper functions for running in controlled mode
         def give_feedback(txt):
             if feedback_func is not None:
                 feedback_func(txt)
 
-        def should_terminate():
-            if do_terminate_func is not None:
-                return do_terminate_func()
-            else:
-                return False
-
         start_time = datetime.datetime.now()
 
+        cache = self.solution_cache
+        if cache is not None:
+            with report.phase("update"):
+                in_equilibrium = self.verify_equilibrium()
+            if not in_equilibrium:
+                cache.warm_start(self)
+
         while True:  # only stop when we are completely happy or when the user cancels
-            if not self.verify_equilibrium():  # does update
+            with report.phase("update"):
+                in_equilibrium = self.verify_equilibrium()
+
+            if not in_equilibrium:
                 # Scene is not in equilibrium
                 # construct a background solver
                 # start it
@@ -1932,66 +2052,59 @@ class Scene:
 
                 self.solver_settings.apply(BackgroundSolver)
 
-                started = BackgroundSolver.Start()
-
-                sleep_time = 0.001  # start with a millisecond
+                if BackgroundSolver.Start():
+                    report.solver_started()
 
-                if started:
-                    while BackgroundSolver.Running:
-                        if should_terminate():
-                            BackgroundSolver.Stop()
-                            settings.SOLVER_TERMINATED_SCENE = self
-                            print("Terminating solver")
-                            return False
-
-                        # check if time has passed
+                    if self.solver_settings.timeout_s >= 0:
                         time_diff = datetime.datetime.now() - start_time
-                        secs = time_diff.total_seconds()
-                        if (
-                            self.solver_settings.timeout_s >= 0
-                            and secs > self.solver_settings.timeout_s
-                        ):
-                            BackgroundSolver.Stop()
+                        remaining = (
+                            self.solver_settings.timeout_s - time_diff.total_seconds()
+                        )
+                    else:
+                        remaining = None
 
-                            raise ValueError(
-                                f"Solver maximum time of {self.solver_settings.timeout_s} exceeded - set terminate_after_s to change the allowed time for the solver."
-                            )
+                    finished = yield BackgroundSolver, remaining
 
-                        sleep(sleep_time)  # sleep for a millisecond
-                        sleep_time *= 1.1  # increase sleep time
-                        sleep_time = min(sleep_time, 0.1)  # but not more than 100ms
+                    report.solver_finished(BackgroundSolver)
+
+                    if not finished:
+                        BackgroundSolver.Stop()
+                        raise ValueError(
+                            f"Solver maximum time of {self.solver_settings.timeout_s} exceeded - set terminate_after_s to change the allowed time for the solver."
+                        )
 
-                    # Background solver is done and
                     info = f"Converged within tolerance of {BackgroundSolver.tolerance} with E : {BackgroundSolver.Enorm:.6e}(norm) / {BackgroundSolver.Emaxabs:.6e}(max-abs) in {BackgroundSolver.Emaxabs_where}"
 
                     give_feedback(info)
                     logging.info(info)
 
-                # check again - maybe we terminated during the sleep time
-                if should_terminate():
-                    print("Terminating after all")
-                    settings.SOLVER_TERMINATED_SCENE = self
-                    return False
-
                 copy_ok = BackgroundSolver.CopyStateTo(self._vfc)
                 if not copy_ok:
                     raise ValueError(
                         "Solver self-check failed: Could not copy state from background solver - was the source-scene modified during solving?"
                     )
 
-                self.update()
+                with report.phase("update"):
+                    self.update()
+                    in_equilibrium = self.verify_equilibrium()
 
                 assert (
-                    self.verify_equilibrium()
+                    in_equilibrium
                 ), "Solver self-check failed: Equilibrium not reached after solving"
 
             else:
                 pass  # already in equilibrium
 
             # check is geometric contacts are satisfied
-            work_done, messages = self._check_and_fix_geometric_contact_orientations()
+            with report.phase("geometric_contacts"):
+                (
+                    work_done,
+                    messages,
+                ) = self._check_and_fix_geometric_contact_orientations()
 
             if not work_done:  # contacts are satisfied
+                if cache is not None:
+                    cache.store(self)
                 return True  # <--- This is the exit
 
             # exit if time has passed
@@ -2005,6 +2118,8 @@ class Scene:
                     f"Solver maximum time of {self.solver_settings.timeout_s}s exceeded, solver converged but geometric contacts not satisfied - set terminate_after_s to change the allowed time for the solver."
                 )
 
+            report.n_geometric_contact_rounds += 1
+
             give_feedback(
                 "Geometric contacts not satisfied, correcting and trying again"
             )
@@ -2030,6 +2145,65 @@ class Scene:
         else:
             return self._solve_statics_with_optional_control()
 
+    async def solve_statics_async(self, feedback_func=None):
+        """Solves statics without blocking the asyncio event loop.
+
+        The background solver runs in the core, completion is awaited through a future that is resolved from a
+        helper thread. This allows solving multiple scenes concurrently from a single event-loop.
+
+        Solver settings are taken from self.solver_settings, including the time-out.
+        Cancelling the task (for example by asyncio.wait_for) stops the background solver.
+
+        A SolveReport is stored in self.last_solve_report.
+
+        Args:
+            feedback_func : func(str), optional
+
+        Returns:
+            bool: True if successful
+
+        Examples:
+            >>> results = await asyncio.gather(s1.solve_statics_async(), s2.solve_statics_async())
+            >>> ok = await asyncio.wait_for(s.solve_statics_async(), timeout=10)
+        """
+
+        report = SolveReport()
+        self.last_solve_report = report
+
+        try:
+            result = await self._solve_statics_async_and_report(report, feedback_func)
+            report.converged = result
+            return result
+        finally:
+            report.finish()
+
+    async def _solve_statics_async_and_report(self, report, feedback_func=None):
+        """See solve_statics_async. Waits for the background solver in a helper thread"""
+
+        steps = self._solve_statics_steps(report, feedback_func)
+        try:
+            request = next(steps)
+            while True:
+                background_solver, remaining = request
+                try:
+                    finished = await asyncio.to_thread(
+                        _wait_for_background_solver,
+                        background_solver,
+                        remaining,
+                        report,
+                    )
+                except asyncio.CancelledError:
+                    background_solver.Stop()
+                    settings.SOLVER_TERMINATED_SCENE = self
+                    report.terminated = True
+                    raise
+
+                request = steps.send(finished)
+        except StopIteration as result:
+            return result.value
+        finally:
+            steps.close()
+
     def verify_equilibrium(self, tol=None):
         """Checks if the current state is an equilibrium
 
@@ -2224,6 +2398,54 @@ class Scene:
 
         return (xs, y)
 
+    def sweep(
+        self,
+        parameters: dict,
+        evaluate: list,
+        n_workers=1,
+        batch_size=None,
+        feedback_func=None,
+        do_terminate_func=None,
+    ) -> "pd.DataFrame":
+        """Solves statics for all combinations of the given parameter values and evaluates the requested properties.
+
+        Optionally the cases are solved in parallel in a pool of worker processes, each holding its own copy of the
+        scene. Every case is started from the solved DOFs of the nearest case that was already solved (by that worker).
+
+        The scene itself is not changed.
+
+        Args:
+            parameters: dict with (node-name, property-name) as key and a sequence of values as value
+            evaluate: list of (node-name, property-name) to be evaluated for each case
+            n_workers [1]: number of worker processes, None for the number of cpus. Default is to solve all cases in
+                           this process. Worker processes require the calling script to be protected by
+                           if __name__ == "__main__" on platforms that spawn processes (Windows, macOS).
+            batch_size [None]: number of cases per job sent to a worker
+            feedback_func: func(str), called with progress information
+            do_terminate_func: func() -> bool, return True to cancel the remaining cases
+
+        Returns:
+            pandas DataFrame with a column per parameter (named "node.property"), a "converged" column and a column per
+            evaluated property. Properties of cases that did not converge (or were cancelled) are NaN.
+
+        Examples:
+            >>> df = s.sweep({("cable", "length"): np.linspace(10, 12, 21),
+            ...               ("hook", "z"): [20, 25, 30]},
+            ...              evaluate=[("cable", "tension"), ("hook", "gz")])
+
+        """
+        from .helpers.sweep import run_sweep
+
+        return run_sweep(
+            self,
+            parameters=parameters,
+            evaluate=evaluate,
+            n_workers=n_workers,
+            batch_size=batch_size,
+            feedback_func=feedback_func,
+            do_terminate_func=do_terminate_func,
+        )
+
     # ======== reports =========
 
     def _validate_reports(self):
@@ -4076,6 +4298,9 @@ class Scene:
 
         If no path is present in the file-name then the model will be saved in the last (lowest) resource-path (if any)
 
+        If the filename ends with .daveb then a binary snapshot is saved instead of python code. Snapshots load
+        much faster but are not human-readable. See DAVE.io.snapshot.
+
         Args:
             filename : filename or file-path to save the file. Default extension is .dave
             do_reports : save reports as well
@@ -4086,12 +4311,10 @@ class Scene:
 
         """
 
-        code = self.give_python_code(do_reports=do_reports, do_timeline=do_timeline)
-
         filename = Path(filename)
 
         # add .dave extension if needed
-        if filename.suffix != ".dave":
+        if filename.suffix not in (".dave", ".daveb"):
             filename = Path(str(filename) + ".dave")
 
         # add path if not provided
@@ -4106,9 +4329,20 @@ class Scene:
         if not directory.exists():
             directory.mkdir()
 
-        f = open(filename, "w+")
-        f.write(code)
-        f.close()
+        if filename.suffix == ".daveb":
+            from .io.snapshot import save_snapshot
+
+            save_snapshot(
+                self, filename, do_reports=do_reports, do_timeline=do_timeline
+            )
+        else:
+            code = self.give_python_code(
+                do_reports=do_reports, do_timeline=do_timeline
+            )
+
+            f = open(filename, "w+")
+            f.write(code)
+            f.close()
 
         self._print("Saved as {}".format(filename))
 
@@ -4245,6 +4479,8 @@ class Scene:
         Filename is appended with .dave if needed.
         File is searched for in the resource-paths.
 
+        Files ending with .daveb are loaded as binary snapshot (see save_scene).
+
         See also: import scene"""
 
         if filename is None:
@@ -4253,11 +4489,20 @@ class Scene:
         try:
             filename = self.get_resource_path(filename)
         except:
-            if not str(filename).endswith(".dave"):
+            if not str(filename).endswith((".dave", ".daveb")):
                 filename = Path(str(filename) + ".dave")
 
         print("Loading {}".format(filename))
 
+        if str(filename).endswith(".daveb"):
+            from .io.snapshot import load_snapshot
+
+            try:
+                load_snapshot(self, filename)
+            except Exception as M:
+                raise ModelInvalidException(M)
+            return
+
         f = open(file=filename, mode="r")
         code = ""
         for line in f:
@@ -4283,6 +4528,7 @@ class Scene:
         do_reports=True,
         do_timeline=True,
         inplace_scene_modification_ok=False,
+        native=False,
     ):
         """Copy-paste all nodes of scene "other" into current scene.
 
@@ -4298,6 +4544,7 @@ class Scene:
             allow_errors_during_load : if True then errors during loading are ignored
             do_reports   : do import reports
             do_timeline  : do import timelines
+            native       : copy the nodes directly instead of exporting and running python code (see helpers.scene_clone)
 
         Returns:
             Contained (Frame) : if the imported scene is containerized then a reference to the created container is returned.
@@ -4351,24 +4598,47 @@ class Scene:
                     )
                 )
 
-        store_export_code_with_solved_function = other._export_code_with_solved_function
-        other._export_code_with_solved_function = False  # quicker
-        code = other.give_python_code(
-            nodes=nodes,
-            export_environment_settings=settings,
-            state_only=quick,
-            do_reports=do_reports,
-            do_timeline=do_timeline,
-        )
-        other._export_code_with_solved_function = store_export_code_with_solved_function
+        if native:
+            from .helpers.scene_clone import describe_scene, build_scene
 
-        try:
-            self.run_code(
-                code, continue_on_errors=False
-            )  # we just generated this code, so it should be fine
+            try:
+                build_scene(
+                    self,
+                    describe_scene(
+                        other,
+                        nodes=nodes,
+                        quick=quick,
+                        do_reports=do_reports,
+                        do_timeline=do_timeline,
+                        export_environment_settings=settings,
+                    ),
+                )
+            except Exception as M:
+                raise ModelInvalidException(M)
 
-        except Exception as M:
-            raise ModelInvalidException(M)
+        else:
+            store_export_code_with_solved_function = (
+                other._export_code_with_solved_function
+            )
+            other._export_code_with_solved_function = False  # quicker
+            code = other.give_python_code(
+                nodes=nodes,
+                export_environment_settings=settings,
+                state_only=quick,
+                do_reports=do_reports,
+                do_timeline=do_timeline,
+            )
+            other._export_code_with_solved_function = (
+                store_export_code_with_solved_function
+            )
+
+            try:
+                self.run_code(
+                    code, continue_on_errors=False
+                )  # we just generated this code, so it should be fine
+
+            except Exception as M:
+                raise ModelInvalidException(M)
 
         # Move all imported elements without a parent into a newly created or supplied frame (container)
         if containerize:
@@ -4403,12 +4673,13 @@ class Scene:
                     if node.manager.is_property_change_allowed(node, "name"):
                         node.name = prefix + node.name
 
-    def copy(self, nodes=None, quick=False):
+    def copy(self, nodes=None, quick=False, native=True):
         """Creates a full and independent copy of the scene and returns it.
 
         Args:
             nodes [None]  : copy only these nodes
             quick [False] : copy only the scene itself - for solving DOFs in separate threads
+            native [True] : copy the nodes directly instead of exporting and running python code (see helpers.scene_clone)
 
         Example:
             s = Scene()
@@ -4422,6 +4693,16 @@ class Scene:
             resource_provider=copy_resource_provider,
         )
 
+        if native:
+            from .helpers.scene_clone import clone_into
+
+            try:
+                clone_into(self, c, nodes=nodes, quick=quick)
+            except Exception as M:
+                raise ModelInvalidException(M)
+
+            return c
+
         c.import_scene(
             self,
             containerize=False,
@@ -173,6 +173,12 @@ VF_NAME_SPLIT = "-->"  # used for node-names, eg:    Body23-->Cog
 
 MANAGED_NODE_IDENTIFIER = "/"  # used for managed nodes, eg: SlingSL1242>>>eyeA
 
+# ========== Mesh cache ==============
+# see DAVE.helpers.mesh_cache
+
+MESH_CACHE_MAX_ENTRIES = 64  # number of loaded meshes that are kept in memory
+MESH_CACHE_DISK_PATH = None  # set to a folder to keep loaded meshes on disk (.npz) as well, None to disable
+
 
 """
 
@@ -88,6 +88,19 @@ class ViewportSettings:
     # geometry
     geometry_scale: float = 1.0  # poi radius of the pois and axis  - setting this scale to zero hides all geometry
 
+    # cables
+    merge_cables: bool = False  # draw all cable tubes as a single actor. Fast for many cables, but cables can not be picked
+
+    # visuals
+    instance_visuals: bool = False  # draw Visuals that use the same file as a single actor. Those can not be picked
+
+    # level of detail of large meshes (Visuals, Buoyancy, ContactMesh, Tank), see visual_helpers.lod
+    lod_enabled: bool = True
+    lod_min_triangles: int = 100_000  # meshes with fewer triangles are always drawn at full resolution
+    lod_reductions: tuple = (0.75, 0.95)  # fraction of the triangles that is removed for level 1, 2, ...
+    lod_screen_sizes: tuple = (400, 100)  # use level i if the mesh is smaller than lod_screen_sizes[i-1] pixels
+    lod_when_interacting: bool = True  # use the coarsest level while the camera is being moved
+
     outline_width: float = (
         OUTLINE_WIDTH  # line-width of the outlines (cell-like shading)
     )
@@ -7,6 +7,7 @@ The appearance of a visual may change when it is selected. This is handled by se
 
 from copy import copy
 import logging
+from time import perf_counter
 
 import numpy as np
 
@@ -17,6 +18,7 @@ import DAVE.nodes as dn
 from DAVE.visual_helpers.constants import *
 
 from DAVE.settings_visuals import ViewportSettings, COLOR_SELECT_255
+from DAVE.visual_helpers.cable_tubes import CableTube
 from DAVE.visual_helpers.vtkActorMakers import (
     Cylinder,
     Sphere,
@@ -28,7 +30,6 @@ from DAVE.visual_helpers.vtkActorMakers import (
 from DAVE.visual_helpers.vtkHelpers import (
     apply_parent_translation_on_transform,
     SetTransformIfDifferent,
-    create_tube_data,
     update_line_to_points,
     SetMatrixIfDifferent,
     mat4x4_from_point_on_frame,
@@ -69,6 +70,8 @@ class VisualActor:
 
         self.info = None  # Holder for additional info
 
+        self._geometry_key = None  # change-key of the last geometry update, see update_geometry
+
     @property
     def center_position(self):
         return self.actors["main"].GetCenter()
@@ -385,7 +388,11 @@ class VisualActor:
 
     def update_geometry(self, viewport):
         """Updates the geometry of the actors to the current state of the node.
-        This includes moving as well as changing meshes and volumes"""
+        This includes moving as well as changing meshes and volumes.
+
+        The work is done by the updater registered for the type of the node (see geometry_updater). If that updater
+        has a change-key and the key did not change since the last update, then nothing is done.
+        """
 
         # # update label name if needed
         # label_text = getattr(self.node, viewport.settings.label_property, "")
@@ -394,706 +401,889 @@ class VisualActor:
         #     label_text
         # )  # does not do anything if the label-name is unchanged
 
-        # the following ifs all end with Return, so only a single one is executed
-
         if not self.node.is_valid:
             return
 
-        if isinstance(self.node, dn.Visual):
-            # A = self.actors["main"]
-            for A in self.actors.values():
+        updater, change_key = _resolve_updater(type(self.node))
+        if updater is None:
+            return
 
-                t = vtkTransform()
-                t.Identity()
-                t.PostMultiply()
+        tic = perf_counter()
+        timing = UPDATE_TIMINGS.setdefault(type(self.node).__name__, [0, 0, 0.0])
 
-                t.Scale(self.node.scale)
+        if change_key is not None:
+            key = change_key(self.node, viewport)
+            if key == self._geometry_key:
+                timing[1] += 1
+                timing[2] += perf_counter() - tic
+                return
+        else:
+            key = None
 
-                # calculate wxys from node.rotation
-                r = self.node.rotation
-                angle = (r[0] ** 2 + r[1] ** 2 + r[2] ** 2) ** (0.5)
-                if angle > 0:
-                    t.RotateWXYZ(angle, r[0] / angle, r[1] / angle, r[2] / angle)
+        updater(self, viewport)
+        self._geometry_key = key
 
-                t.Translate(self.node.offset)
+        timing[0] += 1
+        timing[2] += perf_counter() - tic
 
-                # Get the parent matrix (if any)
-                if self.node.parent is not None:
-                    apply_parent_translation_on_transform(self.node.parent, t)
+    def invalidate_geometry(self):
+        """Forces the next update_geometry to update the actors, also if the node did not move"""
+        self._geometry_key = None
 
-                SetTransformIfDifferent(A, t)
 
-            return
+# ======== Geometry updaters ========
+#
+# update_geometry dispatches to the function registered for the type of the node (or the nearest base-class).
+#
+# An updater may come with a change-key function: key(node, viewport) -> tuple.
+# The key is evaluated on every update and shall be cheap compared to the update itself. It shall change whenever the
+# actors need to be updated, typically it contains the global transform of the node or its parent and the
+# viewport settings that are used by the updater. Updaters without a change-key are executed on every update, these
+# are the nodes whose visual depends on the solved state (cables, forces, meshes, ...); most of them have their own
+# checks.
 
-        if isinstance(self.node, dn.Circle):
-            A = self.actors["main"]
+_UPDATERS = dict()  # node type -> (updater, change_key)
+_RESOLVED_UPDATERS = dict()  # type(node) -> (updater, change_key), cache for _resolve_updater
 
-            t = vtkTransform()
-            t.Identity()
+UPDATE_TIMINGS = dict()
+"""Profiling counters of update_geometry: name of node type -> [n_updated, n_skipped, total time [s]]"""
 
-            # scale to flat disk
-            thickness = (
-                (self.node.draw_stop - self.node.draw_start) / 2
-                if self.node.is_roundbar
-                else 0.1
-            )
 
-            if self.node.is_roundbar:
-                move = (self.node.draw_start + self.node.draw_stop) / 2
-                t.Translate(0, 0, move)
+def geometry_updater(node_type, change_key=None):
+    """Decorator registering an updater function(visual, viewport) for nodes of node_type (and derived types)"""
 
-            t.Scale(self.node.radius, self.node.radius, thickness)
+    def register(func):
+        _UPDATERS[node_type] = (func, change_key)
+        _RESOLVED_UPDATERS.clear()
+        return func
 
-            # rotate z-axis (length axis of cylinder) is direction of axis
-            axis = np.asarray(self.node.axis) / np.linalg.norm(self.node.axis)
-            z = (0, 0, 1)
-            rot_axis = np.cross(z, axis)
-            rot_dot = np.dot(z, axis)
-            if rot_dot > 1:
-                rot_dot = 1
-            if rot_dot < -1:
-                rot_dot = -1
+    return register
 
-            angle = np.arccos(rot_dot)
 
-            t.PostMultiply()
-            t.RotateWXYZ(np.rad2deg(angle), rot_axis)
+def _resolve_updater(node_type):
+    try:
+        return _RESOLVED_UPDATERS[node_type]
+    except KeyError:
+        pass
 
-            t.Translate(self.node.parent.position)
+    found = (None, None)
+    for base in node_type.__mro__:
+        if base in _UPDATERS:
+            found = _UPDATERS[base]
+            break
 
-            # Get the parent matrix (if any)
-            if self.node.parent.parent is not None:
-                apply_parent_translation_on_transform(self.node.parent.parent, t)
+    _RESOLVED_UPDATERS[node_type] = found
+    return found
 
-            SetTransformIfDifferent(A, t)
 
-            return
+def reset_update_timings():
+    UPDATE_TIMINGS.clear()
 
-        if isinstance(self.node, dn.WindOrCurrentArea):
-            self.actors["main"].SetScale(np.sqrt(self.node.A))
-            return
 
-        if isinstance(self.node, dn.Cable):
-            # # check the number of points
-            A = self.actors["main"]
-
-            points, tensions = self.node.get_points_and_tensions_for_visual()
-
-            # get cable scale from painter settings
-            ps = viewport.settings.painter_settings
-            min_dia = ps["Cable"]["main"].optionalScale
-
-            diameter = self.node.diameter
-            diameter = max(diameter, min_dia)
-
-            # check if anything has changed before updating
-            old_points = getattr(A, "_actual_points", None)
-            old_diameter = getattr(A, "_actual_diameter", None)
-            old_tensions = getattr(A, "_actual_tensions", None)
-
-            if old_points is not None:
-                if len(old_points) == len(points):
-                    if np.allclose(old_points, points):
-                        if old_diameter == diameter:
-                            if old_tensions is not None:
-                                if np.allclose(old_tensions, tensions):
-                                    # print("Not updating cable visual")
-                                    return
-
-            A._actual_points = points
-            A._actual_diameter = diameter
-            A._actual_tensions = tensions
-
-            if self.node._render_as_tube:
-                new_data = create_tube_data(points, diameter, colors=tensions)
-                update_mesh_polydata(A, new_data)
-            else:
-                if len(points) == 0:  # not yet created
+def update_timings_report() -> str:
+    """Returns the profiling counters of update_geometry as a table, most expensive node type first"""
+    lines = [f"{'node type':<20} {'updated':>8} {'skipped':>8} {'time [ms]':>10}"]
+    for name, (n_updated, n_skipped, duration) in sorted(
+        UPDATE_TIMINGS.items(), key=lambda item: -item[1][2]
+    ):
+        lines.append(
+            f"{name:<20} {n_updated:>8} {n_skipped:>8} {1000 * duration:>10.2f}"
+        )
+    return "\n".join(lines)
+
+
+# --- change keys ---
+
+
+def _transform_key(frame):
+    if frame is None:
+        return None
+    return tuple(frame.global_transform)
+
+
+def _visual_key(node, viewport):
+    return (
+        _transform_key(node.parent),
+        tuple(node.offset),
+        tuple(node.rotation),
+        tuple(node.scale),
+    )
+
+
+def _circle_key(node, viewport):
+    point = node.parent
+    return (
+        _transform_key(point.parent),
+        tuple(point.position),
+        tuple(node.axis),
+        node.radius,
+        node.draw_start,
+        node.draw_stop,
+        node.is_roundbar,
+    )
+
+
+def _area_key(node, viewport):
+    return (node.A,)
+
+
+def _connector2d_key(node, viewport):
+    return tuple(node.nodeA.global_position), tuple(node.nodeB.global_position)
+
+
+def _lc6d_key(node, viewport):
+    return tuple(node.main.global_position), tuple(node.secondary.global_position)
+
+
+def _point_key(node, viewport):
+    return (
+        _transform_key(node.parent),
+        tuple(node.position),
+        node.footprint,
+        viewport.settings.geometry_scale,
+    )
+
+
+def _wave_interaction_key(node, viewport):
+    return (
+        _transform_key(node.parent),
+        tuple(node.offset),
+        viewport.settings.geometry_scale,
+    )
+
+
+def _frame_key(node, viewport):
+    return (
+        tuple(node.global_transform),
+        node.footprint,
+        viewport.settings.geometry_scale,
+    )
+
+
+def _rigidbody_key(node, viewport):
+    return _frame_key(node, viewport) + (
+        tuple(node.cog),
+        node.mass,
+        viewport.settings.cog_scale,
+        viewport.settings.cog_do_normalize,
+    )
+
+
+# --- updaters ---
+
+
+@geometry_updater(dn.Visual, change_key=_visual_key)
+def _update_visual(V: VisualActor, viewport):
+    # A = V.actors["main"]
+    for A in V.actors.values():
+
+        t = vtkTransform()
+        t.Identity()
+        t.PostMultiply()
+
+        t.Scale(V.node.scale)
+
+        # calculate wxys from node.rotation
+        r = V.node.rotation
+        angle = (r[0] ** 2 + r[1] ** 2 + r[2] ** 2) ** (0.5)
+        if angle > 0:
+            t.RotateWXYZ(angle, r[0] / angle, r[1] / angle, r[2] / angle)
+
+        t.Translate(V.node.offset)
+
+        # Get the parent matrix (if any)
+        if V.node.parent is not None:
+            apply_parent_translation_on_transform(V.node.parent, t)
+
+        SetTransformIfDifferent(A, t)
+
+
+@geometry_updater(dn.Circle, change_key=_circle_key)
+def _update_circle(V: VisualActor, viewport):
+    A = V.actors["main"]
+
+    t = vtkTransform()
+    t.Identity()
+
+    # scale to flat disk
+    thickness = (
+        (V.node.draw_stop - V.node.draw_start) / 2
+        if V.node.is_roundbar
+        else 0.1
+    )
+
+    if V.node.is_roundbar:
+        move = (V.node.draw_start + V.node.draw_stop) / 2
+        t.Translate(0, 0, move)
+
+    t.Scale(V.node.radius, V.node.radius, thickness)
+
+    # rotate z-axis (length axis of cylinder) is direction of axis
+    axis = np.asarray(V.node.axis) / np.linalg.norm(V.node.axis)
+    z = (0, 0, 1)
+    rot_axis = np.cross(z, axis)
+    rot_dot = np.dot(z, axis)
+    if rot_dot > 1:
+        rot_dot = 1
+    if rot_dot < -1:
+        rot_dot = -1
+
+    angle = np.arccos(rot_dot)
+
+    t.PostMultiply()
+    t.RotateWXYZ(np.rad2deg(angle), rot_axis)
+
+    t.Translate(V.node.parent.position)
+
+    # Get the parent matrix (if any)
+    if V.node.parent.parent is not None:
+        apply_parent_translation_on_transform(V.node.parent.parent, t)
+
+    SetTransformIfDifferent(A, t)
+
+
+@geometry_updater(dn.WindOrCurrentArea, change_key=_area_key)
+def _update_wind_or_current_area(V: VisualActor, viewport):
+    V.actors["main"].SetScale(np.sqrt(V.node.A))
+
+
+@geometry_updater(dn.Cable)
+def _update_cable(V: VisualActor, viewport):
+    # # check the number of points
+    A = V.actors["main"]
+
+    points, tensions = V.node.get_points_and_tensions_for_visual()
+
+    # get cable scale from painter settings
+    ps = viewport.settings.painter_settings
+    min_dia = ps["Cable"]["main"].optionalScale
+
+    diameter = V.node.diameter
+    diameter = max(diameter, min_dia)
+
+    points = np.asarray(points, dtype=float)
+    tensions = np.asarray(tensions, dtype=float)
+    merged = V.node._render_as_tube and viewport.settings.merge_cables
+
+    # check if anything has changed before updating
+    old_points = getattr(A, "_actual_points", None)
+    old_diameter = getattr(A, "_actual_diameter", None)
+    old_tensions = getattr(A, "_actual_tensions", None)
+    old_merged = getattr(A, "_actual_merged", None)
+
+    if old_points is not None and old_merged == merged:
+        if old_points.shape == points.shape and old_tensions.shape == tensions.shape:
+            if old_diameter == diameter:
+                if np.allclose(old_points, points) and np.allclose(
+                    old_tensions, tensions
+                ):
+                    # print("Not updating cable visual")
                     return
 
-                update_line_to_points(A, points)
+    A._actual_points = points
+    A._actual_diameter = diameter
+    A._actual_tensions = tensions
+    A._actual_merged = merged
+
+    if merged or old_merged:
+        viewport.merged_cables_changed = True
+
+    if merged:
+        # drawn by the merged cable actor of the viewport, see AbstractSceneRenderer.position_visuals
+        if getattr(A, "_tube", None) is not None:
+            update_mesh_to_empty(A)
+            A._tube = None
+
+    elif V.node._render_as_tube:
+        # persistent pipeline, only the data is updated
+        tube = getattr(A, "_tube", None)
+        if tube is None:
+            tube = CableTube()
+            A._tube = tube
+            update_mesh_polydata(A, tube.output)
 
-            # self.setLabelPosition(np.mean(points, axis=0))
+        tube.update(points, diameter, tensions)
 
+    else:
+        if len(points) == 0:  # not yet created
             return
 
-        if isinstance(self.node, dn.Measurement):
-            A = self.actors["main"]
-            p1,p2,p3,p4 = self.node.points_for_drawing()
+        update_line_to_points(A, points)
+
+    # V.setLabelPosition(np.mean(points, axis=0))
+
+
+@geometry_updater(dn.Measurement)
+def _update_measurement(V: VisualActor, viewport):
+    A = V.actors["main"]
+    p1,p2,p3,p4 = V.node.points_for_drawing()
+
+    if V.node.kind == dn.MeasurementType.Distance:
+        update_line_to_points(A, [p1,p2,p3,p1,p4])
+    else:
+        # if sign<0:
+        #     update_line_to_points(A, [p2,p1,p4])
+        # else:
+        update_line_to_points(A, [p1,p2,p3,p1])
+
 
-            if self.node.kind == dn.MeasurementType.Distance:
-                update_line_to_points(A, [p1,p2,p3,p1,p4])
+@geometry_updater(dn.SupportPoint)
+def _update_support_point(V: VisualActor, viewport):
+    A = V.actors["main"]
+    p1 = V.node.point.global_position
+    p2 = V.node.frame.to_glob_position((0,0,V.node.delta_z))
+    update_line_to_points(A, [p1,p2])
+
+    sphere = V.actors["sphere"]
+    t = vtkTransform()
+    t.Identity()
+
+    t.Translate(p2)
+
+    SetTransformIfDifferent(sphere, t)
+    SetScaleIfDifferent(sphere, 0.25*viewport.settings.geometry_scale)
+
+
+@geometry_updater(dn.SPMT)
+def _update_spmt(V: VisualActor, viewport):
+    # 'main' is a cube spanning the upper surface of the SPMT
+    # the center is at the center
+    # the length extents half the distance between the axles
+    # the width extents half the wheel_width
+
+    N = V.node
+    N.update()
+
+    # The deck
+    TOP_THICKNESS = 0.5  # m
+
+    top_length = N.n_length * N.spacing_length
+    top_width = (N.n_width - 1) * N.spacing_width + SPMT_WHEEL_WIDTH
+
+    top_deck = V.actors["main"]
+    top_deck.SetScale(top_length, top_width, TOP_THICKNESS)
+    SetMatrixIfDifferent(
+        top_deck,
+        mat4x4_from_point_on_frame(N.parent, (0, 0, -0.5 * TOP_THICKNESS)),
+    )
+
+    # The wheels
+    #
+    # all wheels are drawn by a single instanced actor
+    axle_positions = np.asarray(N.axles, dtype=float).reshape(-1, 3)
+    extensions = np.asarray(N.extensions, dtype=float)
+
+    local = np.column_stack(
+        (
+            axle_positions[:, 0],
+            axle_positions[:, 1],
+            -extensions + SPMT_WHEEL_RADIUS,
+        )
+    )
+
+    wheels = np.repeat(N.parent.global_transform_matrix[None], len(local), axis=0)
+    wheels[:, :3, 3] = N.parent.to_glob_positions(local)
+    V.actors["wheel"]._instances.update(wheels)
+
+    # The lines
+    A = V.actors["line"]
+
+    pts = V.node.get_actual_global_points()
+    if len(pts) == 0:
+        return
+
+    update_line_to_points(A, pts)
+
+
+@geometry_updater(dn.Beam)
+def _update_beam(V: VisualActor, viewport):
+    points = V.node.global_positions
+    A = V.actors["main"]
+    update_line_to_points(A, points)
+
+    # V.setLabelPosition(np.mean(points, axis=0))
+
+
+@geometry_updater(dn.Connector2d, change_key=_connector2d_key)
+def _update_connector2d(V: VisualActor, viewport):
+    A = V.actors["main"]
+
+    points = list()
+    points.append(V.node.nodeA.to_glob_position((0, 0, 0)))
+    points.append(V.node.nodeB.to_glob_position((0, 0, 0)))
+
+    # A.points(points)
+    update_vertices(V.actors["main"], points)
+
+
+@geometry_updater(dn.LC6d, change_key=_lc6d_key)
+def _update_lc6d(V: VisualActor, viewport):
+    A = V.actors["main"]
+
+    points = list()
+    points.append(V.node.main.to_glob_position((0, 0, 0)))
+    points.append(V.node.secondary.to_glob_position((0, 0, 0)))
+
+    # A.points(points)
+    update_vertices(V.actors["main"], points)
+
+
+@geometry_updater(dn.BallastSystem)
+def _update_ballast_system(V: VisualActor, viewport):
+    pass  # nothing to draw
+
+
+def _update_footprint(V: VisualActor, viewport):
+    """Footprints of Points and Frames (HasFootprint)"""
+    fp = V.node.footprint
+    if fp:
+        n_points = len(fp)
+        current_n_points = (
+            V.actors["footprint"].GetMapper().GetInput().GetNumberOfPoints()
+        )
+
+        if isinstance(V.node, dn.Point):
+            p = V.node.position
+            local_position = [
+                (v[0] + p[0], v[1] + p[1], v[2] + p[2]) for v in fp
+            ]
+            if V.node.parent:
+                fp = V.node.parent.to_glob_positions(local_position)
             else:
-                # if sign<0:
-                #     update_line_to_points(A, [p2,p1,p4])
-                # else:
-                update_line_to_points(A, [p1,p2,p3,p1])
-
-        if isinstance(self.node, dn.SupportPoint):
-            A = self.actors["main"]
-            p1 = self.node.point.global_position
-            p2 = self.node.frame.to_glob_position((0,0,self.node.delta_z))
-            update_line_to_points(A, [p1,p2])
-
-            sphere = self.actors["sphere"]
-            t = vtkTransform()
-            t.Identity()
-
-            t.Translate(p2)
-
-            SetTransformIfDifferent(sphere, t)
-            SetScaleIfDifferent(sphere, 0.25*viewport.settings.geometry_scale)
-
-        if isinstance(self.node, dn.SPMT):
-            # 'main' is a cube spanning the upper surface of the SPMT
-            # the center is at the center
-            # the length extents half the distance between the axles
-            # the width extents half the wheel_width
-
-            N = self.node
-            N.update()
-
-            # The deck
-            WHEEL_WIDTH = 1.0  # [m, a wheel is actually a pair of wheels]
-            TOP_THICKNESS = 0.5  # m
-            WHEEL_RADIUS = 0.3  # [m]#
-
-            top_length = N.n_length * N.spacing_length
-            top_width = (N.n_width - 1) * N.spacing_width + WHEEL_WIDTH
-
-            top_deck = self.actors["main"]
-            top_deck.SetScale(top_length, top_width, TOP_THICKNESS)
-            SetMatrixIfDifferent(
-                top_deck,
-                mat4x4_from_point_on_frame(N.parent, (0, 0, -0.5 * TOP_THICKNESS)),
+                fp = local_position
+
+        elif isinstance(V.node, dn.Frame):
+            fp = V.node.to_glob_positions(fp)
+
+        else:
+            raise Exception(
+                "Footprint on node which is not a Point or Frame -- unexpected"
             )
 
-            # The wheels
-            #
-            # sync the number of wheels
-            n_wheels = N.n_length * N.n_width
-            n_wheel_actors = len(self.actors) - 2  # 2 other actors
-
-            #    wheel actors are named wheel#xx
-
-            if n_wheel_actors > n_wheels:  # remove actors
-                for i in range(n_wheel_actors - n_wheels):
-                    name = f"wheel#{n_wheels + i}"
-                    viewport.remove(self.actors[name])
-                    del self.actors[name]
-            if n_wheel_actors < n_wheels:  # add actors
-                for i in range(n_wheels - n_wheel_actors):
-                    actor = Cylinder(
-                        pos=(0, 0, 0),
-                        r=WHEEL_RADIUS,
-                        height=WHEEL_WIDTH,
-                        axis=(0, 1, 0),
-                        res=24,
-                    )
-                    self.actors[f"wheel#{n_wheel_actors+i}"] = actor
-                    viewport.add(actor)
+        if n_points == current_n_points:
+            # V.actors["footprint"].points(fp)
+            actor = V.actors["footprint"]
+            update_vertices(actor, fp)
+            actor._vertices_changed = True
 
-            # position the wheels
-            axle_positions = N.axles
-            extensions = N.extensions
+        else:
+            # create a new actor
+            new_actor = Mesh(
+                vertices=fp,
+                faces=[range(n_points)],
+                do_clean=True,
+            )
 
-            for i in range(n_wheels):
-                actor = self.actors[f"wheel#{i}"]
-                pos = axle_positions[i]
+            # print("number of points changed, creating new")
 
-                m44 = mat4x4_from_point_on_frame(
-                    self.node.parent, (pos[0], pos[1], -extensions[i] + WHEEL_RADIUS)
-                )
-                SetMatrixIfDifferent(actor, m44)
+            if viewport.renderer is not None:
+                viewport.remove(V.actors["footprint"])
+                # remove outline as well
+                V.actors["footprint"] = new_actor
+                viewport.add(V.actors["footprint"])
 
-            # The lines
-            A = self.actors["line"]
 
-            pts = self.node.get_actual_global_points()
-            if len(pts) == 0:
-                return
+@geometry_updater(dn.Point, change_key=_point_key)
+def _update_point(V: VisualActor, viewport):
+    _update_footprint(V, viewport)
 
-            update_line_to_points(A, pts)
+    t = vtkTransform()
+    t.Identity()
 
-            return
+    t.Translate(V.node.global_position)
 
-        if isinstance(self.node, dn.Beam):
-            points = self.node.global_positions
-            A = self.actors["main"]
-            update_line_to_points(A, points)
+    SetTransformIfDifferent(V.actors["main"], t)
+    SetScaleIfDifferent(V.actors["main"], viewport.settings.geometry_scale)
 
-            # self.setLabelPosition(np.mean(points, axis=0))
+    # V.setLabelPosition(V.node.global_position)
 
-            return
 
-        if isinstance(self.node, dn.Connector2d):
-            A = self.actors["main"]
+@geometry_updater(dn.ContactBall)
+def _update_contact_ball(V: VisualActor, viewport):
+    V.node.update()
 
-            points = list()
-            points.append(self.node.nodeA.to_glob_position((0, 0, 0)))
-            points.append(self.node.nodeB.to_glob_position((0, 0, 0)))
+    t = vtkTransform()
+    t.Identity()
+    t.Translate(V.node.parent.global_position)
 
-            # A.points(points)
-            update_vertices(self.actors["main"], points)
+    # check radius
+    if V.actors["main"]._r != V.node.radius:
+        # Update radius by re-creating the polydata
+        temp = Sphere(r=V.node.radius, res=RESOLUTION_SPHERE)
+        update_mesh_from(V.actors["main"], temp)
 
-            return
+        V.actors["main"]._r = V.node.radius
 
-        if isinstance(self.node, dn.LC6d):
-            A = self.actors["main"]
+    SetTransformIfDifferent(V.actors["main"], t)
+    # V.actors["main"].wireframe(V.node.contact_force_magnitude > 0)
 
-            points = list()
-            points.append(self.node.main.to_glob_position((0, 0, 0)))
-            points.append(self.node.secondary.to_glob_position((0, 0, 0)))
+    if V.node.can_contact:
+        point1 = V.node.parent.global_position
+        point2 = V.node.contactpoint
 
-            # A.points(points)
-            update_vertices(self.actors["main"], points)
+        update_line_to_points(V.actors["contact"], [point1, point2])
 
-            return
+        V.actors["contact"].SetVisibility(True)
+    else:
+        V.actors["contact"].SetVisibility(False)
 
-        if isinstance(self.node, dn.BallastSystem):
-            return
+    # update paint settings
+    if V.node.contact_force_magnitude > 0:  # do we have contact?
+        V.paint_state = "contact"
+    else:
+        V.paint_state = "free"
 
-        # footprints
-        if isinstance(self.node, dn.HasFootprint):
-            fp = self.node.footprint
-            if fp:
-                n_points = len(fp)
-                current_n_points = (
-                    self.actors["footprint"].GetMapper().GetInput().GetNumberOfPoints()
-                )
-
-                if isinstance(self.node, dn.Point):
-                    p = self.node.position
-                    local_position = [
-                        (v[0] + p[0], v[1] + p[1], v[2] + p[2]) for v in fp
-                    ]
-                    if self.node.parent:
-                        fp = [
-                            self.node.parent.to_glob_position(loc)
-                            for loc in local_position
-                        ]
-                    else:
-                        fp = local_position
+    V.update_paint(viewport.settings)
 
-                elif isinstance(self.node, dn.Frame):
-                    fp = [self.node.to_glob_position(loc) for loc in fp]
 
-                else:
-                    raise Exception(
-                        "Footprint on node which is not a Point or Frame -- unexpected"
-                    )
+@geometry_updater(dn.WaveInteraction1, change_key=_wave_interaction_key)
+def _update_wave_interaction(V: VisualActor, viewport):
+    t = vtkTransform()
+    t.Identity()
+    t.Translate(V.node.parent.to_glob_position(V.node.offset))
+    SetTransformIfDifferent(V.actors["main"], t)
+    SetScaleIfDifferent(V.actors["main"], viewport.settings.geometry_scale)
 
-                if n_points == current_n_points:
-                    # self.actors["footprint"].points(fp)
-                    actor = self.actors["footprint"]
-                    update_vertices(actor, fp)
-                    actor._vertices_changed = True
 
-                else:
-                    # create a new actor
-                    new_actor = Mesh(
-                        vertices=fp,
-                        faces=[range(n_points)],
-                        do_clean=True,
-                    )
+@geometry_updater(dn.Force)
+def _update_force(V: VisualActor, viewport):
+    # check is the arrows are still what they should be
+    if not np.all(
+        V.actors["main"]._force
+        == viewport._scaled_force_vector(V.node.global_force)
+    ):
+        viewport.remove(V.actors["main"])
 
-                    # print("number of points changed, creating new")
+        endpoint = viewport._scaled_force_vector(V.node.global_force)
 
-                    if viewport.renderer is not None:
-                        viewport.remove(self.actors["footprint"])
-                        # remove outline as well
-                        self.actors["footprint"] = new_actor
-                        viewport.add(self.actors["footprint"])
+        p = Arrow(startPoint=(0, 0, 0), endPoint=endpoint, res=RESOLUTION_ARROW)
+        p.SetPickable(True)
+        p.actor_type = ActorType.FORCE
+        p._force = endpoint
 
-        if isinstance(self.node, dn.Point):
-            t = vtkTransform()
-            t.Identity()
+        V.actors["main"] = p
+        viewport.add(V.actors["main"])
 
-            t.Translate(self.node.global_position)
+    # check is the arrows are still what they should be
+    if not np.all(
+        np.array(V.actors["moment1"]._moment)
+        == viewport._scaled_force_vector(V.node.global_moment)
+    ):
+        viewport.remove(V.actors["moment1"])
+        viewport.remove(V.actors["moment2"])
 
-            SetTransformIfDifferent(self.actors["main"], t)
-            SetScaleIfDifferent(self.actors["main"], viewport.settings.geometry_scale)
+        endpoint = viewport._scaled_force_vector(V.node.global_moment)
+        p = Arrow(startPoint=(0, 0, 0), endPoint=endpoint, res=RESOLUTION_ARROW)
+        p.SetPickable(True)
+        p.actor_type = ActorType.FORCE
+        p._moment = endpoint
+        V.actors["moment1"] = p
 
-            # self.setLabelPosition(self.node.global_position)
-            return
+        p = ArrowHead(
+            startPoint=0.96 * endpoint,
+            endPoint=1.36 * endpoint,
+            res=RESOLUTION_ARROW,
+        )
+        p.SetPickable(True)
+        p.actor_type = ActorType.FORCE
 
-        if isinstance(self.node, dn.ContactBall):
-            self.node.update()
+        p.actor_type = ActorType.FORCE
+        V.actors["moment2"] = p
 
-            t = vtkTransform()
-            t.Identity()
-            t.Translate(self.node.parent.global_position)
+        viewport.add(V.actors["moment1"])
+        viewport.add(V.actors["moment2"])
 
-            # check radius
-            if self.actors["main"]._r != self.node.radius:
-                # Update radius by re-creating the polydata
-                temp = Sphere(r=self.node.radius, res=RESOLUTION_SPHERE)
-                update_mesh_from(self.actors["main"], temp)
+    t = vtkTransform()
+    t.Identity()
+    t.Translate(V.node.parent.global_position)
+    for a in V.actors.values():
+        SetTransformIfDifferent(a, t)
 
-                self.actors["main"]._r = self.node.radius
 
-            SetTransformIfDifferent(self.actors["main"], t)
-            # V.actors["main"].wireframe(V.node.contact_force_magnitude > 0)
+@geometry_updater(dn.RigidBody, change_key=_rigidbody_key)
+def _update_rigidbody(V: VisualActor, viewport):
+    _update_footprint(V, viewport)
 
-            if self.node.can_contact:
-                point1 = self.node.parent.global_position
-                point2 = self.node.contactpoint
+    # Some custom code to place and scale the Actor[3] of the body.
+    # This actor should be placed at the CoG position and scaled to a solid steel block
 
-                update_line_to_points(self.actors["contact"], [point1, point2])
+    # The CoG
+    if viewport.settings.cog_do_normalize:
+        scale = 1
+    else:
+        scale = (V.node.mass / 8.050) ** (1 / 3)  # density of steel
+    scale = scale * viewport.settings.cog_scale
 
-                self.actors["contact"].SetVisibility(True)
-            else:
-                self.actors["contact"].SetVisibility(False)
+    t = vtkTransform()
+    t.Identity()
 
-            # update paint settings
-            if self.node.contact_force_magnitude > 0:  # do we have contact?
-                self.paint_state = "contact"
-            else:
-                self.paint_state = "free"
+    t.Translate(V.node.cog)  # the set to local cog position
+    t.Scale(scale, scale, scale)  # then scale
 
-            self.update_paint(viewport.settings)
+    # apply parent transform
+    mat4x4 = transform_to_mat4x4(V.node.global_transform)
+    t.PostMultiply()
+    t.Concatenate(mat4x4)
 
-            return
+    SetTransformIfDifferent(V.actors["main"], t)
 
-        if isinstance(self.node, dn.WaveInteraction1):
-            t = vtkTransform()
-            t.Identity()
-            t.Translate(self.node.parent.to_glob_position(self.node.offset))
-            SetTransformIfDifferent(self.actors["main"], t)
-            SetScaleIfDifferent(self.actors["main"], viewport.settings.geometry_scale)
-            return
+    # The arrows
+    t = vtkTransform()
+    t.Identity()
+    t.Scale(
+        viewport.settings.geometry_scale,
+        viewport.settings.geometry_scale,
+        viewport.settings.geometry_scale,
+    )  # scale first
 
-        if isinstance(self.node, dn.Force):
-            # check is the arrows are still what they should be
-            if not np.all(
-                self.actors["main"]._force
-                == viewport._scaled_force_vector(self.node.global_force)
-            ):
-                viewport.remove(self.actors["main"])
+    t.PostMultiply()
+    t.Concatenate(mat4x4)  # apply position and orientatation
 
-                endpoint = viewport._scaled_force_vector(self.node.global_force)
+    for key in ("x", "y", "z"):
+        SetTransformIfDifferent(V.actors[key], t)
 
-                p = Arrow(startPoint=(0, 0, 0), endPoint=endpoint, res=RESOLUTION_ARROW)
-                p.SetPickable(True)
-                p.actor_type = ActorType.FORCE
-                p._force = endpoint
 
-                self.actors["main"] = p
-                viewport.add(self.actors["main"])
+def _update_source_mesh(V: VisualActor, viewport) -> bool:
+    """Source mesh update is common for all mesh-like nodes (Buoyancy, ContactMesh, Tank).
 
-            # check is the arrows are still what they should be
-            if not np.all(
-                np.array(self.actors["moment1"]._moment)
-                == viewport._scaled_force_vector(self.node.global_moment)
-            ):
-                viewport.remove(self.actors["moment1"])
-                viewport.remove(self.actors["moment2"])
-
-                endpoint = viewport._scaled_force_vector(self.node.global_moment)
-                p = Arrow(startPoint=(0, 0, 0), endPoint=endpoint, res=RESOLUTION_ARROW)
-                p.SetPickable(True)
-                p.actor_type = ActorType.FORCE
-                p._moment = endpoint
-                self.actors["moment1"] = p
-
-                p = ArrowHead(
-                    startPoint=0.96 * endpoint,
-                    endPoint=1.36 * endpoint,
-                    res=RESOLUTION_ARROW,
-                )
-                p.SetPickable(True)
-                p.actor_type = ActorType.FORCE
-
-                p.actor_type = ActorType.FORCE
-                self.actors["moment2"] = p
-
-                viewport.add(self.actors["moment1"])
-                viewport.add(self.actors["moment2"])
-
-            t = vtkTransform()
-            t.Identity()
-            t.Translate(self.node.parent.global_position)
-            for a in self.actors.values():
-                SetTransformIfDifferent(a, t)
+    Returns False if nothing changed and the other update functions can be skipped"""
 
-            return
+    # print(f'Updating source mesh for {V.node.name}')
 
-        if isinstance(self.node, dn.RigidBody):
-            # Some custom code to place and scale the Actor[3] of the body.
-            # This actor should be placed at the CoG position and scaled to a solid steel block
+    changed = False  # anything changed?
 
-            # The CoG
-            if viewport.settings.cog_do_normalize:
-                scale = 1
-            else:
-                scale = (self.node.mass / 8.050) ** (1 / 3)  # density of steel
-            scale = scale * viewport.settings.cog_scale
+    if V.node.trimesh._new_mesh:
+        changed = True  # yes, mesh has changed
+        V.node.trimesh._new_mesh = False  # one time only
 
-            t = vtkTransform()
-            t.Identity()
+    # move the full mesh with the parent
 
-            t.Translate(self.node.cog)  # the set to local cog position
-            t.Scale(scale, scale, scale)  # then scale
+    if V.node.parent is not None:
+        mat4x4 = transform_to_mat4x4(V.node.parent.global_transform)
+        current_transform = V.actors[
+            "main"
+        ].GetMatrix()  # current transform matrix
 
-            # apply parent transform
-            mat4x4 = transform_to_mat4x4(self.node.global_transform)
-            t.PostMultiply()
-            t.Concatenate(mat4x4)
+        # if the current transform is identical to the new one,
+        # then we do not need to change anything (creating the mesh is slow)
 
-            SetTransformIfDifferent(self.actors["main"], t)
+        for i in range(4):
+            for j in range(4):
+                if current_transform.GetElement(i, j) != mat4x4.GetElement(
+                    i, j
+                ):
+                    changed = True  # yes, transform has changed
+                    break
 
-            # The arrows
-            t = vtkTransform()
-            t.Identity()
-            t.Scale(
-                viewport.settings.geometry_scale,
-                viewport.settings.geometry_scale,
-                viewport.settings.geometry_scale,
-            )  # scale first
+        # Update the source-mesh position
+        #
+        # the source-mesh itself is updated in "add_new_actors_to_screen"
+        if changed:
+            SetMatrixIfDifferent(V.actors["main"], mat4x4)
 
-            t.PostMultiply()
-            t.Concatenate(mat4x4)  # apply position and orientatation
+    if not changed:
+        if isinstance(V.node, dn.Tank):
+            # the tank fill may have changed,
+            # only skip if fill percentage has changed with less than 1e-3%
+            vfp = getattr(V, "_visualized_fill_percentage", -1)
+            if abs(V.node.fill_pct - vfp) < 1e-3:
+                return False
 
-            for key in ("x", "y", "z"):
-                SetTransformIfDifferent(self.actors[key], t)
+        else:
+            return False  # skip the other update functions
 
-            return
+    return True
 
-        if (
-            isinstance(self.node, dn.Buoyancy)
-            or isinstance(self.node, dn.ContactMesh)
-            or isinstance(self.node, dn.Tank)
-        ):
-            # Source mesh update is common for all mesh-like nodes
-            #
-
-            # print(f'Updating source mesh for {V.node.name}')
-
-            changed = False  # anything changed?
-
-            if self.node.trimesh._new_mesh:
-                changed = True  # yes, mesh has changed
-                self.node.trimesh._new_mesh = False  # one time only
-
-            # move the full mesh with the parent
-
-            if self.node.parent is not None:
-                mat4x4 = transform_to_mat4x4(self.node.parent.global_transform)
-                current_transform = self.actors[
-                    "main"
-                ].GetMatrix()  # current transform matrix
-
-                # if the current transform is identical to the new one,
-                # then we do not need to change anything (creating the mesh is slow)
-
-                for i in range(4):
-                    for j in range(4):
-                        if current_transform.GetElement(i, j) != mat4x4.GetElement(
-                            i, j
-                        ):
-                            changed = True  # yes, transform has changed
-                            break
-
-                # Update the source-mesh position
-                #
-                # the source-mesh itself is updated in "add_new_actors_to_screen"
-                if changed:
-                    SetMatrixIfDifferent(self.actors["main"], mat4x4)
-
-            if not changed:
-                if isinstance(self.node, dn.Tank):
-                    # the tank fill may have changed,
-                    # only skip if fill percentage has changed with less than 1e-3%
-                    vfp = getattr(self, "_visualized_fill_percentage", -1)
-                    if abs(self.node.fill_pct - vfp) < 1e-3:
-                        return
 
-                else:
-                    return  # skip the other update functions
-
-        if isinstance(self.node, dn.Buoyancy):
-            ## Buoyancy has multiple actors
-            #
-            # actor 0 : the source mesh :: main
-            # actor 1 : the CoB
-            # actor 2 : the waterplane
-            # actor 3 : the submerged part of the source mesh
-            #
-
-            # If we are here then either the source-mesh has been updated or the position has changed
-
-            if viewport.quick_updates_only:
-                for a in self.actors.values():
-                    a.SetVisibility(False)
-                return
+@geometry_updater(dn.Buoyancy)
+def _update_buoyancy(V: VisualActor, viewport):
+    if not _update_source_mesh(V, viewport):
+        return
 
-            # Update the CoB
-            # move the CoB to the new (global!) position
-            cob = self.node.cob
-            SetMatrixIfDifferent(self.actors["cob"], transform_from_point(*cob))
-
-            # update water-plane
-            x1, x2, y1, y2, _, _ = self.node.trimesh.get_extends()
-            x1 -= VISUAL_BUOYANCY_PLANE_EXTEND
-            x2 += VISUAL_BUOYANCY_PLANE_EXTEND
-            y1 -= VISUAL_BUOYANCY_PLANE_EXTEND
-            y2 += VISUAL_BUOYANCY_PLANE_EXTEND
-            p1 = self.node.parent.to_glob_position((x1, y1, 0))
-            p2 = self.node.parent.to_glob_position((x2, y1, 0))
-            p3 = self.node.parent.to_glob_position((x2, y2, 0))
-            p4 = self.node.parent.to_glob_position((x1, y2, 0))
-
-            corners = [
-                (p1[0], p1[1], 0),
-                (p2[0], p2[1], 0),
-                (p3[0], p3[1], 0),
-                (p4[0], p4[1], 0),
-            ]
-            # self.actors["waterplane"].points(corners)
-            update_vertices(self.actors["waterplane"], corners)
+    ## Buoyancy has multiple actors
+    #
+    # actor 0 : the source mesh :: main
+    # actor 1 : the CoB
+    # actor 2 : the waterplane
+    # actor 3 : the submerged part of the source mesh
+    #
 
-            self.actors["waterplane"]._vertices_changed = True
+    # If we are here then either the source-mesh has been updated or the position has changed
 
-            # Instead of updating, remove the old actor and create a new one
+    if viewport.quick_updates_only:
+        for a in V.actors.values():
+            a.SetVisibility(False)
+        return
 
-            # remove already existing submerged mesh (if any)
-            if "submerged_mesh" in self.actors:
-                viewport.remove(self.actors["submerged_mesh"])
-                del self.actors["submerged_mesh"]
+    # Update the CoB
+    # move the CoB to the new (global!) position
+    cob = V.node.cob
+    SetMatrixIfDifferent(V.actors["cob"], transform_from_point(*cob))
 
-            mesh = self.node._vfNode.current_mesh
+    # update water-plane
+    x1, x2, y1, y2, _, _ = V.node.trimesh.get_extends()
+    x1 -= VISUAL_BUOYANCY_PLANE_EXTEND
+    x2 += VISUAL_BUOYANCY_PLANE_EXTEND
+    y1 -= VISUAL_BUOYANCY_PLANE_EXTEND
+    y2 += VISUAL_BUOYANCY_PLANE_EXTEND
+    p1, p2, p3, p4 = V.node.parent.to_glob_positions(
+        [(x1, y1, 0), (x2, y1, 0), (x2, y2, 0), (x1, y2, 0)]
+    )
 
-            if mesh.nVertices > 0:  # only add when available
-                vis = actor_from_trimesh(mesh)
+    corners = [
+        (p1[0], p1[1], 0),
+        (p2[0], p2[1], 0),
+        (p3[0], p3[1], 0),
+        (p4[0], p4[1], 0),
+    ]
+    # V.actors["waterplane"].points(corners)
+    update_vertices(V.actors["waterplane"], corners)
 
-                vis.actor_type = ActorType.MESH_OR_CONNECTOR
-                self.actors["submerged_mesh"] = vis
+    V.actors["waterplane"]._vertices_changed = True
 
-                viewport.add(vis)
+    # Instead of updating, remove the old actor and create a new one
 
-            self.update_paint(
-                viewport.settings
-            )  # needed to make the CoB and WaterPlane actors visible / invisible
+    # remove already existing submerged mesh (if any)
+    if "submerged_mesh" in V.actors:
+        viewport.remove(V.actors["submerged_mesh"])
+        del V.actors["submerged_mesh"]
 
-            return
+    mesh = V.node._vfNode.current_mesh
 
-        if isinstance(self.node, dn.ContactMesh):
-            return
+    if mesh.nVertices > 0:  # only add when available
+        vis = actor_from_trimesh(mesh)
 
-        if isinstance(self.node, dn.Tank):
-            ## Tank has multiple actors
-            #
-            # main : source-mesh
-            # cog : cog
-            # fluid : filled part of mesh
-
-            # If the source mesh has been updated, then V.node.trimesh._new_mesh is True
-            just_created = getattr(self, "__just_created", True)
-            if just_created:
-                self._visual_volume = -1
-
-            if viewport.quick_updates_only:
-                for a in self.actors.values():
-                    a.SetVisibility(False)
-                return
-            else:
-                if self.node.visible:
-                    for a in self.actors.values():
-                        a.SetVisibility(True)
+        vis.actor_type = ActorType.MESH_OR_CONNECTOR
+        V.actors["submerged_mesh"] = vis
 
-            # Update the actors
-            self.node.update()
+        viewport.add(vis)
 
-            # Update the CoG
-            # move the CoG to the new (global!) position
-            SetMatrixIfDifferent(
-                self.actors["cog"], transform_from_point(*self.node.cog)
-            )
+    V.update_paint(
+        viewport.settings
+    )  # needed to make the CoB and WaterPlane actors visible / invisible
 
-            if self.node.volume <= 1:  # the "cog node" has a volume of
-                self.actors["cog"].SetVisibility(False)
-            else:
-                self.actors["cog"].SetVisibility(True)
 
-            # paint settings
-            if self.node.free_flooding:
-                self.paint_state = "freeflooding"
-            else:
-                if self.node.fill_pct >= 95:
-                    self.paint_state = "full"
-                elif self.node.fill_pct <= 5:
-                    self.paint_state = "empty"
-                else:
-                    self.paint_state = "partial"
-
-            # Fluid in tank
-
-            # Construct a visual:
-            #   - vertices
-            #   - faces
-
-            # There are the following options:
-            # - tank is empty : no fluid
-            # - tank is full  : use mesh from tank as input for fluid mesh
-            # - in between
-
-            fill_pct = self.node.fill_pct  # this also accounts for free-flooding
-
-            if fill_pct <= 0:
-                # self.actors["fluid"].SetVisibility(False)  # overridden elsewhere
-                update_mesh_to_empty(self.actors["fluid"])
-            elif fill_pct > 99.99:  # full
-                update_mesh_from(
-                    self.actors["fluid"],
-                    self.actors["main"],
-                    apply_soure_transform=True,
-                )
-            else:
-                # get the mesh and vertices from the node, and update actor accordingly
+@geometry_updater(dn.ContactMesh)
+def _update_contact_mesh(V: VisualActor, viewport):
+    _update_source_mesh(V, viewport)
 
-                mesh = self.node._vfNode.current_mesh
 
-                if mesh.nVertices == 0:
-                    raise ValueError(f"No mesh returned for fluid in {self.node.name}")
+@geometry_updater(dn.Tank)
+def _update_tank(V: VisualActor, viewport):
+    if not _update_source_mesh(V, viewport):
+        return
 
-                vertices = []
-                for i in range(mesh.nVertices):
-                    vertices.append(mesh.GetVertex(i))
+    ## Tank has multiple actors
+    #
+    # main : source-mesh
+    # cog : cog
+    # fluid : filled part of mesh
 
-                faces = []
-                for i in range(mesh.nFaces):
-                    faces.append(mesh.GetFace(i))
+    # If the source mesh has been updated, then V.node.trimesh._new_mesh is True
+    just_created = getattr(V, "__just_created", True)
+    if just_created:
+        V._visual_volume = -1
 
-                add_lid_to_open_mesh(
-                    vertices=vertices, faces=faces
-                )  # results stored in-place
+    if viewport.quick_updates_only:
+        for a in V.actors.values():
+            a.SetVisibility(False)
+        return
+    else:
+        if V.node.visible:
+            for a in V.actors.values():
+                a.SetVisibility(True)
+
+    # Update the actors
+    V.node.update()
+
+    # Update the CoG
+    # move the CoG to the new (global!) position
+    SetMatrixIfDifferent(
+        V.actors["cog"], transform_from_point(*V.node.cog)
+    )
+
+    if V.node.volume <= 1:  # the "cog node" has a volume of
+        V.actors["cog"].SetVisibility(False)
+    else:
+        V.actors["cog"].SetVisibility(True)
+
+    # paint settings
+    if V.node.free_flooding:
+        V.paint_state = "freeflooding"
+    else:
+        if V.node.fill_pct >= 95:
+            V.paint_state = "full"
+        elif V.node.fill_pct <= 5:
+            V.paint_state = "empty"
+        else:
+            V.paint_state = "partial"
 
-                update_mesh(self.actors["fluid"], vertices, faces)
+    # Fluid in tank
 
-            self._visual_volume = self.node.volume
+    # Construct a visual:
+    #   - vertices
+    #   - faces
 
-            # viewport.update_painting(self)
-            self.update_paint(viewport.settings)
+    # There are the following options:
+    # - tank is empty : no fluid
+    # - tank is full  : use mesh from tank as input for fluid mesh
+    # - in between
 
-            return
+    fill_pct = V.node.fill_pct  # this also accounts for free-flooding
 
-        if isinstance(self.node, dn.Frame):
-            # The arrows
-            t = vtkTransform()
-            t.Identity()
-            t.Scale(
-                viewport.settings.geometry_scale,
-                viewport.settings.geometry_scale,
-                viewport.settings.geometry_scale,
-            )  # scale first
-
-            mat4x4 = transform_to_mat4x4(self.node.global_transform)
-            t.PostMultiply()
-            t.Concatenate(mat4x4)  # apply position and orientatation
-
-            for a in self.actors.values():
-                SetTransformIfDifferent(a, t)
+    if fill_pct <= 0:
+        # V.actors["fluid"].SetVisibility(False)  # overridden elsewhere
+        update_mesh_to_empty(V.actors["fluid"])
+    elif fill_pct > 99.99:  # full
+        update_mesh_from(
+            V.actors["fluid"],
+            V.actors["main"],
+            apply_soure_transform=True,
+        )
+    else:
+        # get the mesh and vertices from the node, and update actor accordingly
 
-            return
+        mesh = V.node._vfNode.current_mesh
+
+        if mesh.nVertices == 0:
+            raise ValueError(f"No mesh returned for fluid in {V.node.name}")
+
+        vertices = []
+        for i in range(mesh.nVertices):
+            vertices.append(mesh.GetVertex(i))
+
+        faces = []
+        for i in range(mesh.nFaces):
+            faces.append(mesh.GetFace(i))
+
+        add_lid_to_open_mesh(
+            vertices=vertices, faces=faces
+        )  # results stored in-place
+
+        update_mesh(V.actors["fluid"], vertices, faces)
+
+    V._visual_volume = V.node.volume
+
+    # viewport.update_painting(self)
+    V.update_paint(viewport.settings)
+
+
+@geometry_updater(dn.Frame, change_key=_frame_key)
+def _update_frame(V: VisualActor, viewport):
+    _update_footprint(V, viewport)
+
+    # The arrows
+    t = vtkTransform()
+    t.Identity()
+    t.Scale(
+        viewport.settings.geometry_scale,
+        viewport.settings.geometry_scale,
+        viewport.settings.geometry_scale,
+    )  # scale first
+
+    mat4x4 = transform_to_mat4x4(V.node.global_transform)
+    t.PostMultiply()
+    t.Concatenate(mat4x4)  # apply position and orientatation
 
-        # --- default ---
+    for a in V.actors.values():
+        SetTransformIfDifferent(a, t)
@@ -0,0 +1,348 @@
+"""Headless rendering of image sequences: DOF vectors (mode shapes, animations), timeline steps and load cases.
+
+jupyter.pil_image creates a new renderer with all node visuals for every call. A RenderSession creates the offscreen
+renderer and the visuals once and keeps them alive; between frames only the state of the scene is changed and the
+visuals are re-positioned (position_visuals).
+
+Frames are written as numbered png files (see frame_filename) which can be combined into a video using write_video.
+
+render_parallel can distribute the frames over a pool of worker processes (see helpers.sweep.run_in_workers): every
+worker builds its own copy of the scene from python code and its own RenderSession once and then renders the batches of
+frames that it receives.
+"""
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+
+from DAVE.helpers.sweep import run_in_workers
+from DAVE.visual_helpers.image_screen_renderer import ImageRenderer
+
+_worker_session = None
+"""RenderSession of this worker process, created by _create_worker_session"""
+
+
+def frame_filename(folder, prefix: str, index: int) -> Path:
+    """Filename of frame number index"""
+    return Path(folder) / f"{prefix}_{index:05d}.png"
+
+
+class RenderSession:
+    """Offscreen renderer for a scene that renders many images of the same scene in different states.
+
+    Args:
+        scene: the scene
+        width, height: size of the images [pixels]
+        painters: str with key of painters dict, or a painters instance
+        camera_pos: camera position [x,y,z]
+        lookat:  camera focal point [x,y,z] OR 'y','-y','x','-x','z','-z' to go to 2D mode
+        projection: '2d' or '3d'
+        scale : parallel scale for 2d views
+        zoom_fit: adjust camera to view full scene (in its current state), defaults to True if no camera is given
+        transparent: render with a transparent background
+        **settings: values for the ViewportSettings, for example show_force=False
+
+    Examples:
+        >>> session = RenderSession(s, width=800, height=600, show_force=False)
+        >>> files = session.render_dofs(generate_modeshape_dofs(d0, D[:, 0], 1, 50, s), "frames")
+        >>> write_video(files, "mode1.mp4")
+    """
+
+    def __init__(
+        self,
+        scene,
+        width=1024,
+        height=600,
+        painters="Construction",
+        camera_pos=None,
+        lookat=None,
+        projection="3d",
+        scale=None,
+        zoom_fit=None,
+        transparent=False,
+        **settings,
+    ):
+        from DAVE.settings_visuals import PAINTERS
+
+        if zoom_fit is None:
+            zoom_fit = lookat is None and camera_pos is None
+        if lookat is None:
+            lookat = (0, 0, 0)
+        if camera_pos is None:
+            camera_pos = (50, -25, 10)
+
+        self.scene = scene
+        self.width = int(width)
+        self.height = int(height)
+        self.transparent = transparent
+
+        self.renderer = ImageRenderer(scene)
+        vp = self.renderer
+
+        if isinstance(painters, str):
+            if painters not in PAINTERS:
+                raise ValueError(
+                    f"Painters {painters} not found, available painters are: {PAINTERS.keys()}"
+                )
+            painters = PAINTERS[painters]
+        vp.settings.painter_settings = painters
+
+        for key, value in settings.items():
+            if not hasattr(vp.settings, key):
+                raise ValueError(f"{key} is not a valid viewport setting")
+            setattr(vp.settings, key, value)
+
+        vp._set_size(self.width, self.height)  # before zoom_all
+        vp.set_camera(
+            camera_pos=camera_pos, lookat=lookat, projection=projection, scale=scale
+        )
+        vp.update_visibility()
+        vp._camera_direction_changed()
+
+        if zoom_fit:
+            vp.zoom_all()
+
+        vp.renderer.ResetCameraClippingRange()
+        near, far = vp.camera.GetClippingRange()
+        vp.camera.SetClippingRange((1 / 100) * far, far)
+
+    def render(self, filename=None) -> "PIL.Image":
+        """Renders the scene in its current state and optionally saves the image to filename"""
+        vp = self.renderer
+        vp.position_visuals()
+        vp._camera_direction_changed()
+        vp.update_visibility()  # UC paint
+
+        image = vp.produce_pil_image(
+            width=self.width, height=self.height, transparent=self.transparent
+        )
+
+        if filename is not None:
+            image.save(filename)
+
+        return image
+
+    def render_dofs(self, dofs, folder, prefix="frame", start=0) -> list[Path]:
+        """Renders an image for each of the DOF vectors in dofs, for example the output of
+        mode_shapes.generate_modeshape_dofs. The DOFs of the scene are restored afterwards.
+
+        Returns:
+            list of the written files
+        """
+        core = self.scene._vfc
+        d0 = core.get_dofs()
+
+        Path(folder).mkdir(parents=True, exist_ok=True)
+
+        filenames = []
+        try:
+            for i, d in enumerate(dofs):
+                core.set_dofs(d)
+                self.scene.update()
+                filename = frame_filename(folder, prefix, start + i)
+                self.render(filename)
+                filenames.append(filename)
+        finally:
+            core.set_dofs(d0)
+            self.scene.update()
+
+        return filenames
+
+    def render_times(self, times, folder, prefix="frame", start=0) -> list[Path]:
+        """Renders an image for each of the given times of the timeline of the scene (scene.t)
+
+        Returns:
+            list of the written files
+        """
+        timeline = self.scene.t
+        if timeline is None:
+            raise ValueError("Scene does not have a timeline")
+
+        Path(folder).mkdir(parents=True, exist_ok=True)
+
+        filenames = []
+        for i, time in enumerate(times):
+            timeline.activate_time(time)
+            filename = frame_filename(folder, prefix, start + i)
+            self.render(filename)
+            filenames.append(filename)
+
+        return filenames
+
+    def render_timeline(
+        self, folder, prefix="frame", use_only_steps_with_labels=False
+    ) -> list[Path]:
+        """Renders an image for each step of the timeline of the scene (scene.t)
+
+        Returns:
+            list of the written files
+        """
+        timeline = self.scene.t
+        if timeline is None:
+            raise ValueError("Scene does not have a timeline")
+
+        times = list(timeline.times())
+        if use_only_steps_with_labels:
+            times = [t for t in times if timeline.get_label(t) is not None]
+
+        return self.render_times(times, folder, prefix)
+
+    def render_cases(self, cases, folder, prefix="case", solve=True) -> list[Path]:
+        """Renders an image for each case.
+
+        Args:
+            cases: list of dicts with (node-name, property-name) as key and the value for that case as value
+            solve: solve statics before rendering each case
+
+        The properties and DOFs of the scene are restored afterwards.
+
+        Returns:
+            list of the written files
+        """
+        s = self.scene
+        keys = {tuple(key) for case in cases for key in case.keys()}
+
+        for node_name, prop in keys:
+            if not hasattr(s[node_name], prop):
+                raise ValueError(f"Node {node_name} does not have a property {prop}")
+
+        original = {key: getattr(s[key[0]], key[1]) for key in keys}
+        d0 = s._vfc.get_dofs()
+
+        Path(folder).mkdir(parents=True, exist_ok=True)
+
+        filenames = []
+        try:
+            for i, case in enumerate(cases):
+                for (node_name, prop), value in case.items():
+                    setattr(s[node_name], prop, value)
+
+                if solve:
+                    s.solve_statics()
+                else:
+                    s.update()
+
+                filename = frame_filename(folder, prefix, i)
+                self.render(filename)
+                filenames.append(filename)
+        finally:
+            for (node_name, prop), value in original.items():
+                setattr(s[node_name], prop, value)
+            s._vfc.set_dofs(d0)
+            s.update()
+
+        return filenames
+
+
+def write_video(filenames, filename, fps=25):
+    """Combines the given image files into a video (mp4, avi, ...) or animated gif. Requires imageio
+    (and imageio-ffmpeg for video formats)"""
+    try:
+        import imageio
+    except ImportError:
+        raise ImportError(
+            "imageio is needed to write videos, install using pip install imageio[ffmpeg]"
+        )
+
+    if str(filename).lower().endswith(".gif"):
+        writer = imageio.get_writer(filename, mode="I", duration=1000 / fps)
+    else:
+        writer = imageio.get_writer(filename, fps=fps)
+
+    with writer:
+        for file in filenames:
+            writer.append_data(imageio.imread(file))
+
+
+def _create_worker_session(scene, **session_kwargs):
+    """Runs in a worker process after the scene has been created"""
+    global _worker_session
+    _worker_session = RenderSession(scene, **session_kwargs)
+
+
+def _render_batch(batch, kind, folder, prefix):
+    """Runs in a worker process, batch is a list of (index, dofs or time) with consecutive indices"""
+    start = batch[0][0]
+    values = [value for _, value in batch]
+    if kind == "dofs":
+        _worker_session.render_dofs(values, folder, prefix, start=start)
+    else:
+        _worker_session.render_times(values, folder, prefix, start=start)
+    return len(batch)
+
+
+def render_parallel(
+    scene,
+    folder,
+    dofs=None,
+    times=None,
+    prefix="frame",
+    n_workers=1,
+    batch_size=None,
+    feedback_func=None,
+    **session_kwargs,
+) -> list[Path]:
+    """Renders a sequence of DOF vectors (dofs) or timeline steps (times), optionally using a pool of worker processes.
+
+    session_kwargs are passed to RenderSession. By default all frames are rendered in this process. If n_workers is
+    larger than 1 (or None for the number of cpus) then each worker renders offscreen using its own copy of the scene
+    and its own RenderSession. Worker processes require the calling script to be protected by
+    if __name__ == "__main__" on platforms that spawn processes (Windows, macOS).
+
+    Returns:
+        list of the written files, in the order of the frames
+    """
+    if (dofs is None) == (times is None):
+        raise ValueError("Supply either dofs or times")
+
+    if dofs is not None:
+        kind = "dofs"
+        frames = [np.asarray(d, dtype=float) for d in dofs]
+    else:
+        kind = "times"
+        if scene.t is None:
+            raise ValueError("Scene does not have a timeline")
+        frames = list(times)
+
+    n_frames = len(frames)
+    Path(folder).mkdir(parents=True, exist_ok=True)
+
+    def give_feedback(txt):
+        if feedback_func is not None:
+            feedback_func(txt)
+
+    if n_workers == 1:
+        session = RenderSession(scene, **session_kwargs)
+        if kind == "dofs":
+            session.render_dofs(frames, folder, prefix)
+        else:
+            session.render_times(frames, folder, prefix)
+        give_feedback(f"Rendered {n_frames} of {n_frames} frames")
+
+    else:
+        if n_workers is None:
+            from os import cpu_count
+
+            n_workers = max(1, min(cpu_count() or 1, n_frames))
+
+        if batch_size is None:
+            batch_size = max(1, n_frames // (4 * n_workers))
+
+        batches = [
+            [(i, frames[i]) for i in range(start, min(start + batch_size, n_frames))]
+            for start in range(0, n_frames, batch_size)
+        ]
+
+        run_in_workers(
+            scene,
+            _render_batch,
+            [(batch, kind, folder, prefix) for batch in batches],
+            n_workers,
+            on_result=lambda job_index, n: n,
+            n_items=n_frames,
+            progress_text="Rendered {} of {} frames",
+            feedback_func=feedback_func,
+            worker_setup=partial(_create_worker_session, **session_kwargs),
+        )
+
+    return [frame_filename(folder, prefix, i) for i in range(n_frames)]
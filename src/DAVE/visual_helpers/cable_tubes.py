@@ -0,0 +1,196 @@
+"""Persistent vtk pipelines for drawing cables as tubes
+
+CableTube is the tube of a single cable. The polydata, tube-filter and data-arrays are created once. Updating the
+cable writes the new points and colors into numpy arrays that are shared with vtk (numpy2vtk with deep=False), the
+arrays are only re-allocated when the number of points changes.
+
+MergedCableTubes draws the tubes of many cables using a single polydata, tube-filter and actor. This is used by the
+scene renderers when ViewportSettings.merge_cables is set.
+"""
+
+import numpy as np
+
+from vtkmodules.vtkCommonCore import vtkPoints
+from vtkmodules.vtkCommonDataModel import vtkPolyData, vtkCellArray
+from vtkmodules.vtkFiltersCore import vtkTubeFilter
+
+from DAVE.visual_helpers.constants import CABLE_COLORMAP, CABLE_DIA_WHEN_DIA_IS_ZERO
+from DAVE.visual_helpers.vtkActorMakers import numpy2vtk, vtkActorFromPolyData
+
+TUBE_SIDES = 12
+
+
+def tension_colors(tensions) -> np.ndarray:
+    """Returns the colors for the given tensions as (n,3) uint8 RGB-255 values from CABLE_COLORMAP.
+    The colormap is scaled to the range of the tensions"""
+
+    c = np.asarray(tensions, dtype=float)
+
+    vmin = np.min(c) * 0.95
+    vmax = np.max(c) * 1.05
+
+    if vmin == vmax:
+        colors = np.tile(CABLE_COLORMAP(0.5), (len(c), 1))
+    else:
+        colors = CABLE_COLORMAP((c - vmin) / (vmax - vmin))
+
+    return (255 * np.asarray(colors)[:, :3]).astype(np.uint8)
+
+
+def tube_radius(diameter):
+    if diameter < 1e-6:
+        diameter = CABLE_DIA_WHEN_DIA_IS_ZERO
+    return diameter / 2
+
+
+def _polyline_cells(lengths) -> vtkCellArray:
+    """Cell array with a poly-line for each entry in lengths, the points are numbered consecutively"""
+    connectivity = []
+    offset = 0
+    for n in lengths:
+        connectivity.append([n])
+        connectivity.append(np.arange(offset, offset + n))
+        offset += n
+
+    cells = vtkCellArray()
+    if connectivity:
+        cells.SetCells(len(lengths), numpy2vtk(np.concatenate(connectivity), dtype="id"))
+    return cells
+
+
+class CableTube:
+    """Tube of a single cable"""
+
+    def __init__(self):
+        self.polydata = vtkPolyData()
+
+        self.tube = vtkTubeFilter()
+        self.tube.SetCapping(False)
+        self.tube.SetNumberOfSides(TUBE_SIDES)
+        self.tube.SetInputData(self.polydata)
+
+        self._points = None
+        """(n,3) float32 array backing the points of self.polydata"""
+        self._colors = None
+        """(n,3) uint8 array backing the TubeColors array of self.polydata"""
+
+    @property
+    def output(self) -> vtkPolyData:
+        """The tube. This is the same vtkPolyData object after every update"""
+        return self.tube.GetOutput()
+
+    def _allocate(self, n):
+        self._points = np.zeros((n, 3), dtype=np.float32)
+        points = vtkPoints()
+        points.SetData(numpy2vtk(self._points, deep=False))
+        self.polydata.SetPoints(points)
+        self.polydata.SetLines(_polyline_cells([n]))
+
+        self._colors = np.zeros((n, 3), dtype=np.uint8)
+        self.polydata.GetPointData().SetScalars(
+            numpy2vtk(self._colors, deep=False, name="TubeColors")
+        )
+
+    def update(self, points, diameter, tensions=None):
+        """Updates the tube to the given points (n,3), diameter and optional tensions (n) which are used for the
+        colors"""
+
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+
+        if self._points is None or len(self._points) != len(points):
+            self._allocate(len(points))
+
+        self._points[:] = points
+        self.polydata.GetPoints().GetData().Modified()
+        self.polydata.GetPoints().Modified()
+
+        if tensions is not None and len(points) > 0:
+            self._colors[:] = tension_colors(tensions)
+            self.polydata.GetPointData().GetScalars().Modified()
+
+        self.tube.SetRadius(tube_radius(diameter))
+        self.tube.Update()
+
+
+class MergedCableTubes:
+    """Tubes of many cables in a single actor.
+
+    The radius of each cable is passed to the tube-filter as point scalars (TubeRadius), the colors as point-field
+    data (TubeColors). The actor is not pickable.
+    """
+
+    def __init__(self):
+        self.polydata = vtkPolyData()
+
+        self.tube = vtkTubeFilter()
+        self.tube.SetCapping(False)
+        self.tube.SetNumberOfSides(TUBE_SIDES)
+        self.tube.SetVaryRadiusToVaryRadiusByAbsoluteScalar()
+        self.tube.SetInputData(self.polydata)
+
+        self.actor = vtkActorFromPolyData(self.tube.GetOutput())
+        self.actor.SetPickable(False)
+
+        mapper = self.actor.GetMapper()
+        mapper.SetScalarModeToUsePointFieldData()
+        mapper.SelectColorArray("TubeColors")
+        mapper.ScalarVisibilityOn()
+
+        self._lengths = None
+        self._points = None
+        self._radii = None
+        self._colors = None
+
+    @property
+    def n_cables(self) -> int:
+        return 0 if self._lengths is None else len(self._lengths)
+
+    def _allocate(self, lengths):
+        n = sum(lengths)
+
+        self._points = np.zeros((n, 3), dtype=np.float32)
+        points = vtkPoints()
+        points.SetData(numpy2vtk(self._points, deep=False))
+        self.polydata.SetPoints(points)
+        self.polydata.SetLines(_polyline_cells(lengths))
+
+        point_data = self.polydata.GetPointData()
+        self._radii = np.zeros(n, dtype=np.float32)
+        point_data.SetScalars(numpy2vtk(self._radii, deep=False, name="TubeRadius"))
+
+        self._colors = np.zeros((n, 3), dtype=np.uint8)
+        point_data.AddArray(numpy2vtk(self._colors, deep=False, name="TubeColors"))
+
+        self._lengths = lengths
+
+    def update(self, cables):
+        """Updates the tubes.
+
+        cables is a list with for each cable a tuple (points, diameter, colors) where
+        points is (n,3) and colors is a single RGB-255 color or (n,3) RGB-255 colors.
+        Cables with less than two points are skipped.
+        """
+
+        cables = [c for c in cables if len(c[0]) > 1]
+        lengths = tuple(len(c[0]) for c in cables)
+
+        if lengths != self._lengths:
+            self._allocate(lengths)
+
+        if not cables:
+            self.tube.Update()
+            return
+
+        self._points[:] = np.concatenate([np.asarray(c[0], dtype=float) for c in cables])
+        self._radii[:] = np.repeat([tube_radius(c[1]) for c in cables], lengths)
+        self._colors[:] = np.concatenate(
+            [np.broadcast_to(np.asarray(c[2]), (n, 3)) for c, n in zip(cables, lengths)]
+        )
+
+        self.polydata.GetPoints().GetData().Modified()
+        self.polydata.GetPoints().Modified()
+        point_data = self.polydata.GetPointData()
+        point_data.GetArray("TubeRadius").Modified()
+        point_data.GetArray("TubeColors").Modified()
+
+        self.tube.Update()
@@ -41,6 +41,9 @@ RESOLUTION_CABLE_SAG = 30  # NUMBER OF POINTS IN A CATENARY
 
 CABLE_DIA_WHEN_DIA_IS_ZERO = 0.1  # diameter of the cable when the diameter is zero
 
+SPMT_WHEEL_WIDTH = 1.0  # [m, a wheel is actually a pair of wheels]
+SPMT_WHEEL_RADIUS = 0.3  # [m]
+
 
 # ============ visuals :: colors ===========
 
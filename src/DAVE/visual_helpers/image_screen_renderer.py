@@ -1,4 +1,5 @@
 """This is a simple scene renderer, used for demonstrartion purposes. """
+import warnings
 from pathlib import Path
 
 import PIL
@@ -42,12 +43,62 @@ class ImageRenderer(AbstractSceneRenderer):
 
         return renderer, [renderer], camera, renwin
 
+    def set_camera(self, camera_pos=(50, -25, 10), lookat=(0, 0, 0), projection="3d", scale=None):
+        """Positions the camera.
+
+        Args:
+            camera_pos: camera position [x,y,z]
+            lookat:  camera focal point [x,y,z] OR 'y','-y','x','-x','z','-z' to go to 2D mode
+            projection: '2d' or '3d'
+            scale : parallel scale for 2d views
+        """
+        c = self.camera
+
+        if isinstance(lookat, str):  # go to 2d mode
+            c.SetPosition(*camera_pos)
+
+            if lookat == "x":
+                c.SetViewUp(0, 0, 1)
+                c.SetFocalPoint(camera_pos[0] + 1, camera_pos[1], camera_pos[2])
+            elif lookat == "-x":
+                c.SetViewUp(0, 0, 1)
+                c.SetFocalPoint(camera_pos[0] - 1, camera_pos[1], camera_pos[2])
+            elif lookat == "y":
+                c.SetViewUp(0, 0, 1)
+                c.SetFocalPoint(camera_pos[0], camera_pos[1] + 1, camera_pos[2])
+            elif lookat == "-y":
+                c.SetViewUp(0, 0, 1)
+                c.SetFocalPoint(camera_pos[0], camera_pos[1] - 1, camera_pos[2])
+            elif lookat == "z":
+                c.SetViewUp(0, -1, 0)
+                c.SetFocalPoint(camera_pos[0], camera_pos[1], camera_pos[2] + 1)
+            elif lookat == "-z":
+                c.SetViewUp(0, 1, 0)
+                c.SetFocalPoint(camera_pos[0], camera_pos[1], camera_pos[2] - 1)
+            else:
+                raise ValueError('Value for "lookat" shall be x, -x, y, -y, z, -z')
+
+            projection = "2d"
+
+        else:
+            c.SetPosition(*camera_pos)
+            c.SetFocalPoint(*lookat)
+            c.SetViewUp(0, 0, 1)
+
+        if projection == "2d":
+            c.ParallelProjectionOn()
+            if scale is not None:
+                c.SetParallelScale(scale)
+        else:
+            if scale is not None:
+                warnings.warn("Scale parameter is only used for 2d projections")
+
     def _set_size(self, width, height):
         width = int(width)
         height = int(height)
 
         size = self.window.GetSize()
-        if (width != size[0]) or (height != size[0]):
+        if (width != size[0]) or (height != size[1]):
             self.window.SetSize(width, height)
 
     def produce(self, width, height, filename: str or Path, scale: int = 1):
@@ -0,0 +1,127 @@
+"""Drawing the same geometry many times using a single actor
+
+InstancedMesh draws a polydata at many transforms using a vtkGlyph3DMapper. The transforms are passed as arrays
+(position, orientation matrix and scale per instance) that are shared with vtk; rendering is instanced on the GPU.
+
+This is used for the wheels of SPMTs and, when ViewportSettings.instance_visuals is set, for Visual nodes that use
+the same file.
+"""
+
+import numpy as np
+
+from vtkmodules.vtkCommonCore import vtkPoints
+from vtkmodules.vtkCommonDataModel import vtkPolyData
+from vtkmodules.vtkRenderingCore import vtkActor, vtkGlyph3DMapper
+
+from DAVE.visual_helpers.constants import ACTOR_COLOR, ACTOR_METALIC, ACTOR_ROUGHESS
+from DAVE.visual_helpers.vtkActorMakers import numpy2vtk
+
+
+def vtk_matrices_to_numpy(matrices) -> np.ndarray:
+    """Converts a list of vtkMatrix4x4 to a (n,4,4) array"""
+    return np.array(
+        [[[m.GetElement(i, j) for j in range(4)] for i in range(4)] for m in matrices],
+        dtype=float,
+    ).reshape(-1, 4, 4)
+
+
+class InstancedMesh:
+    """A single actor drawing source at each of the given transforms"""
+
+    def __init__(self, source: vtkPolyData):
+        self.instances = vtkPolyData()
+
+        mapper = self.create_mapper()
+        mapper.SetSourceData(source)
+        mapper.SetScalarModeToUsePointFieldData()
+        mapper.SelectColorArray("Colors")
+        mapper.ScalarVisibilityOff()
+
+        self.mapper = mapper
+
+        self.actor = vtkActor()
+        self.actor.SetMapper(mapper)
+
+        prop = self.actor.GetProperty()
+        prop.SetInterpolationToPBR()
+        prop.SetColor(ACTOR_COLOR)
+        prop.SetMetallic(ACTOR_METALIC)
+        prop.SetRoughness(ACTOR_ROUGHESS)
+
+        self._positions = None
+        self._orientations = None
+        self._scales = None
+        self._colors = None
+
+    def create_mapper(self) -> vtkGlyph3DMapper:
+        """Creates a mapper that places its source at the instances of this mesh. Used for the actor of this mesh and
+        for its outline (see VisualOutline)"""
+        mapper = vtkGlyph3DMapper()
+        mapper.SetInputData(self.instances)
+
+        mapper.SetOrientationModeToMatrix()
+        mapper.SetOrientationArray("Orientation")
+
+        mapper.SetScaling(True)
+        mapper.SetScaleModeToScaleByVectorComponents()
+        mapper.SetScaleArray("Scale")
+
+        return mapper
+
+    @property
+    def n_instances(self) -> int:
+        return 0 if self._positions is None else len(self._positions)
+
+    def _allocate(self, n):
+        self._positions = np.zeros((n, 3), dtype=float)
+        points = vtkPoints()
+        points.SetData(numpy2vtk(self._positions, deep=False))
+        self.instances.SetPoints(points)
+
+        point_data = self.instances.GetPointData()
+
+        self._orientations = np.zeros((n, 9), dtype=float)
+        point_data.AddArray(numpy2vtk(self._orientations, deep=False, name="Orientation"))
+
+        self._scales = np.ones((n, 3), dtype=float)
+        point_data.AddArray(numpy2vtk(self._scales, deep=False, name="Scale"))
+
+        self._colors = np.zeros((n, 3), dtype=np.uint8)
+        point_data.AddArray(numpy2vtk(self._colors, deep=False, name="Colors"))
+
+    def update(self, matrices, colors=None):
+        """Places the instances.
+
+        matrices : (n,4,4) transforms; rotation, scale and translation (numpy convention, translation in the last
+                   column). Shear is not supported.
+        colors : optional (n,3) RGB-255 colors of the instances, if None then the color of the actor is used
+        """
+        m = np.asarray(matrices, dtype=float).reshape(-1, 4, 4)
+        n = len(m)
+
+        if n != self.n_instances:
+            self._allocate(n)
+
+        self._positions[:] = m[:, :3, 3]
+
+        # split the 3x3 part in rotation and scale (norms of the columns)
+        A = m[:, :3, :3]
+        scales = np.linalg.norm(A, axis=1)
+        scales[:, 0] *= np.where(np.linalg.det(A) < 0, -1, 1)  # mirrored
+        R = A / np.where(scales == 0, 1, scales)[:, None, :]
+
+        self._scales[:] = scales
+        self._orientations[:] = R.transpose(0, 2, 1).reshape(n, 9)  # column-major, as expected by vtkGlyph3DMapper
+
+        if colors is not None:
+            self._colors[:] = colors
+            self.mapper.ScalarVisibilityOn()
+        else:
+            self.mapper.ScalarVisibilityOff()
+
+        self.instances.GetPoints().GetData().Modified()
+        self.instances.GetPoints().Modified()
+        point_data = self.instances.GetPointData()
+        for name in ("Orientation", "Scale", "Colors"):
+            point_data.GetArray(name).Modified()
+        self.instances.Modified()
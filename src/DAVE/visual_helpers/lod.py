@@ -0,0 +1,102 @@
+"""Level of detail for large meshes
+
+Meshes with many triangles (hulls, cranes) make rotating the viewport slow. For those meshes decimated variants are
+created (vtkQuadricDecimation) and the actor shows a variant depending on the size of the actor on the screen or,
+optionally, the coarsest variant while the camera is being moved.
+
+The decimated variants are created when needed and stored with the full-resolution polydata. So actors sharing
+polydata (see vtkActorMakers.cached_polydata_from_file) also share the decimated variants.
+
+Thresholds are defined in ViewportSettings (lod_...), see AbstractSceneRenderer.update_lod
+"""
+
+import numpy as np
+
+from vtkmodules.vtkCommonDataModel import vtkPolyData
+from vtkmodules.vtkFiltersCore import vtkQuadricDecimation, vtkTriangleFilter
+
+from DAVE.settings_visuals import ViewportSettings
+
+
+def decimate(polydata: vtkPolyData, reduction: float) -> vtkPolyData:
+    """Returns a copy of polydata with approximately a fraction "reduction" of the triangles removed"""
+    tri = vtkTriangleFilter()
+    tri.SetInputData(polydata)
+
+    decimation = vtkQuadricDecimation()
+    decimation.SetInputConnection(tri.GetOutputPort())
+    decimation.SetTargetReduction(reduction)
+    decimation.VolumePreservationOn()
+    decimation.Update()
+
+    result = vtkPolyData()
+    result.ShallowCopy(decimation.GetOutput())
+    return result
+
+
+def screen_size(renderer, actor) -> float:
+    """Approximate size [pixels] of the bounding box of actor on the screen"""
+    bounds = actor.GetBounds()
+    if bounds is None or bounds[0] > bounds[1]:  # empty
+        return 0.0
+
+    b = np.array(bounds, dtype=float).reshape(3, 2)
+    diagonal = np.linalg.norm(b[:, 1] - b[:, 0])
+    center = b.mean(axis=1)
+
+    camera = renderer.GetActiveCamera()
+    if camera.GetParallelProjection():
+        view_height = 2 * camera.GetParallelScale()
+    else:
+        distance = np.linalg.norm(center - np.array(camera.GetPosition()))
+        view_height = 2 * distance * np.tan(np.deg2rad(camera.GetViewAngle() / 2))
+
+    if view_height <= 0:
+        return float("inf")
+
+    return diagonal / view_height * renderer.GetSize()[1]
+
+
+def select_level(settings: ViewportSettings, pixels: float, interacting: bool) -> int:
+    """Returns the level of detail; 0 for full resolution, i for lod_reductions[i-1]"""
+    if interacting and settings.lod_when_interacting:
+        return len(settings.lod_reductions)
+
+    level = 0
+    for i, size in enumerate(settings.lod_screen_sizes):
+        if pixels < size:
+            level = i + 1
+    return level
+
+
+class MeshLOD:
+    """Full resolution and decimated variants of the polydata of an actor"""
+
+    def __init__(self, full: vtkPolyData):
+        self.full = full
+        self.level = 0  # currently shown level
+
+    def polydata(self, level: int, reductions) -> vtkPolyData:
+        if level == 0:
+            return self.full
+
+        reduction = reductions[level - 1]
+
+        decimated = getattr(self.full, "_decimated", None)
+        if decimated is None:
+            decimated = dict()
+            self.full._decimated = decimated
+
+        if reduction not in decimated:
+            decimated[reduction] = decimate(self.full, reduction)
+
+        return decimated[reduction]
+
+    def apply(self, actor, level: int, reductions) -> bool:
+        """Shows the given level on actor, returns True if this changed the shown level"""
+        if level == self.level:
+            return False
+
+        actor.GetMapper().SetInputData(self.polydata(level, reductions))
+        self.level = level
+        return True
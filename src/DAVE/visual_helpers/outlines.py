@@ -19,6 +19,9 @@ class VisualOutline:
 
     The feature-edges do not depend on the camera angle, while the silhouette does.
 
+    Instanced actors (actors with an _instances attribute, see instancing.InstancedMesh) are outlined by the feature
+    edges of their source, drawn at the same instances. Silhouettes are not available for those.
+
 
 
     Actor.Data -> TransformFilter -> EdgeDetection -> Actor
@@ -43,7 +46,7 @@ class VisualOutline:
         - it is not an annotation
         - it is not a wireframe
         - it does not have the no_outline attribute set to True
-        - it is a polydata actor
+        - it is a polydata actor or an instanced actor
         """
         if isinstance(
                 actor.GetProperty(), vtkProperty2D
@@ -59,6 +62,9 @@ class VisualOutline:
         if getattr(actor, "no_outline", False):
             return False
 
+        if getattr(actor, "_instances", None) is not None:
+            return True
+
         if not isinstance(actor.GetMapper(), vtkPolyDataMapper):
             return False
 
@@ -67,6 +73,11 @@ class VisualOutline:
     def __init__(self, actor : vtkActor, camera : vtkCamera, linewidth):
         """Creates an outline for an actor"""
 
+        instances = getattr(actor, "_instances", None)
+        if instances is not None:
+            self._create_instanced(actor, instances, linewidth)
+            return
+
         # create a clean copy of the polydata of the actor
         cleaner = vtkCleanPolyData()
         cleaner.SetInputData(actor.GetMapper().GetInputAsDataSet())
@@ -118,6 +129,32 @@ class VisualOutline:
         self.outline_actor = outline_actor
         self.outline_transform = tr
 
+    def _create_instanced(self, actor: vtkActor, instances, linewidth):
+        """Feature edges of the source of an instanced actor, drawn at the same instances"""
+        ol = vtkFeatureEdges()
+        ol.SetColoring(False)
+        ol.SetInputData(instances.mapper.GetSource())
+        ol.ExtractAllEdgeTypesOff()
+        ol.BoundaryEdgesOn()
+        ol.SetFeatureAngle(25)
+        ol.FeatureEdgesOn()
+
+        mapper = instances.create_mapper()
+        mapper.SetSourceConnection(ol.GetOutputPort())
+        mapper.ScalarVisibilityOff()  # No colors!
+
+        outline_actor = vtkActor()
+        outline_actor.SetMapper(mapper)
+        outline_actor.SetPickable(False)
+        outline_actor.GetProperty().SetColor(0, 0, 0)
+        outline_actor.GetProperty().SetLineWidth(linewidth)
+
+        # the instances are placed by the mapper, the matrix of the actor is applied in update
+        self.is_silhouette = False
+        self.outlined_actor = actor
+        self.outline_actor = outline_actor
+        self.outline_transform = None
+
 
 
     def update(self):
@@ -99,6 +99,14 @@ class QtEmbeddedSceneRenderer(AbstractSceneRenderer):
 
         style = self.Style
         iren.SetInteractorStyle(style)
+
+        # the camera is moved with the middle mouse button, use the coarse level of detail meanwhile
+        style.AddObserver(
+            vtkCommand.MiddleButtonPressEvent, lambda *args: self.set_interacting(True)
+        )
+        style.AddObserver(
+            vtkCommand.MiddleButtonReleaseEvent, lambda *args: self.set_interacting(False)
+        )
         # iren.Initialize()  # not here, do it after the entire pipeline is set up and the PBR is set
 
         camera = renderer.GetActiveCamera()
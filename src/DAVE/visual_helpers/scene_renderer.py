@@ -31,8 +31,11 @@ from vtkmodules.vtkRenderingCore import (
 )
 
 
-from DAVE.settings_visuals import ViewportSettings, PAINTERS, UC_IMAGE
+from DAVE.settings_visuals import ViewportSettings, PAINTERS, UC_IMAGE, COLOR_SELECT_255
 from DAVE.visual_helpers.actors import VisualActor
+from DAVE.visual_helpers.cable_tubes import MergedCableTubes, tension_colors
+from DAVE.visual_helpers.instancing import InstancedMesh, vtk_matrices_to_numpy
+from DAVE.visual_helpers.lod import MeshLOD, screen_size, select_level
 from DAVE.visual_helpers.constants import *
 from DAVE.visual_helpers.outlines import VisualOutline
 from DAVE.visual_helpers.overlay_actor import OverlayActor
@@ -50,7 +53,7 @@ from DAVE.visual_helpers.vtkActorMakers import (
     actor_from_trimesh,
     Cylinder,
     Circle,
-    actors_from_gltf,
+    cached_actors_from_gltf,
 )
 from DAVE.visual_helpers.vtkHelpers import (
     transform_from_direction,
@@ -59,6 +62,7 @@ from DAVE.visual_helpers.vtkHelpers import (
     SetMatrixIfDifferent,
     create_tube_data,
     SetTransformIfDifferent,
+    update_mesh_to_empty,
 )
 
 import DAVE.nodes as dn
@@ -70,7 +74,7 @@ def visual_actors_from_file(file, actors_dict: dict, N: dn.Visual):
 
     if str(file).lower().endswith("glb"):
 
-        gltf_actors = actors_from_gltf(file)
+        gltf_actors = cached_actors_from_gltf(file)
 
         if not gltf_actors:
             raise ValueError(f"No actors were created from GLTF file {file}")
@@ -139,6 +143,15 @@ class AbstractSceneRenderer:
 
         self.temporary_actors: list[vtkActor] = list()
 
+        """All cable tubes in a single actor, used when settings.merge_cables is set"""
+        self.merged_cables: MergedCableTubes or None = None
+        self.merged_cables_changed = False
+        """Set by the cable visuals when the data of a merged cable changed, see update_merged_cables"""
+        self._merged_cables_key = None
+
+        """Visuals sharing the same file drawn by a single actor per file, used when settings.instance_visuals is set"""
+        self.instanced_visuals: dict[str, InstancedMesh] = dict()
+
         """These are all non-node-bound visuals , visuals for the global environment"""
         self.sea_visuals = dict()
         self.origin_visuals = dict()
@@ -153,6 +166,9 @@ class AbstractSceneRenderer:
         """If true, only quick updates are performed"""
         self.quick_updates_only = False
 
+        """True while the camera is being moved by the user, see set_interacting"""
+        self.interacting = False
+
         # set up the rendering pipeline
         (
             self.renderer,
@@ -173,6 +189,9 @@ class AbstractSceneRenderer:
         self.add_new_node_actors_to_screen()
         self.position_visuals()
 
+        if self.renderer is not None:
+            self.renderer.AddObserver("StartEvent", self.update_lod)
+
     def create_rendering_pipeline(
         self,
     ) -> tuple[vtkRenderer, list[vtkRenderer], vtkCamera, vtkRenderWindow]:
@@ -545,7 +564,7 @@ class AbstractSceneRenderer:
 
                 # This is the source-mesh. Connect it to the parent
                 vis = actor_from_trimesh(
-                    N.trimesh._TriMesh
+                    N.trimesh
                 )  # returns a small cube if no trimesh is defined
 
                 vis.actor_type = ActorType.MESH_OR_CONNECTOR
@@ -589,7 +608,7 @@ class AbstractSceneRenderer:
                 # filled part of mesh (added later)
 
                 # This is the source-mesh. Connect it to the parent
-                vis = actor_from_trimesh(N.trimesh._TriMesh)
+                vis = actor_from_trimesh(N.trimesh)
 
                 vis.actor_type = ActorType.MESH_OR_CONNECTOR
 
@@ -610,7 +629,7 @@ class AbstractSceneRenderer:
 
                 # This is the source-mesh. Connect it to the parent
 
-                vis = actor_from_trimesh(N.trimesh._TriMesh)
+                vis = actor_from_trimesh(N.trimesh)
                 if not vis:
                     vis = Dummy()
 
@@ -780,14 +799,21 @@ class AbstractSceneRenderer:
                 # the length extents half the distance between the axles
                 # the width extents half the wheel_width
 
-                WHEEL_WIDTH = 1.0  # [m, a wheel is actually a pair of wheels]
-                TOP_THICKNESS = 0.5  # m
-
-                top_length = N.n_length * N.spacing_length
-                top_width = (N.n_width - 1) * N.spacing_width + WHEEL_WIDTH
-
                 actors["main"] = Cube(side=1)
 
+                # all wheels in a single actor, placed by update_geometry
+                wheel = Cylinder(
+                    pos=(0, 0, 0),
+                    r=SPMT_WHEEL_RADIUS,
+                    height=SPMT_WHEEL_WIDTH,
+                    axis=(0, 1, 0),
+                    res=24,
+                )
+                wheels = InstancedMesh(wheel.GetMapper().GetInput())
+                wheels.actor._instances = wheels
+                wheels.actor.do_silhouette = False  # outlined by the feature edges of the instances
+                actors["wheel"] = wheels.actor
+
                 gp = N.get_actual_global_points()
                 if gp:
                     a = Line(gp, lw=3)
@@ -887,11 +913,201 @@ class AbstractSceneRenderer:
         for V in self.node_visuals:
             V.update_geometry(viewport=self)
 
+        self.update_merged_cables()
+        self.update_instanced_visuals()
+
         self.update_outlines()
 
         for L in self.layers:
             L.update()
 
+    def update_merged_cables(self):
+        """Creates, updates or removes the actor holding the tubes of all cables (settings.merge_cables)
+
+        The data of the cables is collected by update_geometry of the cable visuals. The tubes are only re-built if
+        that data changed (merged_cables_changed) or if the selection, visibility or coloring of the cables changed.
+        """
+        if not self.settings.merge_cables:
+            if self.merged_cables is not None:
+                if self.renderer is not None:
+                    self.remove(self.merged_cables.actor)
+                self.merged_cables = None
+            return
+
+        if self.merged_cables is None:
+            self.merged_cables = MergedCableTubes()
+            self.merged_cables_changed = True
+            if self.renderer is not None:
+                self.add(self.merged_cables.actor)
+
+        ps = self.settings.painter_settings
+        visuals = []
+        for V in self.node_visuals:
+            node = V.node
+            if not isinstance(node, dn.Cable) or not node._render_as_tube:
+                continue
+            if not node.is_valid or not node.visible:
+                continue
+            if getattr(V.actors["main"], "_actual_points", None) is None:
+                continue
+            visuals.append(V)
+
+        key = (
+            id(ps),
+            self.settings.paint_uc,
+            tuple(
+                (
+                    id(V),
+                    V._is_selected,
+                    V.node.color,
+                    V.node.do_color_by_tension,
+                )
+                for V in visuals
+            ),
+        )
+        if key == self._merged_cables_key and not self.merged_cables_changed:
+            return
+
+        self._merged_cables_key = key
+        self.merged_cables_changed = False
+
+        cables = []
+        for V in visuals:
+            node = V.node
+            A = V.actors["main"]
+            points = A._actual_points
+
+            if V._is_selected:
+                color = COLOR_SELECT_255
+            elif node.color is not None:
+                color = node.color
+            elif node.do_color_by_tension and not self.settings.paint_uc:
+                color = tension_colors(A._actual_tensions)
+            else:
+                color = ps["Cable"]["main"].surfaceColor
+
+            cables.append((points, A._actual_diameter, color))
+
+        self.merged_cables.update(cables)
+
+    def update_instanced_visuals(self):
+        """Draws the Visual nodes that use the same file using a single actor per file (settings.instance_visuals)
+
+        The geometry of the actors of these nodes is emptied, their transform, color and visibility is used to
+        place the instances.
+        """
+
+        groups = dict()  # file -> list of visual actors
+        if self.settings.instance_visuals:
+            for V in self.node_visuals:
+                if isinstance(V.node, dn.Visual) and len(V.actors) == 1:
+                    groups.setdefault(V.actors["main"].loaded_obj, []).append(V)
+            groups = {file: group for file, group in groups.items() if len(group) > 1}
+
+        # the actors of the nodes themselves
+        instanced = {V for group in groups.values() for V in group}
+        for V in self.node_visuals:
+            if not isinstance(V.node, dn.Visual):
+                continue
+
+            A = V.actors["main"]
+            source = getattr(A, "_instanced_source", None)
+            if V in instanced:
+                if source is None:
+                    lod = getattr(A, "_lod", None)
+                    if lod is not None:
+                        A._instanced_source = lod.full
+                        lod.level = 0
+                    else:
+                        A._instanced_source = A.GetMapper().GetInput()
+                    update_mesh_to_empty(A)
+                    A._vertices_changed = True  # re-create outline
+            elif source is not None:
+                A.GetMapper().SetInputData(source)
+                A._instanced_source = None
+                A._vertices_changed = True
+
+        # the instanced actors
+        for file in list(self.instanced_visuals.keys()):
+            if file not in groups:
+                self.remove(self.instanced_visuals[file].actor)
+                del self.instanced_visuals[file]
+
+        for file, group in groups.items():
+            instances = self.instanced_visuals.get(file, None)
+            if instances is None:
+                instances = InstancedMesh(group[0].actors["main"]._instanced_source)
+                instances.actor.SetPickable(False)
+                self.instanced_visuals[file] = instances
+                if self.renderer is not None:
+                    self.add(instances.actor)
+
+            actors = [V.actors["main"] for V in group]
+            actors = [A for A in actors if A.GetVisibility()]
+
+            if actors:
+                instances.actor.GetProperty().DeepCopy(actors[0].GetProperty())
+
+            colors = [[255 * c for c in A.GetProperty().GetColor()] for A in actors]
+            instances.update(
+                vtk_matrices_to_numpy([A.GetMatrix() for A in actors]),
+                colors=np.array(colors, dtype=float).reshape(-1, 3),
+            )
+
+    def set_interacting(self, interacting: bool):
+        """To be called when the user starts and stops moving the camera. Used for the level of detail"""
+        self.interacting = interacting
+        if self.update_lod() and not interacting:
+            self.window.Render()  # back to full detail
+
+    def update_lod(self, *args) -> bool:
+        """Selects the level of detail of large meshes depending on their size on the screen and self.interacting,
+        see ViewportSettings.lod_...
+
+        Called at the start of every render. Returns True if the level of any of the actors changed.
+        """
+        if self.renderer is None:
+            return False
+
+        settings = self.settings
+        changed = False
+
+        for V in self.node_visuals:
+            node = V.node
+            if isinstance(node, dn.Visual):
+                actors = V.actors.values()
+            elif isinstance(node, (dn.Buoyancy, dn.ContactMesh, dn.Tank)):
+                actors = (V.actors["main"],)
+            else:
+                continue
+
+            for A in actors:
+                if getattr(A, "_instanced_source", None) is not None:
+                    continue  # drawn by an instanced actor
+
+                lod = getattr(A, "_lod", False)
+                if lod is False:  # not yet evaluated
+                    full = A.GetMapper().GetInput()
+                    if full is not None and full.GetNumberOfPolys() >= settings.lod_min_triangles:
+                        lod = MeshLOD(full)
+                    else:
+                        lod = None
+                    A._lod = lod
+
+                if lod is None:
+                    continue
+
+                if settings.lod_enabled and A.GetVisibility():
+                    level = select_level(
+                        settings, screen_size(self.renderer, A), self.interacting
+                    )
+                else:
+                    level = 0
+
+                changed = lod.apply(A, level, settings.lod_reductions) or changed
+
+        return changed
+
     def add_temporary_actor(self, actor: vtkActor):
         self.temporary_actors.append(actor)
         if self.renderer:
@@ -976,6 +1192,8 @@ class AbstractSceneRenderer:
                     for A in va.actors.values():
                         self.renderer.AddActor(A)
 
+                    va.invalidate_geometry()  # new actors are not yet positioned
+
                     # self.add(va.actors["main"])
 
                 if (
@@ -986,7 +1204,7 @@ class AbstractSceneRenderer:
                     if va.node.trimesh._new_mesh:
                         # va.node.update() # the whole scene is already updated when executing code
 
-                        new_mesh = actor_from_trimesh(va.node.trimesh._TriMesh)
+                        new_mesh = actor_from_trimesh(va.node.trimesh)
                         new_mesh.no_outline = True
 
                         if isinstance(va.node, dn.ContactMesh):
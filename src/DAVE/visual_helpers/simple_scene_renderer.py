@@ -27,6 +27,8 @@ class SimpleSceneRenderer(AbstractSceneRenderer):
 
         style = vtkInteractorStyleTrackballCamera()
         self.interactor.SetInteractorStyle(style)
+        style.AddObserver('StartInteractionEvent', lambda *args: self.set_interacting(True))
+        style.AddObserver('EndInteractionEvent', lambda *args: self.set_interacting(False))
 
         renderer.AddObserver('EndEvent', self.render_layers)
 
@@ -8,6 +8,7 @@ Helpers:
 
 - polyDataFromVerticesAndFaces - creates a vtkPolyData object from vertices and faces
 - polyDataLineFromPoints - creates a vtkPolyData object from a list of points
+- cached_polydata_from_file - reads a file once and shares the resulting vtkPolyData
 
 Actor creators:
 
@@ -16,6 +17,7 @@ Actor creators:
 
 - Mesh
 - vp_actor_from_file
+- cached_actors_from_gltf
 
 - actor_from_trimesh
 - actor_from_vertices_and_faces
@@ -29,6 +31,8 @@ Actor creators:
 
 
 """
+import os
+
 import numpy as np
 
 from vtkmodules.util.numpy_support import numpy_to_vtkIdTypeArray, numpy_to_vtk
@@ -205,29 +209,37 @@ def PlaneXY(size=1):
     return vtkActorFromPolyData(source.GetOutput())
 
 
-def actor_from_trimesh(trimesh):
-    """Creates a vedo.Mesh from a DAVEcore.TriMesh"""
+def _trimesh_arrays(trimesh):
+    """Returns the vertices (N,3) and faces (M,3) of a TriMeshSource node or DAVEcore.TriMesh as numpy arrays.
 
-    if trimesh.nFaces == 0:
-        return Dummy()
+    For a TriMeshSource the cached arrays of the node are used, so no per-vertex python calls are needed.
+    """
+    if getattr(trimesh, "_TriMesh", None) is not None:  # TriMeshSource
+        return trimesh.vertices, trimesh.faces
+
+    vertices = np.array([trimesh.GetVertex(i) for i in range(trimesh.nVertices)], dtype=float)
+    faces = np.array([trimesh.GetFace(i) for i in range(trimesh.nFaces)], dtype=int)
+    return vertices.reshape((-1, 3)), faces.reshape((-1, 3))
+
+
+def actor_from_trimesh(trimesh):
+    """Creates a vtkActor from a TriMeshSource node or DAVEcore.TriMesh"""
 
-    vertices = [trimesh.GetVertex(i) for i in range(trimesh.nVertices)]
-    # are the vertices unique?
+    vertices, faces = _trimesh_arrays(trimesh)
 
-    faces = [trimesh.GetFace(i) for i in range(trimesh.nFaces)]
+    if len(faces) == 0:
+        return Dummy()
 
     return Mesh(vertices, faces)
 
 
 def polydata_from_trimesh(trimesh):
-    """Creates a vtkPolyData object from a DAVEcore.TriMesh"""
+    """Creates a vtkPolyData object from a TriMeshSource node or DAVEcore.TriMesh"""
 
-    if trimesh.nFaces == 0:
-        return Dummy()
+    vertices, faces = _trimesh_arrays(trimesh)
 
-    vertices = [trimesh.GetVertex(i) for i in range(trimesh.nVertices)]
-    # are the vertices unique?
-    faces = [trimesh.GetFace(i) for i in range(trimesh.nFaces)]
+    if len(faces) == 0:
+        return Dummy()
 
     vertices, faces = RemoveDuplicateVertices(vertices, faces)
 
@@ -323,23 +335,77 @@ def actors_from_gltf(filename):
     return R
 
 
-def vp_actor_from_file(filename):
+# Files are often used by many nodes (for example res: cog.obj for every RigidBody, or the same visual for
+# all pile-guides on a deck). The data read from a file is cached such that it is read and stored only once.
+# Key is (filename, kind), value is (modification time, data). Only the data of the latest version of a file is kept.
+_FILE_CACHE = dict()
 
 
-    source = polydata_from_file(filename)
+def _cached_file_data(filename, kind, read):
+    """Returns the cached data of kind for filename, calls read(filename) if the file is not cached or was
+    modified after it was cached"""
+    filename = str(filename)
+    try:
+        mtime = os.path.getmtime(filename)
+    except OSError:
+        mtime = None
+
+    key = (filename, kind)
+    cached = _FILE_CACHE.get(key, None)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, read(filename))
+        _FILE_CACHE[key] = cached  # replaces the data of an older version of the file
+
+    return cached[1]
 
-    mapper = vtkPolyDataMapper()
-    mapper.SetInputConnection(source.GetOutputPort())
-    mapper.Update()
 
-    #
-    # # We are not importing textures and materials.
-    # # Set color to 'w' to enforce an uniform color
-    # vpa = vp.Mesh(mapper.GetInputAsDataSet(), c="w")  # need to set color here
+def clear_file_cache():
+    _FILE_CACHE.clear()
 
-    # vpa = vp.Mesh(filename, c="w")
 
-    actor = vtkActorFromPolyData(mapper.GetInputAsDataSet())
+def cached_polydata_from_file(filename) -> vtkPolyData:
+    """Returns the polydata read from a file (see polydata_from_file).
+
+    The file is read only once. The same vtkPolyData object is returned on subsequent calls, so it shall not
+    be modified.
+    """
+    return _cached_file_data(
+        filename, "polydata", lambda file: polydata_from_file(file).GetOutput()
+    )
+
+
+def cached_actors_from_gltf(filename) -> list:
+    """Same as actors_from_gltf, but the file is imported only once.
+
+    The returned actors are new actors (with their own mapper and property) that share the polydata and textures
+    of the imported ones.
+    """
+    templates = _cached_file_data(filename, "gltf", actors_from_gltf)
+
+    R = []
+    for template in templates:
+        template_mapper = template.GetMapper()
+        mapper = template_mapper.NewInstance()
+        mapper.ShallowCopy(template_mapper)
+        mapper.SetInputData(template_mapper.GetInput())
+
+        actor = vtkActor()
+        actor.SetMapper(mapper)
+        actor.GetProperty().DeepCopy(template.GetProperty())
+        if template.GetTexture() is not None:
+            actor.SetTexture(template.GetTexture())
+        actor.SetUserMatrix(template.GetUserMatrix())
+
+        R.append(actor)
+
+    return R
+
+
+def vp_actor_from_file(filename):
+    """Creates an actor for a file. The polydata is shared with other actors for the same file,
+    see cached_polydata_from_file"""
+
+    actor = vtkActorFromPolyData(cached_polydata_from_file(filename))
 
     return actor
 
@@ -52,7 +52,7 @@ from vtkmodules.vtkRenderingCore import vtkTexture, vtkProp3D
 
 from scipy.spatial import ConvexHull
 
-from DAVE.visual_helpers.constants import CABLE_COLORMAP
+from DAVE.visual_helpers.cable_tubes import CableTube, tension_colors
 from DAVE.visual_helpers.vtkActorMakers import *
 
 import DAVE.nodes as dn
@@ -552,42 +552,13 @@ def update_mesh_to_empty(actor):
 
 
 def create_tube_data(new_points, diameter, colors=None):
-    """Updates the points of a line-actor"""
-
-    points = vtkPoints()
-    for p in new_points:
-        points.InsertNextPoint(p)
-
-    line = vtkPolyLine()
-    line.GetPointIds().SetNumberOfIds(len(new_points))
-    for i in range(len(new_points)):
-        line.GetPointIds().SetId(i, i)
-
-    lines = vtkCellArray()
-    lines.InsertNextCell(line)
-
-    polyln = vtkPolyData()
-    polyln.SetPoints(points)
-    polyln.SetLines(lines)
-
-    if colors is not None:
-        cc = get_color_array(colors)
-        cc.SetName("TubeColors")
-        polyln.GetPointData().SetScalars(cc)
-
-    tuf = vtkTubeFilter()
-    tuf.SetCapping(False)
-    tuf.SetNumberOfSides(12)
-    tuf.SetInputData(polyln)
-
-    if diameter < 1e-6:
-        diameter = CABLE_DIA_WHEN_DIA_IS_ZERO
-
-    tuf.SetRadius(diameter / 2)
+    """Creates tube data for a line through new_points.
 
-    tuf.Update()
-
-    return tuf.GetOutput()
+    For repeated updates of the same cable use a cable_tubes.CableTube instead, that re-uses its pipeline
+    """
+    tube = CableTube()
+    tube.update(new_points, diameter, tensions=colors)
+    return tube.output
 
 
 def get_color_array(c):
@@ -596,26 +567,7 @@ def get_color_array(c):
     c is a list of floats for which the corrsponding colors should be returned
 
     """
-
-    cc = vtkUnsignedCharArray()
-    cc.SetName("TubeColors")
-    cc.SetNumberOfComponents(3)
-    cc.SetNumberOfTuples(len(c))
-
-    vmin = min(c) * 0.95
-    vmax = max(c) * 1.05
-
-    if vmin == vmax:
-        CONST_VALUE = CABLE_COLORMAP(0.5)
-        colors = [CONST_VALUE for col in c]
-
-    # scale the colors to the range 0-1 using vmin and vmax
-    else:
-        colors = [CABLE_COLORMAP((col - vmin) / (vmax - vmin)) for col in c]
-
-    for i, (r, g, b, _) in enumerate(colors):
-        cc.InsertTuple3(i, int(255 * r), int(255 * g), int(255 * b))
-    return cc
+    return numpy2vtk(tension_colors(c), name="TubeColors")
 
 
 def apply_parent_translation_on_transform(parent, t: vtkTransform):
@@ -647,8 +599,7 @@ def _create_moment_or_shear_line(what, frame: dn.Frame, scale_to=2, at=None):
 
     report_axis = at
 
-    start = report_axis.to_glob_position((x[0], 0, 0))
-    end = report_axis.to_glob_position((x[-1], 0, 0))
+    start, end = report_axis.to_glob_positions([(x[0], 0, 0), (x[-1], 0, 0)])
 
     n = len(x)
     scale = scale_to
@@ -666,7 +617,10 @@ def _create_moment_or_shear_line(what, frame: dn.Frame, scale_to=2, at=None):
         scale = 0
     else:
         scale = scale / np.max(np.abs(value))
-    line = [report_axis.to_glob_position((x[i], 0, scale * value[i])) for i in range(n)]
+    local = np.zeros((n, 3))
+    local[:, 0] = x
+    local[:, 2] = scale * np.asarray(value)
+    line = report_axis.to_glob_positions(local)
 
     actor_axis = Line([start, end], color=[0, 0, 0], lw=3)
     actor_graph = Line(line, color=color, lw=3)
@@ -786,14 +740,14 @@ def VisualToSlice(
     file = scene.get_resource_path(visual_node.path)
 
     # create poly-data from file
-    source = polydata_from_file(file)
+    source = cached_polydata_from_file(file)
     rotation = visual_node.rotation
     offset = visual_node.offset
     scale = visual_node.scale
     parent = visual_node.parent
 
     return PolyDataToSlice(
-        source=source.GetOutput(),
+        source=source,
         offset=offset,
         scale=scale,
         rotation=rotation,
@@ -1,12 +1,13 @@
 import numpy as np
 
-from vtkmodules.vtkCommonCore import vtkFloatArray, vtkPoints
+from vtkmodules.vtkCommonCore import vtkPoints
 from vtkmodules.vtkCommonDataModel import vtkStructuredGrid, vtkPolyData, vtkCellArray
 from vtkmodules.vtkFiltersGeometry import vtkStructuredGridGeometryFilter
 from vtkmodules.vtkIOImage import vtkJPEGReader
 from vtkmodules.vtkRenderingCore import vtkActor, vtkPolyDataMapper, vtkTexture
 
 from DAVE.visual_helpers.constants import TEXTURE_WAVEPLANE
+from DAVE.visual_helpers.vtkActorMakers import numpy2vtk
 
 
 class WaveField:
@@ -15,6 +16,13 @@ class WaveField:
         self.pts = None
         self.elevation = None
 
+        self._points = None
+        """(n,3) float32 array that backs self.pts, only the z-column changes during animation"""
+        self._line_points = None
+        """idem for self.line_pts"""
+        self._z_frames = None
+        """(nt, n) float32 array with the z-values of the points of the plane for each time-step"""
+
         self.do_pbr = do_pbr
 
         self.texture = vtkTexture()
@@ -42,20 +50,15 @@ class WaveField:
         nx, ny, nt = self.elevation.shape
         i = int(t / self.dt) % nt
 
-        for ix in range(nx):
-            for iy in range(ny):
-                count = ix + iy * nx
-
-                x, y, _ = self.pts.GetPoint(count)
-                self.pts.SetPoint(count, x, y, self.elevation[ix, iy, i])
-
+        # the vtk points share their memory with the numpy buffers
+        self._points[:, 2] = self._z_frames[i]
+        self.pts.GetData().Modified()
         self.pts.Modified()
 
         pts = getattr(self, "line_pts", None)
         if pts is not None:
-            for ix in range(nx):
-                x, y, _ = pts.GetPoint(ix)
-                pts.SetPoint(ix, x, y, self.elevation[ix, 0, i])
+            self._line_points[:, 2] = self.elevation[:, 0, i]
+            pts.GetData().Modified()
             pts.Modified()
 
     def make_grid(self, xmin, xmax, ymin, ymax, nx, ny, wave_direction):
@@ -72,27 +75,13 @@ class WaveField:
 
         # create a grid in direction of wave-direction
         # xv, yv = np.meshgrid(xg, yg) # pre-allocate the grid
-        yv, xv = np.meshgrid(yg, xg)  # pre-allocate the grid
+        y, x = np.meshgrid(yg, xg)  # [ix, iy]
 
-        for iy in range(ny):
-            for ix in range(nx):
-                x = xg[ix]
-                y = yg[iy]
+        c = np.cos(np.deg2rad(wave_direction))
+        s = np.sin(np.deg2rad(wave_direction))
 
-                xr = (
-                    np.cos(np.deg2rad(wave_direction)) * x
-                    - np.sin(np.deg2rad(wave_direction)) * y
-                )
-                yr = (
-                    np.sin(np.deg2rad(wave_direction)) * x
-                    + np.cos(np.deg2rad(wave_direction)) * y
-                )
-
-                xv[ix, iy] = xr
-                yv[ix, iy] = yr
-
-        self.yv = yv
-        self.xv = xv
+        self.xv = c * x - s * y
+        self.yv = s * x + c * y
 
     def create_waveplane(
         self,
@@ -121,10 +110,9 @@ class WaveField:
         t = np.linspace(0, wave_period, nt)
         time_phasor = np.exp(-1j * (2 * np.pi * t / wave_period))
 
-        elevation = np.zeros((*xv.shape, nt))
-
-        for i in range(nt):
-            elevation[:, :, i] = wave_amplitude * np.real(time_phasor[i] * dist_phasor)
+        elevation = wave_amplitude * np.real(
+            dist_phasor[:, :, np.newaxis] * time_phasor[np.newaxis, np.newaxis, :]
+        )
 
         # the vtk stuff
         self.elevation = elevation
@@ -137,13 +125,13 @@ class WaveField:
     def create_line_actor(self):
         nx, ny, nt = self.elevation.shape
 
-        # make grid
+        # make grid, use t=0 and y=y[0]
+        self._line_points = np.ascontiguousarray(
+            np.column_stack((self.xv[:, 0], self.yv[:, 0], self.elevation[:, 0, 0])),
+            dtype=np.float32,
+        )
         pts = vtkPoints()
-        for ix in range(nx):
-            x = self.xv[ix, 0]
-            y = self.yv[ix, 0]
-
-            pts.InsertNextPoint(x, y, self.elevation[ix, 0, 0])  # use t=0 and y=y[0]
+        pts.SetData(numpy2vtk(self._line_points, deep=False))
 
         segments = vtkCellArray()
         segments.InsertNextCell(nx)
@@ -169,13 +157,22 @@ class WaveField:
     def create_actor(self):
         ny, nx, nt = self.elevation.shape
 
-        # make grid
-        pts = vtkPoints()
-        for ix in range(nx):
-            for iy in range(ny):
-                pts.InsertNextPoint(
-                    self.xv[iy, ix], self.yv[iy, ix], self.elevation[iy, ix, 1]
+        # make grid, the first index runs fastest (fortran order)
+        self._z_frames = np.ascontiguousarray(
+            self.elevation.transpose(2, 1, 0).reshape(nt, -1), dtype=np.float32
+        )
+        self._points = np.ascontiguousarray(
+            np.column_stack(
+                (
+                    self.xv.ravel(order="F"),
+                    self.yv.ravel(order="F"),
+                    self._z_frames[1 % nt],
                 )
+            ),
+            dtype=np.float32,
+        )
+        pts = vtkPoints()
+        pts.SetData(numpy2vtk(self._points, deep=False))
 
         grid = vtkStructuredGrid()
         grid.SetDimensions(ny, nx, 1)
@@ -186,17 +183,17 @@ class WaveField:
         filter.SetInputData(grid)
 
         # texture stuff
-        TextureCooridinates = vtkFloatArray()
-        TextureCooridinates.SetNumberOfComponents(2)
-        TextureCooridinates.SetName("TextureCoordinates")
-
         tex_repeat = 4
 
-        for i in range(0, nx):
-            for j in range(0, ny):
-                TextureCooridinates.InsertNextTuple2(
-                    tex_repeat * i / (nx - 1), tex_repeat * j / (ny - 1)
-                )
+        i = np.repeat(np.arange(nx), ny)
+        j = np.tile(np.arange(ny), nx)
+        TextureCooridinates = numpy2vtk(
+            np.column_stack(
+                (tex_repeat * i / (nx - 1), tex_repeat * j / (ny - 1))
+            ),
+            dtype=np.float32,
+            name="TextureCoordinates",
+        )
 
         grid.GetPointData().SetTCoords(TextureCooridinates)
 
@@ -28,6 +28,69 @@ def model_basic_nodes(test_files):
     return Scene(test_files / "basic_nodes.dave")
 
 
+@pytest.fixture
+def hanging_mass():
+    """Returns a function that creates a mass hanging from a cable, with only vertical freedom"""
+
+    def create(length=5):
+        s = Scene()
+        s.new_point("top", position=(0, 0, 10))
+        body = s.new_rigidbody("body", mass=1, fixed=False)
+        body.fixed = (True, True, False, True, True, True)
+        s.new_point("bottom", parent=body)
+        s.new_cable("cable", endA="top", endB="bottom", length=length, EA=1000)
+        return s
+
+    return create
+
+
+@pytest.fixture
+def box_model():
+    """Returns a function that creates a 100 x 10 x 4 m buoyant box; returns (scene, buoyancy, body)"""
+
+    def create(mass=0, fixed=True):
+        s = Scene()
+
+        body = s.new_rigidbody("Box", mass=mass, fixed=fixed)
+        b = s.new_buoyancy("shape", parent=body)
+        b.trimesh.load_obj("res: cube.obj", scale=(100, 10, 4))
+
+        return s, b, body
+
+    return create
+
+
+@pytest.fixture
+def barge_with_tanks():
+    """Returns a function that creates a barge with a 4 x 2 grid of ballast tanks and a (zero) deck load;
+    returns (scene, ballast system)"""
+
+    def create(cog=(0, 0, 3)):
+        s = Scene()
+
+        barge = s.new_rigidbody("Barge", mass=4000, cog=cog, fixed=False)
+        b = s.new_buoyancy("hull", parent=barge)
+        b.trimesh.load_file("res: cube.obj", scale=(100, 30, 8), offset=(0, 0, 0))
+
+        bs = s.new_ballastsystem("ballast", parent=barge)
+        for i, x in enumerate((-37.5, -12.5, 12.5, 37.5)):
+            for j, y in enumerate((-7.5, 7.5)):
+                tank = s.new_tank(f"tank{i}{j}", parent=barge)
+                tank.trimesh.load_file(
+                    "res: cube.obj", scale=(25, 15, 6), offset=(x, y, 0)
+                )
+                bs.tanks.append(tank)
+
+        s.new_point("deck", parent=barge, position=(30, 5, 4))
+        s.new_force("load", parent="deck", force=(0, 0, 0))
+
+        s.solve_statics()
+
+        return s, bs
+
+    return create
+
+
 @pytest.fixture
 def angles():
     """Defines a list of >100 angles for tests"""
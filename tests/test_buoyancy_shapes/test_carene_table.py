@@ -0,0 +1,57 @@
+from numpy.testing import assert_allclose
+
+from DAVE import *
+from DAVE.marine import carene_table, calculate_linearized_buoyancy_props
+
+
+def carene_table_reference(s, b, drafts):
+    """Carene table by evaluating calculate_linearized_buoyancy_props per draft (the old implementation)"""
+    rows = []
+    for z in drafts:
+        b.parent.z = z
+        r = calculate_linearized_buoyancy_props(s, b)
+        if r is not None:
+            rows.append((z, r))
+    b.parent.z = 0
+    return rows
+
+
+def test_linearized_props_box(box_model):
+    s, b, body = box_model()
+    r = calculate_linearized_buoyancy_props(s, b)
+
+    assert_allclose(r["displacement"], 100 * 10 * 2)
+    assert_allclose(r["Awl"], 100 * 10, rtol=1e-3)
+    assert_allclose(r["cob"], (0, 0, -1), atol=1e-6)
+    assert_allclose(r["BMT"], 10**2 / (12 * 2), rtol=1e-2)
+    assert_allclose(r["BML"], 100**2 / (12 * 2), rtol=1e-2)
+
+
+def test_carene_table_same_as_per_draft(box_model):
+    s, b, body = box_model()
+
+    df = carene_table(s, b, stepsize=0.5, n_workers=1)
+
+    reference = carene_table_reference(s, b, df.index)
+    assert len(reference) == len(df)
+
+    for z, r in reference:
+        row = df.loc[z]
+        assert_allclose(row["Displacement [m3]"], r["displacement"])
+        assert_allclose(row["Awl [m2]"], r["Awl"])
+        assert_allclose(row["BM T [m]"], r["BMT"])
+        assert_allclose(row["BM L [m]"], r["BML"])
+        assert_allclose(row["CoF x [m]"], r["COFX"], atol=1e-6)
+        assert_allclose(row["CoB z [m]"], r["cob"][2])
+
+    assert df.attrs["shape_node_names"] == ["shape"]
+
+
+def test_carene_table_parallel(box_model):
+    s, b, body = box_model()
+
+    serial = carene_table(s, b, stepsize=0.25, n_workers=1)
+    parallel = carene_table(s, b, stepsize=0.25, n_workers=2)
+
+    assert list(serial.index) == list(parallel.index)
+    assert_allclose(serial.values, parallel.values)
@@ -0,0 +1,64 @@
+from numpy.testing import assert_allclose
+
+from DAVE import *
+from DAVE.marine import GZcurve_DisplacementDriven
+
+
+def barge_with_cargo():
+    s = Scene()
+
+    body = s.new_rigidbody("Barge", mass=1000, cog=(0, 0, 1))
+    b = s.new_buoyancy("shape", parent=body)
+    b.trimesh.load_obj("res: cube.obj", scale=(100, 30, 8))
+
+    # suspended cargo adds dofs that need to be solved for every heel angle
+    s.new_point("hoist", parent=body, position=(0, 5, 30))
+    s.new_rigidbody("cargo", mass=100, position=(0, 5, 10), fixed=False)
+    s.new_point("cargo_hook", parent="cargo", position=(0, 0, 2))
+    s.new_cable("wire", endA="hoist", endB="cargo_hook", EA=1e6, length=17)
+
+    s.solve_statics()
+
+    return s
+
+
+def gz(s, **kwargs):
+    return GZcurve_DisplacementDriven(
+        s,
+        "Barge",
+        displacement_kN=1000 * s.g,
+        minimum_heel=0,
+        maximum_heel=20,
+        steps=11,
+        noplot=True,
+        **kwargs,
+    )
+
+
+def test_gz_continuation_same_as_reset():
+    s = barge_with_cargo()
+    reference = gz(s, continuation=False)
+
+    s = barge_with_cargo()
+    r = gz(s, continuation=True)
+
+    assert_allclose(r["heel"], reference["heel"])
+    assert_allclose(r["moment"], reference["moment"], atol=1e-3)
+    assert_allclose(r["trim"], reference["trim"], atol=1e-6)
+    assert_allclose(r["GM"], reference["GM"], atol=1e-6)
+
+
+def test_gz_parallel_same_as_serial():
+    s = barge_with_cargo()
+    serial = gz(s, teardown=False)
+    serial_dofs = s._gui_stability_dofs
+
+    s = barge_with_cargo()
+    parallel = gz(s, teardown=False, n_workers=3)
+    parallel_dofs = s._gui_stability_dofs
+
+    assert_allclose(parallel["moment"], serial["moment"], atol=1e-3)
+    assert_allclose(parallel["trim"], serial["trim"], atol=1e-6)
+
+    assert len(parallel_dofs) == len(serial_dofs)
+    assert_allclose(parallel_dofs, serial_dofs, atol=1e-6)
@@ -0,0 +1,58 @@
+import pytest
+from numpy.testing import assert_allclose
+
+from DAVE import *
+from DAVE.marine import calculate_linearized_buoyancy_props
+
+
+def test_table_same_as_direct(box_model):
+    s, b, body = box_model()
+
+    for z in (-1.5, -0.3, 0, 0.75, 1.2):
+        body.z = z
+        direct = calculate_linearized_buoyancy_props(s, b)
+        tabled = calculate_linearized_buoyancy_props(s, b, use_table=True)
+
+        for key in ("displacement", "Awl", "BMT", "BML", "COFX", "COFY", "waterline", "kHeave"):
+            assert_allclose(tabled[key], direct[key], rtol=1e-2, atol=1e-3)  # linear interpolation
+        assert_allclose(tabled["cob"], direct["cob"], atol=1e-3)
+
+
+def test_table_is_reused_and_invalidated(box_model):
+    s, b, body = box_model()
+
+    table = b.hydrostatics_table()
+    assert b.hydrostatics_table() is table
+
+    # new mesh
+    b.trimesh.load_obj("res: cube.obj", scale=(100, 20, 4))
+    table2 = b.hydrostatics_table()
+    assert table2 is not table
+    assert_allclose(table2.at(0)["displacement"], 100 * 20 * 2, rtol=1e-3)
+
+    # new parent
+    other = s.new_frame("other", position=(0, 0, 1))
+    b.change_parent_to(other)
+    assert b.hydrostatics_table() is not table2
+
+
+def test_table_out_of_range(box_model):
+    s, b, body = box_model()
+
+    with pytest.warns(UserWarning):
+        assert b.hydrostatics_table().at(10) is None
+
+    # same as the direct evaluation
+    body.z = 10
+    with pytest.warns(UserWarning):
+        assert calculate_linearized_buoyancy_props(s, b, use_table=True) is None
+
+
+def test_table_small_heel(box_model):
+    s, b, body = box_model()
+
+    r = b.hydrostatics_table().at(0, heel=1)
+    body.rotation = (1, 0, 0)
+    s.update()
+
+    assert_allclose(r["cob_global"][1], b.cob[1], atol=1e-3)
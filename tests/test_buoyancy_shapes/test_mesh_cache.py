@@ -0,0 +1,76 @@
+from numpy.testing import assert_allclose
+
+import DAVE.settings as ds
+from DAVE import *
+from DAVE.helpers.mesh_cache import clear_mesh_cache, mesh_cache_stats
+
+
+def test_mesh_cache_hit():
+    clear_mesh_cache()
+
+    s = Scene()
+    a = s.new_buoyancy("a", parent=s.new_rigidbody("A"))
+    b = s.new_buoyancy("b", parent=s.new_rigidbody("B"))
+
+    a.trimesh.load_file("res: cube.obj", scale=(100, 10, 4))
+    b.trimesh.load_file("res: cube.obj", scale=(100, 10, 4))
+
+    stats = mesh_cache_stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+
+    assert_allclose(a.trimesh._TriMesh.Volume(), b.trimesh._TriMesh.Volume())
+    assert a.trimesh.messages == b.trimesh.messages
+
+    # different settings are a different mesh
+    b.trimesh.load_file("res: cube.obj", scale=(100, 10, 5))
+    assert mesh_cache_stats()["misses"] == 2
+    assert_allclose(b.trimesh._TriMesh.Volume(), 5000, rtol=1e-6)
+
+
+def test_mesh_cache_check_shape_results():
+    clear_mesh_cache()
+
+    s = Scene()
+    a = s.new_buoyancy("a", parent=s.new_rigidbody("A"))
+    b = s.new_buoyancy("b", parent=s.new_rigidbody("B"))
+
+    a.trimesh.load_file("res: plane.obj")  # open mesh, has boundary edges
+    b.trimesh.load_file("res: plane.obj")
+
+    assert a.trimesh.boundary_edges
+    assert a.trimesh.boundary_edges == b.trimesh.boundary_edges
+    assert a.trimesh.messages == b.trimesh.messages
+
+
+def test_mesh_cache_lru(monkeypatch):
+    clear_mesh_cache()
+    monkeypatch.setattr(ds, "MESH_CACHE_MAX_ENTRIES", 2)
+
+    s = Scene()
+    a = s.new_buoyancy("a", parent=s.new_rigidbody("A"))
+    for z in (1, 2, 3):
+        a.trimesh.load_file("res: cube.obj", scale=(1, 1, z))
+
+    assert mesh_cache_stats()["entries"] == 2
+
+    a.trimesh.load_file("res: cube.obj", scale=(1, 1, 1))  # evicted
+    assert mesh_cache_stats()["misses"] == 4
+
+
+def test_mesh_cache_disk(monkeypatch, tmp_path):
+    clear_mesh_cache()
+    monkeypatch.setattr(ds, "MESH_CACHE_DISK_PATH", tmp_path)
+
+    s = Scene()
+    a = s.new_buoyancy("a", parent=s.new_rigidbody("A"))
+    a.trimesh.load_file("res: cube.obj", scale=(100, 10, 4), invert_normals=True)
+    volume = a.trimesh._TriMesh.Volume()
+
+    assert len(list(tmp_path.glob("*.npz"))) == 1
+
+    clear_mesh_cache()  # memory only
+
+    a.trimesh.load_file("res: cube.obj", scale=(100, 10, 4), invert_normals=True)
+    assert mesh_cache_stats()["disk_hits"] == 1
+    assert_allclose(a.trimesh._TriMesh.Volume(), volume)
@@ -0,0 +1,82 @@
+import numpy as np
+from numpy.testing import assert_allclose
+
+from vtkmodules.vtkFiltersCore import vtkTriangleFilter
+from vtkmodules.vtkFiltersSources import vtkSphereSource
+
+from DAVE import *
+from DAVE.nds.trimesh import _polydata_to_arrays
+
+
+def sphere_polydata(resolution):
+    sphere = vtkSphereSource()
+    sphere.SetThetaResolution(resolution)
+    sphere.SetPhiResolution(resolution)
+    tri = vtkTriangleFilter()
+    tri.SetInputConnection(sphere.GetOutputPort())
+    tri.Update()
+    return tri.GetOutput()
+
+
+def test_vertices_and_faces():
+    s = Scene()
+    b = s.new_buoyancy("b", parent=s.new_rigidbody("B"))
+    b.trimesh.load_file("res: cube.obj", scale=(100, 10, 4), offset=(0, 0, 10))
+
+    assert b.trimesh.vertices.shape == (8, 3)
+    assert b.trimesh.faces.shape == (12, 3)
+
+    assert_allclose(b.trimesh.get_extends(), (-50, 50, -5, 5, 8, 12))
+
+
+def test_arrays_follow_add_vertex():
+    s = Scene()
+    b = s.new_buoyancy("b", parent=s.new_rigidbody("B"))
+    b.trimesh.load_file("res: cube.obj")
+    _ = b.trimesh.vertices
+
+    b.trimesh.AddVertex(10, 0, 0)
+    assert b.trimesh.vertices.shape == (9, 3)
+    assert b.trimesh.get_extends()[1] == 10
+
+
+def test_add_vertex_and_face_reload_core():
+    s = Scene()
+    b = s.new_buoyancy("b", parent=s.new_rigidbody("B"))
+    b.trimesh.load_file("res: cube.obj")
+    s.update()
+    displacement = b.displacement
+
+    # add a second cube, 10m further along x
+    vertices, faces = b.trimesh.vertices.copy(), b.trimesh.faces.copy()
+    n = len(vertices)
+    for x, y, z in vertices:
+        b.trimesh.AddVertex(x + 10, y, z)
+    for i, j, k in faces:
+        b.trimesh.AddFace(int(i) + n, int(j) + n, int(k) + n)
+
+    s.update()
+    assert_allclose(b.displacement, 2 * displacement)
+
+
+def _get_extends_per_vertex(t):
+    """Previous implementation, for comparison"""
+    xs, ys, zs = [], [], []
+    for i in range(t.nVertices):
+        v = t.GetVertex(i)
+        xs.append(v[0])
+        ys.append(v[1])
+        zs.append(v[2])
+    return (min(xs), max(xs), min(ys), max(ys), min(zs), max(zs))
+
+
+def test_get_extends_same_as_per_vertex():
+    data = sphere_polydata(50)
+    vertices, faces = _polydata_to_arrays(data, (0, 0, 0), invert_normals=False)
+
+    s = Scene()
+    b = s.new_buoyancy("b", parent=s.new_rigidbody("B"))
+    b.trimesh._load_arrays(vertices, faces)
+
+    b.trimesh._arrays = None  # force a read from the core
+    assert_allclose(b.trimesh.get_extends(), _get_extends_per_vertex(b.trimesh._TriMesh))
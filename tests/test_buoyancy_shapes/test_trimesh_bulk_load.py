@@ -0,0 +1,45 @@
+from numpy.testing import assert_allclose
+from vtkmodules.vtkFiltersCore import vtkTriangleFilter
+from vtkmodules.vtkFiltersSources import vtkSphereSource
+
+from DAVE import *
+from DAVE.helpers.scene_clone import trimesh_arrays
+from DAVE.nds.trimesh import _polydata_to_arrays
+
+
+def sphere_polydata(resolution):
+    sphere = vtkSphereSource()
+    sphere.SetThetaResolution(resolution)
+    sphere.SetPhiResolution(resolution)
+    tri = vtkTriangleFilter()
+    tri.SetInputConnection(sphere.GetOutputPort())
+    tri.Update()
+    return tri.GetOutput()
+
+
+def test_bulk_same_as_per_element():
+    s = Scene()
+    a = s.new_buoyancy("a", parent=s.new_rigidbody("A"))
+    b = s.new_buoyancy("b", parent=s.new_rigidbody("B"))
+
+    data = sphere_polydata(20)
+    offset = (1, 2, 3)
+
+    vertices, faces = _polydata_to_arrays(data, offset, invert_normals=True)
+    a.trimesh._load_arrays(vertices, faces)
+    b.trimesh._load_polydata_per_element(data, offset, invert_normals=True)
+
+    va, fa = trimesh_arrays(a.trimesh)
+    vb, fb = trimesh_arrays(b.trimesh)
+
+    assert_allclose(va, vb)
+    assert_allclose(fa, fb)
+
+
+def test_load_obj_volume():
+    s = Scene()
+    b = s.new_buoyancy("b", parent=s.new_rigidbody("B"))
+    b.trimesh.load_obj("res: cube.obj", scale=(100, 10, 4), offset=(0, 0, 10))
+
+    assert b.trimesh._TriMesh.nFaces == 12
+    assert_allclose(b.trimesh._TriMesh.Volume(), 4000, rtol=1e-6)
@@ -0,0 +1,71 @@
+import os
+from shutil import copyfile
+
+from DAVE import *
+from DAVE.helpers.subscene_cache import clear_subscene_cache, subscene_cache_stats
+
+
+def test_components_from_cache():
+    clear_subscene_cache()
+
+    s = Scene()
+    c1 = s.new_component("c1", path="res: cheetah.dave")
+    c2 = s.new_component("c2", path="res: cheetah.dave")
+
+    stats = subscene_cache_stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+
+    names1 = sorted(node.name[3:] for node in c1.imported_nodes)
+    names2 = sorted(node.name[3:] for node in c2.imported_nodes)
+    assert names1 == names2
+
+
+def test_component_from_cache_same_as_loaded(test_files):
+    clear_subscene_cache()
+
+    s = Scene()
+    s.resource_provider.addPath(test_files)
+    s.new_component("first", path="res: complex_component.dave")
+    s.new_component("second", path="res: complex_component.dave")
+
+    code_first = s["first"].give_python_code()
+
+    # the second one comes from the cache; its contents should be identical
+    for node in s["first"].imported_nodes:
+        other = s[node.name.replace("first/", "second/", 1)]
+        assert type(other) == type(node)
+        if hasattr(node, "position"):
+            assert node.position == other.position
+
+    assert code_first.replace("first", "second") == s["second"].give_python_code()
+
+
+def test_cache_reloads_changed_file(tmp_path):
+    clear_subscene_cache()
+
+    s = Scene()
+    file = tmp_path / "comp.dave"
+    copyfile(s.get_resource_path("res: cheetah.dave"), file)
+
+    s.new_component("c1", path=str(file))
+
+    # touch the file
+    mtime = file.stat().st_mtime_ns
+    os.utime(file, ns=(mtime + 10**9, mtime + 10**9))
+
+    s.new_component("c2", path=str(file))
+
+    assert subscene_cache_stats()["misses"] == 2
+
+
+def test_many_components():
+    clear_subscene_cache()
+    s = Scene()
+
+    for i in range(20):
+        s.new_component(f"c{i}", path="res: cheetah.dave")
+
+    stats = subscene_cache_stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 19
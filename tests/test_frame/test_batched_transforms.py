@@ -0,0 +1,74 @@
+import numpy as np
+from numpy.testing import assert_allclose
+
+from DAVE import *
+
+
+def nested_frames():
+    s = Scene()
+    a = s.new_frame("a", position=(10, -3, 2), rotation=(5, 20, 40))
+    b = s.new_frame("b", parent=a, position=(1, 2, 3), rotation=(-30, 10, 60))
+    s.update()
+    return s, b
+
+
+def random_points(n=50):
+    rng = np.random.default_rng(42)
+    return rng.uniform(-10, 10, size=(n, 3))
+
+
+def test_global_transform_matrix():
+    s, b = nested_frames()
+    M = b.global_transform_matrix
+
+    assert M.shape == (4, 4)
+    assert_allclose(M[:3, 3], b.global_position)
+    assert_allclose(M[:3, 0], b.ux)
+    assert_allclose(M[3], (0, 0, 0, 1))
+
+
+def test_positions_and_directions_same_as_single():
+    s, b = nested_frames()
+    points = random_points()
+
+    assert_allclose(
+        b.to_glob_positions(points), [b.to_glob_position(p) for p in points], atol=1e-9
+    )
+    assert_allclose(
+        b.to_loc_positions(points), [b.to_loc_position(p) for p in points], atol=1e-9
+    )
+    assert_allclose(
+        b.to_glob_directions(points), [b.to_glob_direction(p) for p in points], atol=1e-9
+    )
+    assert_allclose(
+        b.to_loc_directions(points), [b.to_loc_direction(p) for p in points], atol=1e-9
+    )
+
+
+def test_rotations_same_as_single():
+    s, b = nested_frames()
+    rotations = random_points(20) * 5  # up to 50 deg per component
+
+    assert_allclose(
+        b.to_glob_rotations(rotations),
+        [b.to_glob_rotation(r) for r in rotations],
+        atol=1e-6,
+    )
+    assert_allclose(
+        b.to_loc_rotations(rotations),
+        [b.to_loc_rotation(r) for r in rotations],
+        atol=1e-6,
+    )
+
+
+def test_single_vector_gives_one_row():
+    s, b = nested_frames()
+    r = b.to_glob_positions((1, 2, 3))
+    assert r.shape == (1, 3)
+    assert_allclose(r[0], b.to_glob_position((1, 2, 3)))
+
+
+def test_round_trip():
+    s, b = nested_frames()
+    points = random_points()
+    assert_allclose(b.to_loc_positions(b.to_glob_positions(points)), points, atol=1e-9)
@@ -0,0 +1,72 @@
+import pytest
+
+from DAVE import *
+from DAVE.settings import VF_NAME_SPLIT
+
+
+def test_name_index_add_rename_delete():
+    s = Scene()
+    a = s.new_frame("a")
+    b = s.new_point("b", parent=a)
+
+    assert s["a"] is a
+    assert not s.name_available("a")
+
+    a.name = "renamed"
+    assert s["renamed"] is a
+    assert s.name_available("a")
+    assert "a" not in s.node_names
+
+    s.delete(a)  # deletes b as well
+    assert s.name_available("renamed")
+    assert s.name_available("b")
+    assert s.node_names == ()
+
+
+def test_name_index_pure_python_node():
+    s = Scene()
+    c = s.new_component("c", "res: cheetah.dave")
+    c.name = "cheetah"
+    assert s["cheetah"] is c
+    assert s.name_available("c")
+
+
+def test_name_index_core_names():
+    s = Scene()
+    s.new_rigidbody("body")
+
+    # the cog of the body is a core element that is not a node
+    assert not s.name_available("body" + VF_NAME_SPLIT + "cog")
+
+    with pytest.raises(ValueError):
+        s.new_frame("body" + VF_NAME_SPLIT + "cog")
+
+
+def test_name_index_prefix():
+    s = Scene()
+    s.new_frame("a")
+    s.new_frame("b")
+    s.prefix_element_names("pre_")
+
+    assert set(s.node_names) == {"pre_a", "pre_b"}
+    assert s["pre_a"].name == "pre_a"
+
+
+def test_node_names_in_scene_order():
+    s = Scene()
+    s.new_frame("a")
+    s.new_frame("b")
+    s.new_frame("c")
+
+    s["a"].name = "renamed"
+    assert s.node_names == ("renamed", "b", "c")
+
+
+def test_create_10k_nodes():
+    s = Scene()
+
+    for i in range(10000):
+        s.new_frame(f"frame{i}")
+
+    assert len(s.node_names) == 10000
+    assert all(s[f"frame{i}"].name == f"frame{i}" for i in range(10000))
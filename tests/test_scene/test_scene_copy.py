@@ -1,16 +1,9 @@
-from DAVE import *
-
-def box_model():
-    s = Scene()
+import pytest
 
-    b = s.new_rigidbody("Box", mass=2500, fixed=False)
-    b = s.new_buoyancy("shape", parent=b)
-    b.trimesh.load_obj("res: cube.obj", scale=(100, 10, 4))
-
-    return s
+from DAVE import *
 
-def test_copy_in_equilibruim():
-    s = box_model()
+def test_copy_in_equilibruim(box_model):
+    s, _, _ = box_model(mass=2500, fixed=False)
     s.solve_statics()
     assert s.verify_equilibrium()
 
@@ -21,8 +14,8 @@ def test_copy_in_equilibruim():
     s2 = s.copy()
     assert s2.verify_equilibrium()
 
-def test_copy_in_equilibruim_nosolved():
-    s = box_model()
+def test_copy_in_equilibruim_nosolved(box_model):
+    s, _, _ = box_model(mass=2500, fixed=False)
     s.solve_statics()
     assert s.verify_equilibrium()
 
@@ -34,3 +27,302 @@ def test_copy_in_equilibruim_nosolved():
     s2 = s.copy()
     assert s2.verify_equilibrium()
 
+
+def _code_without_header(s):
+    code = s.give_python_code()
+    return "\n".join(
+        line for line in code.split("\n") if not line.startswith(("# By", "# Time"))
+    )
+
+def test_native_copy_same_as_code_copy(model_basic_nodes):
+    s = model_basic_nodes
+
+    native = s.copy()
+    via_code = s.copy(native=False)
+
+    assert _code_without_header(native) == _code_without_header(via_code)
+
+def test_native_copy_box_model(box_model):
+    s, _, _ = box_model(mass=2500, fixed=False)
+    s.solve_statics()
+
+    s2 = s.copy()
+    assert s2['shape'].trimesh._TriMesh.nFaces == s['shape'].trimesh._TriMesh.nFaces
+    assert s2['shape'].trimesh._path == s['shape'].trimesh._path
+    assert s2.verify_equilibrium()
+
+def test_native_copy_nested_frames(box_model):
+    s, _, _ = box_model(mass=2500, fixed=False)
+    last = s['Box']
+    for i in range(200):
+        last = s.new_frame(f'frame{i}', parent=last, position=(1, 0, 0))
+        s.new_point(f'point{i}', parent=last)
+
+    assert _code_without_header(s.copy()) == _code_without_header(s.copy(native=False))
+
+
+# One scene per node-type with non-default, non-round values. The native copy uses the registered describer
+# (or the python code for unregistered types), both copies are exported to code and compared.
+
+
+def _frames(s):
+    a = s.new_frame("A", position=(1 / 3, 2, 3), rotation=(0, 0, 10.1))
+    s.new_rigidbody("B", mass=2 / 3, cog=(0.1, 0.2, 0.3), position=(5, 0, 1), fixed=False)
+    return a
+
+
+def _frame(s):
+    s.new_frame(
+        "F",
+        position=(1 / 3, 2, 3),
+        rotation=(10, 20, 30),
+        inertia=1 / 7,
+        inertia_radii=(1, 2, 3),
+        fixed=(True, False, True, False, True, False),
+    )
+    s["F"].footprint = [(0, 0, 0), (1, 0, 0), (1 / 3, 1, 0)]
+
+
+def _rigidbody(s):
+    s.new_rigidbody(
+        "R",
+        mass=2 / 3,
+        cog=(0.1, 0.2, 1 / 3),
+        position=(5, 0, 1),
+        rotation=(0, 1, 0),
+        inertia_radii=(1, 2, 3),
+        fixed=False,
+    )
+
+
+def _point(s):
+    a = _frames(s)
+    s.new_point("P", parent=a, position=(1 / 3, 0, -1))
+
+
+def _circle(s):
+    a = _frames(s)
+    s.new_point("P", parent=a, position=(1 / 3, 0, -1))
+    c = s.new_circle("C", parent="P", axis=(0, 1, 1), radius=1 / 7, roundbar=True)
+    c.draw_start = -0.5
+    c.draw_stop = 0.25
+
+
+def _force(s):
+    _point(s)
+    s.new_force("Fo", parent="P", local=True, force=(1 / 3, 2, 3), moment=(4, 5, 6))
+
+
+def _windarea(s):
+    _point(s)
+    s.new_windarea("W", parent="P", A=1 / 3, Cd=1.5, direction=(1, 0, 0))
+
+
+def _currentarea(s):
+    _point(s)
+    s.new_currentarea("Cu", parent="P", A=1 / 3, Cd=0.7, areakind=AreaKind.SPHERE)
+
+
+def _contactmesh(s):
+    a = _frames(s)
+    m = s.new_contactmesh("M", parent=a)
+    m.trimesh.load_file("res: cube.obj", scale=(10, 5, 1), offset=(0, 0, -0.5))
+
+
+def _contactball(s):
+    _contactmesh(s)
+    s.new_point("P", parent="B", position=(0, 0, 2))
+    s.new_contactball("ball", parent="P", radius=1 / 3, k=1234, meshes=["M"])
+
+
+def _spmt(s):
+    _contactmesh(s)
+    s.new_spmt(
+        "spmt",
+        parent="B",
+        reference_force=1 / 3,
+        k=2e5,
+        spacing_length=1.5,
+        n_length=4,
+        meshes=["M"],
+    )
+
+
+def _hydspring(s):
+    a = _frames(s)
+    s.new_hydspring(
+        "H",
+        parent=a,
+        cob=(1, 2, 3),
+        BMT=1 / 3,
+        BML=10,
+        COFX=0.1,
+        COFY=0.2,
+        kHeave=1000,
+        waterline=1,
+        displacement_kN=100,
+    )
+
+
+def _buoyancy(s):
+    a = _frames(s)
+    b = s.new_buoyancy("Bu", parent=a)
+    b.trimesh.load_file(
+        "res: cube.obj",
+        scale=(10, 5, 2),
+        rotation=(0, 0, 10),
+        offset=(1 / 3, 0, 0),
+    )
+
+
+def _tank(s):
+    a = _frames(s)
+    t = s.new_tank("T", parent=a, density=1 / 3, free_flooding=False)
+    t.trimesh.load_file("res: cube.obj", scale=(10, 5, 2), offset=(1 / 3, 0, 0))
+    t.volume = 12.5
+
+
+def _cable(s):
+    _frames(s)
+    s.new_point("P1", parent="A")
+    s.new_point("P2", parent="B", position=(0, 0, 3))
+    s.new_point("P3", parent="B", position=(2, 0, 3))
+    s.new_circle("C", parent="P2", axis=(0, 1, 0), radius=0.5)
+    s.new_cable(
+        "cable",
+        endA="P1",
+        endB="P3",
+        sheaves=["C"],
+        length=1 / 3,
+        EA=1234,
+        diameter=0.1,
+        mass_per_length=0.01,
+        reversed=(False, True, False),
+        friction=(0, 0.1, 0),
+        offsets=(0, 0.05, 0),
+    )
+
+
+def _lc6d(s):
+    _frames(s)
+    s.new_linear_connector_6d("LC", secondary="B", main="A", stiffness=(1, 2, 3, 4, 5, 1 / 3))
+
+
+def _connector2d(s):
+    _frames(s)
+    s.new_connector2d("C2d", nodeA="A", nodeB="B", k_linear=1 / 3, k_angular=10)
+
+
+def _beam(s):
+    _frames(s)
+    s.new_beam(
+        "beam",
+        nodeA="A",
+        nodeB="B",
+        EIy=1,
+        EIz=2,
+        GIp=3,
+        EA=1 / 3,
+        L=5.5,
+        mass=0.5,
+        n_segments=5,
+        tension_only=True,
+    )
+
+
+def _supportpoint(s):
+    _frames(s)
+    s.new_point("P", parent="B", position=(0, 0, -1))
+    s.new_supportpoint("SP", frame="A", point="P", kz=1 / 3, kx=1, ky=2, delta_z=0.1)
+
+
+def _visual(s):
+    a = _frames(s)
+    v = s.new_visual(
+        "V",
+        path="res: cube.obj",
+        parent=a,
+        offset=(1 / 3, 0, 0),
+        rotation=(0, 0, 90),
+        scale=(1, 2, 3),
+    )
+    v.visual_outline = VisualOutlineType.NONE
+
+
+def _measurement(s):
+    _point(s)
+    s.new_point("Q", position=(1, 2, 3))
+    s.new_measurement("meas", point1="P", point2="Q")
+
+
+def _ballastsystem(s):
+    _tank(s)
+    bs = s.new_ballastsystem("ballast", parent="A")
+    bs.tanks.append(s["T"])
+
+
+def _geometriccontact(s):
+    _frames(s)
+    s.new_point("Pa", parent="A")
+    s.new_point("Pb", parent="B")
+    s.new_circle("Ca", parent="Pa", axis=(0, 1, 0), radius=1)
+    s.new_circle("Cb", parent="Pb", axis=(0, 1, 0), radius=0.5)
+    s.new_geometriccontact(
+        "GC",
+        child="Cb",
+        parent="Ca",
+        inside=True,
+        rotation_on_parent=10,
+        child_rotation=20,
+    )
+
+
+def _shackle(s):
+    s.new_shackle("shackle", kind="GP500")
+
+
+_NODE_TYPE_CASES = [
+    _frame,
+    _rigidbody,
+    _point,
+    _circle,
+    _force,
+    _windarea,
+    _currentarea,
+    _contactmesh,
+    _contactball,
+    _spmt,
+    _hydspring,
+    _buoyancy,
+    _tank,
+    _cable,
+    _lc6d,
+    _connector2d,
+    _beam,
+    _supportpoint,
+    _visual,
+    _measurement,
+    _ballastsystem,
+    _geometriccontact,
+    _shackle,
+]
+
+
+def test_node_type_cases_cover_all_describers():
+    from DAVE.helpers.scene_clone import NODE_DESCRIBERS
+
+    covered = set()
+    for create in _NODE_TYPE_CASES:
+        s = Scene()
+        create(s)
+        covered.update(type(node) for node in s._nodes)
+
+    assert set(NODE_DESCRIBERS) <= covered
+
+
+@pytest.mark.parametrize("create", _NODE_TYPE_CASES)
+def test_native_copy_same_as_code_copy_per_node_type(create):
+    s = Scene()
+    create(s)
+
+    assert _code_without_header(s.copy()) == _code_without_header(s.copy(native=False))
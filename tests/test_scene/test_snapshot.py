@@ -0,0 +1,49 @@
+from DAVE import *
+
+
+def _code_without_header(s):
+    code = s.give_python_code()
+    return "\n".join(
+        line for line in code.split("\n") if not line.startswith(("# By", "# Time"))
+    )
+
+
+def test_snapshot_roundtrip(model_basic_nodes, tmp_path):
+    s = model_basic_nodes
+
+    filename = s.save_scene(tmp_path / "model.daveb")
+    assert filename.suffix == ".daveb"
+
+    s2 = Scene(filename)
+
+    assert _code_without_header(s) == _code_without_header(s2)
+
+
+def test_snapshot_trimesh(tmp_path):
+    s = Scene()
+    b = s.new_rigidbody("Box", mass=2500, fixed=False)
+    b = s.new_buoyancy("shape", parent=b)
+    b.trimesh.load_obj("res: cube.obj", scale=(100, 10, 4))
+    s.solve_statics()
+
+    s.save_scene(tmp_path / "box.daveb")
+    s2 = Scene(tmp_path / "box.daveb")
+
+    assert s2["shape"].trimesh._TriMesh.nFaces == s["shape"].trimesh._TriMesh.nFaces
+    assert s2["shape"].trimesh._scale == (100, 10, 4)
+    assert s2.verify_equilibrium()
+
+
+def test_snapshot_nested_frames(tmp_path):
+    s = Scene()
+    last = None
+    for i in range(500):
+        last = s.new_frame(f"frame{i}", parent=last, position=(1, 0, 0))
+        s.new_point(f"point{i}", parent=last)
+
+    s.save_scene(tmp_path / "model.dave")
+    s.save_scene(tmp_path / "model.daveb")
+
+    assert _code_without_header(Scene(tmp_path / "model.daveb")) == _code_without_header(
+        Scene(tmp_path / "model.dave")
+    )
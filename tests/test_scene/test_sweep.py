@@ -0,0 +1,45 @@
+import numpy as np
+
+from DAVE import *
+
+
+def test_sweep_in_process(hanging_mass):
+    s = hanging_mass()
+
+    df = s.sweep(
+        {("cable", "length"): np.linspace(4, 6, 5), ("body", "mass"): [1, 2]},
+        evaluate=[("cable", "tension"), ("body", "gz")],
+        n_workers=1,
+    )
+
+    assert len(df) == 10
+    assert all(df["converged"])
+    assert np.allclose(df["cable.tension"], df["body.mass"] * 9.81, rtol=1e-3)
+
+    # the scene itself is not changed
+    assert s["cable"].length == 5
+
+
+def test_sweep_parallel_same_as_in_process(hanging_mass):
+    s = hanging_mass()
+    parameters = {("cable", "length"): np.linspace(4, 6, 9)}
+    evaluate = [("body", "gz")]
+
+    df1 = s.sweep(parameters, evaluate, n_workers=1)
+    df2 = s.sweep(parameters, evaluate, n_workers=2)
+
+    assert df2["converged"].all()
+    assert np.allclose(df1["body.gz"], df2["body.gz"])
+
+
+def test_sweep_terminate(hanging_mass):
+    s = hanging_mass()
+
+    df = s.sweep(
+        {("cable", "length"): np.linspace(4, 6, 5)},
+        evaluate=[("cable", "tension")],
+        n_workers=1,
+        do_terminate_func=lambda: True,
+    )
+
+    assert not any(df["converged"])
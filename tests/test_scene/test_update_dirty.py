@@ -0,0 +1,46 @@
+from DAVE import *
+
+
+def test_update_skips_unchanged_nodes():
+    s = Scene()
+    for i in range(10):
+        s.new_frame(f"frame{i}")
+    b = s.new_rigidbody("body", mass=1)
+    buoy = s.new_buoyancy("buoy", parent=b)
+    buoy.trimesh.load_obj("res: cube.obj")
+
+    s.update()
+    n0 = s.n_skipped_updates
+    s.update()
+
+    # only the unchanged buoyancy is skipped, frames and bodies do not have an update
+    assert s.n_skipped_updates - n0 == 1
+
+
+def test_update_after_mesh_change():
+    s = Scene()
+    b = s.new_rigidbody("body", mass=1)
+    buoy = s.new_buoyancy("buoy", parent=b)
+    buoy.trimesh.load_obj("res: cube.obj")
+    s.update()
+
+    assert not buoy._needs_update()
+
+    buoy.trimesh.load_obj("res: cube.obj", scale=(2, 2, 2))
+    b.z = -0.5
+    s.update()
+
+    assert abs(buoy.displacement - 4) < 1e-3  # 2x2x2 cube, half submerged
+
+
+def test_dirty_by_setter():
+    s = Scene()
+    b = s.new_rigidbody("body", mass=1)
+    buoy = s.new_buoyancy("buoy", parent=b)
+    buoy.trimesh.load_obj("res: cube.obj")
+    s.update()
+
+    other = s.new_frame("other")
+    buoy.parent = other  # observable setter
+
+    assert buoy._needs_update()
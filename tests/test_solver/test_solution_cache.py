@@ -0,0 +1,89 @@
+from DAVE import *
+from DAVE.helpers.solution_cache import SolutionCache, property_hash
+
+
+def test_property_hash(hanging_mass):
+    s = hanging_mass()
+    h5 = property_hash(s)
+
+    s["body"].z = -3  # solved value, does not change the model
+    assert property_hash(s) == h5
+
+    s["cable"].length = 6
+    assert property_hash(s) != h5
+
+    s["cable"].length = 5
+    assert property_hash(s) == h5
+
+
+def test_property_hash_setters(hanging_mass):
+    s = hanging_mass()
+    s.new_windarea("wind", parent="bottom", A=10)
+    s.new_force("force", parent="bottom", force=(1, 0, 0))
+    h = property_hash(s)
+
+    s["wind"].A = 20
+    assert property_hash(s) != h
+    h = property_hash(s)
+
+    s["wind"].Cd = 1.5
+    assert property_hash(s) != h
+    h = property_hash(s)
+
+    s["force"].is_global = not s["force"].is_global
+    assert property_hash(s) != h
+    h = property_hash(s)
+
+    s["force"].name = "renamed"
+    assert property_hash(s) != h
+
+
+def test_cache_hit_after_undo(hanging_mass):
+    s = hanging_mass()
+    s.solution_cache = SolutionCache()
+
+    s.solve_statics()
+    z5 = s["body"].gz
+
+    s["cable"].length = 6
+    s.solve_statics()
+
+    s["cable"].length = 5
+    s.solve_statics()
+
+    assert s.solution_cache.hits == 1
+    assert abs(s["body"].gz - z5) < 1e-6
+
+
+def test_cache_different_dofs_is_miss(hanging_mass):
+    s = hanging_mass()
+    s.solution_cache = SolutionCache()
+    s.solve_statics()
+
+    s["body"].fixed = (True, False, False, True, True, True)
+    s["cable"].length = 6
+    s.solve_statics()
+
+    assert s.solution_cache.hits == 0
+    assert s.solution_cache.misses >= 1
+
+
+def test_cache_continuation(hanging_mass):
+    s = hanging_mass()
+    cache = SolutionCache()
+    s.solution_cache = cache
+
+    for L in (5, 5.1, 5.2, 5.3):
+        s["cable"].length = L
+        cache.parameter = L
+        s.solve_statics()
+        assert s.verify_equilibrium()
+
+    assert cache.continuations >= 2
+    assert cache.stats == dict(
+        hits=cache.hits,
+        continuations=cache.continuations,
+        misses=cache.misses,
+        entries=len(cache),
+    )
+    assert len(cache) == 4  # one entry per solve
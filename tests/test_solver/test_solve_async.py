@@ -0,0 +1,37 @@
+import asyncio
+
+from DAVE import *
+
+
+def test_solve_async(hanging_mass):
+    s = hanging_mass()
+    assert asyncio.run(s.solve_statics_async())
+    assert s.verify_equilibrium()
+
+
+def test_solve_async_concurrent(hanging_mass):
+    scenes = [hanging_mass(length=4 + i) for i in range(4)]
+
+    async def solve_all():
+        return await asyncio.gather(*[s.solve_statics_async() for s in scenes])
+
+    assert all(asyncio.run(solve_all()))
+
+    for s in scenes:
+        assert s.verify_equilibrium()
+
+
+def test_solve_async_same_as_sync(hanging_mass):
+    s1 = hanging_mass()
+    s2 = hanging_mass()
+
+    s1.solve_statics()
+    asyncio.run(s2.solve_statics_async())
+
+    assert abs(s1["body"].gz - s2["body"].gz) < 1e-6
+
+
+def test_solve_sync_terminate(hanging_mass):
+    s = hanging_mass()
+    assert not s._solve_statics_with_optional_control(do_terminate_func=lambda: True)
+    assert s.last_solve_report.terminated
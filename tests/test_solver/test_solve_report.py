@@ -0,0 +1,40 @@
+import json
+
+from DAVE import *
+
+
+def test_solve_report(hanging_mass):
+    s = hanging_mass()
+    s.solve_statics()
+
+    report = s.last_solve_report
+    assert report.converged
+    assert report.n_dofs == 1
+    assert report.n_solver_runs == 1
+    assert report.n_update_calls > 0
+    assert report.total_time >= sum(report.phase_times.values()) - 1e-6
+
+    text = str(report)
+    assert text.startswith("Solve converged")
+    assert f"solver runs: {report.n_solver_runs}" in text
+
+
+def test_solve_report_json(hanging_mass, tmp_path):
+    s = hanging_mass()
+    s.solve_statics()
+
+    js = s.last_solve_report.to_json(tmp_path / "report.json")
+    d = json.loads((tmp_path / "report.json").read_text())
+
+    assert d == json.loads(js)
+    assert d["converged"]
+    assert "linear" in d["phase_times"]
+
+
+def test_solve_report_no_dofs():
+    s = Scene()
+    s.new_frame("frame")
+    s.solve_statics()
+
+    assert s.last_solve_report.converged
+    assert s.last_solve_report.n_solver_runs == 0
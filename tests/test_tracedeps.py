@@ -35,3 +35,56 @@ def test_noncore_direct_parent():
     s.new_frame('frame')
     v = s.new_visual('vis', parent = s['frame'], path="res: cube.obj")
     assert v.name in s.nodes_depending_on('frame')
+
+def test_nodes_with_parent_recursive_order():
+    s = Scene()
+    a = s.new_frame('a')
+    b = s.new_frame('b', parent=a)
+    c = s.new_point('c', parent=a)
+    d = s.new_point('d', parent=b)
+
+    assert s.nodes_with_parent(a) == [b, c]
+    assert s.nodes_with_parent(a, recursive=True) == [b, c, d]
+
+
+def test_sort_by_dependency_chain():
+    s = Scene()
+    last = None
+    for i in range(200):
+        last = s.new_frame(f'frame{i}', parent = last)
+
+    # reverse the order of the nodes, sorting should restore it
+    s._nodes.reverse()
+
+    tic = time()
+    s.sort_nodes_by_dependency()
+    print(time() - tic)
+
+    assert [n.name for n in s._nodes] == [f'frame{i}' for i in range(200)]
+
+
+def test_sort_by_dependency_after_tank_added():
+    s = Scene()
+    s.new_rigidbody('body')
+    bs = s.new_ballastsystem('bs', parent='body')
+    tank = s.new_tank('tank', parent='body')
+    tank.trimesh.load_obj('res: cube.obj')
+
+    bs.tanks.append(tank)  # changes dependencies without using a setter
+    s.sort_nodes_by_dependency()
+
+    names = [n.name for n in s._nodes]
+    assert names.index('tank') < names.index('bs')
+
+
+def test_delete_branch():
+    s = Scene()
+    s.new_frame('frame0')
+    for i in range(100):
+        frame = s.new_frame(f'frame0_{i}', parent = 'frame0')
+        for j in range(20):
+            s.new_point(f'point{i}_{j}', parent = frame)
+
+    s.delete('frame0')
+
+    assert len(s._nodes) == 0
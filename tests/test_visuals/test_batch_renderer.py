@@ -0,0 +1,61 @@
+import numpy as np
+
+from DAVE import *
+from DAVE.visual_helpers.batch_renderer import RenderSession, frame_filename, render_parallel
+
+
+def hanging_body():
+    s = Scene()
+    s.new_point("hook", position=(0, 0, 10))
+    body = s.new_rigidbody("body", mass=1, fixed=(False, False, False, True, True, True))
+    s.new_point("p", parent=body, position=(0, 0, 1))
+    s.new_cable("cable", endA="hook", endB="p", length=5, EA=1e5)
+    s.solve_statics()
+    return s
+
+
+def swinging_dofs(s, n):
+    d0 = s._vfc.get_dofs()
+    result = []
+    for i in range(n):
+        d = np.array(d0, dtype=float)
+        d[0] += np.sin(2 * np.pi * i / n)
+        result.append(d)
+    return result
+
+
+def test_render_dofs(tmp_path):
+    s = hanging_body()
+    d0 = s._vfc.get_dofs()
+
+    session = RenderSession(s, width=200, height=100)
+    files = session.render_dofs(swinging_dofs(s, 3), tmp_path)
+
+    assert files == [frame_filename(tmp_path, "frame", i) for i in range(3)]
+    assert all(file.exists() for file in files)
+    assert np.allclose(s._vfc.get_dofs(), d0)  # restored
+
+
+def test_render_cases(tmp_path):
+    s = hanging_body()
+
+    session = RenderSession(s, width=200, height=100)
+    files = session.render_cases(
+        [{("body", "mass"): 2}, {("body", "mass"): 3, ("cable", "length"): 6}],
+        tmp_path,
+    )
+
+    assert len(files) == 2
+    assert all(file.exists() for file in files)
+    assert s["body"].mass == 1  # restored
+    assert s["cable"].length == 5
+
+
+def test_render_parallel(tmp_path):
+    s = hanging_body()
+    files = render_parallel(
+        s, tmp_path, dofs=swinging_dofs(s, 4), n_workers=2, width=200, height=100
+    )
+
+    assert len(files) == 4
+    assert all(file.exists() for file in files)
@@ -0,0 +1,94 @@
+import numpy as np
+from numpy.testing import assert_allclose
+from vtkmodules.util.numpy_support import vtk_to_numpy
+
+from DAVE import *
+from DAVE.visual_helpers.cable_tubes import CableTube, MergedCableTubes, tension_colors
+from DAVE.visual_helpers.constants import CABLE_COLORMAP
+from DAVE.visual_helpers.simple_scene_renderer import SimpleSceneRenderer
+
+
+def cable_points(n=20, offset=0):
+    x = np.linspace(0, 10, n)
+    return np.column_stack((x, np.full(n, offset), -0.1 * x * (10 - x)))
+
+
+def mooring_spread(n=20):
+    s = Scene()
+    s.new_point("fairlead", position=(0, 0, 0))
+    for i in range(n):
+        angle = 2 * np.pi * i / n
+        s.new_point(f"anchor{i}", position=(100 * np.cos(angle), 100 * np.sin(angle), -50))
+        s.new_cable(f"line{i}", endA="fairlead", endB=f"anchor{i}", length=120, EA=1e5, diameter=0.2)
+    s.update()
+    return s
+
+
+def test_tension_colors_same_as_colormap():
+    tensions = [1, 5, 3, 10]
+    vmin, vmax = 0.95, 10.5
+
+    expected = [
+        [int(255 * c) for c in CABLE_COLORMAP((t - vmin) / (vmax - vmin))[:3]]
+        for t in tensions
+    ]
+    assert_allclose(tension_colors(tensions), expected)
+
+
+def test_cable_tube_reuses_pipeline():
+    tube = CableTube()
+    tube.update(cable_points(), 0.5, tensions=np.linspace(1, 2, 20))
+    output = tube.output
+    n_points = output.GetNumberOfPoints()
+    assert n_points == 20 * 12
+
+    tube.update(cable_points() + (0, 0, 5), 0.5, tensions=np.linspace(1, 2, 20))
+    assert tube.output is output
+    assert output.GetNumberOfPoints() == n_points
+
+    z = vtk_to_numpy(output.GetPoints().GetData())[:, 2]
+    assert_allclose(z.mean(), cable_points()[:, 2].mean() + 5, atol=1e-3)
+
+    # different number of points
+    tube.update(cable_points(30), 0.5, tensions=np.linspace(1, 2, 30))
+    assert tube.output.GetNumberOfPoints() == 30 * 12
+
+
+def test_merged_tubes():
+    merged = MergedCableTubes()
+    merged.update(
+        [
+            (cable_points(10, 0), 0.2, (255, 0, 0)),
+            (cable_points(20, 5), 0.4, tension_colors(np.linspace(1, 2, 20))),
+            ([(0, 0, 0)], 0.2, (255, 0, 0)),  # skipped, single point
+        ]
+    )
+
+    assert merged.n_cables == 2
+    assert merged.polydata.GetNumberOfLines() == 2
+    assert merged.tube.GetOutput().GetNumberOfPoints() == 30 * 12
+
+
+def test_renderer_merge_cables():
+    s = mooring_spread(5)
+    renderer = SimpleSceneRenderer(s)
+    assert renderer.merged_cables is None
+
+    renderer.settings.merge_cables = True
+    renderer.position_visuals()
+    assert renderer.merged_cables.n_cables == 5
+
+    # nothing changed, tubes are not rebuilt
+    mtime = renderer.merged_cables.tube.GetOutput().GetMTime()
+    renderer.position_visuals()
+    assert renderer.merged_cables.tube.GetOutput().GetMTime() == mtime
+
+    s["fairlead"].z = 1
+    s.update()
+    renderer.position_visuals()
+    assert renderer.merged_cables.tube.GetOutput().GetMTime() > mtime
+
+    renderer.settings.merge_cables = False
+    renderer.position_visuals()
+    assert renderer.merged_cables is None
+    assert renderer.actor_from_node(s["line0"]).actors["main"].GetMapper().GetInput().GetNumberOfPoints() > 0
@@ -0,0 +1,106 @@
+import os
+import shutil
+import numpy as np
+from numpy.testing import assert_allclose
+
+from DAVE import *
+from DAVE.visual_helpers.instancing import InstancedMesh
+from DAVE.visual_helpers.simple_scene_renderer import SimpleSceneRenderer
+from DAVE.visual_helpers import vtkActorMakers
+from DAVE.visual_helpers.vtkActorMakers import (
+    Cube,
+    cached_polydata_from_file,
+    vp_actor_from_file,
+)
+
+
+def repeated_visuals(n=30):
+    s = Scene()
+    for i in range(n):
+        f = s.new_frame(f"frame{i}", position=(3 * i, 0, 0), rotation=(0, 0, 10 * i))
+        s.new_visual(f"visual{i}", path="res: cube.obj", parent=f, scale=(1, 2, 3))
+    return s
+
+
+def test_polydata_is_shared():
+    s = Scene()
+    file = s.get_resource_path("res: cog.obj")
+
+    assert cached_polydata_from_file(file) is cached_polydata_from_file(file)
+
+    a = vp_actor_from_file(file)
+    b = vp_actor_from_file(file)
+    assert a is not b
+    assert a.GetMapper().GetInput() is b.GetMapper().GetInput()
+
+
+def test_file_cache_replaces_modified_file(tmp_path):
+    s = Scene()
+    file = tmp_path / "cube.obj"
+    shutil.copy(s.get_resource_path("res: cube.obj"), file)
+
+    first = cached_polydata_from_file(file)
+    n = len(vtkActorMakers._FILE_CACHE)
+
+    mtime = os.path.getmtime(file)
+    os.utime(file, (mtime + 10, mtime + 10))
+
+    assert cached_polydata_from_file(file) is not first
+    assert len(vtkActorMakers._FILE_CACHE) == n
+
+
+def test_instanced_mesh_transforms():
+    c, si = np.cos(np.deg2rad(30)), np.sin(np.deg2rad(30))
+    R = np.array(((c, -si, 0), (si, c, 0), (0, 0, 1)))
+
+    m = np.eye(4)
+    m[:3, :3] = R @ np.diag((1, 2, 3))
+    m[:3, 3] = (10, 20, 30)
+
+    instances = InstancedMesh(Cube().GetMapper().GetInput())
+    instances.update([np.eye(4), m])
+
+    assert instances.n_instances == 2
+    assert_allclose(instances._positions[1], (10, 20, 30))
+    assert_allclose(instances._scales[1], (1, 2, 3))
+    assert_allclose(instances._orientations[1], R.T.flatten())  # column-major
+    assert_allclose(instances._orientations[0], np.eye(3).flatten())
+
+
+def test_spmt_wheels_single_actor():
+    s = Scene()
+    f = s.new_frame("deck", position=(0, 0, 2))
+    spmt = s.new_spmt("spmt", parent=f, n_length=6, n_width=2)
+
+    renderer = SimpleSceneRenderer(s)
+    V = renderer.actor_from_node(spmt)
+
+    assert set(V.actors.keys()) == {"main", "wheel", "line"}
+    assert V.actors["wheel"]._instances.n_instances == 12
+
+    renderer.position_visuals()
+    outline = V.actors["wheel"]._outline
+    assert outline in renderer.node_outlines
+    assert not outline.is_silhouette
+
+
+def test_instance_visuals():
+    s = repeated_visuals(5)
+    renderer = SimpleSceneRenderer(s)
+
+    renderer.settings.instance_visuals = True
+    renderer.position_visuals()
+
+    assert len(renderer.instanced_visuals) == 1
+    instances = list(renderer.instanced_visuals.values())[0]
+    assert instances.n_instances == 5
+
+    actor = renderer.actor_from_node(s["visual3"]).actors["main"]
+    assert actor.GetMapper().GetInput().GetNumberOfPoints() == 0
+    assert_allclose(instances._positions[3], s["frame3"].global_position)
+
+    renderer.settings.instance_visuals = False
+    renderer.position_visuals()
+
+    assert len(renderer.instanced_visuals) == 0
+    assert actor.GetMapper().GetInput().GetNumberOfPoints() > 0
@@ -0,0 +1,82 @@
+from vtkmodules.vtkFiltersSources import vtkSphereSource
+from vtkmodules.vtkRenderingCore import vtkRenderer
+
+from DAVE import *
+from DAVE.settings_visuals import ViewportSettings
+from DAVE.visual_helpers.lod import MeshLOD, decimate, screen_size, select_level
+from DAVE.visual_helpers.vtkActorMakers import actor_from_trimesh, vtkActorFromPolyData
+
+
+def sphere(resolution=200):
+    source = vtkSphereSource()
+    source.SetThetaResolution(resolution)
+    source.SetPhiResolution(resolution)
+    source.Update()
+    return source.GetOutput()
+
+
+def test_decimate():
+    full = sphere()
+    coarse = decimate(full, 0.9)
+
+    assert coarse.GetNumberOfPolys() < 0.2 * full.GetNumberOfPolys()
+    assert coarse.GetNumberOfPolys() > 0
+
+
+def test_select_level():
+    settings = ViewportSettings()
+    settings.lod_screen_sizes = (400, 100)
+    settings.lod_reductions = (0.75, 0.95)
+
+    assert select_level(settings, 1000, interacting=False) == 0
+    assert select_level(settings, 200, interacting=False) == 1
+    assert select_level(settings, 50, interacting=False) == 2
+    assert select_level(settings, 1000, interacting=True) == 2
+
+    settings.lod_when_interacting = False
+    assert select_level(settings, 1000, interacting=True) == 0
+
+
+def test_screen_size():
+    renderer = vtkRenderer()
+    actor = vtkActorFromPolyData(sphere(10))
+    renderer.AddActor(actor)
+    renderer.ResetCamera()
+
+    camera = renderer.GetActiveCamera()
+    near = screen_size(renderer, actor)
+    camera.Dolly(0.1)  # move away
+    assert screen_size(renderer, actor) < near
+
+
+def test_variants_are_shared():
+    full = sphere()
+    a = vtkActorFromPolyData(full)
+    b = vtkActorFromPolyData(full)
+
+    lod_a = MeshLOD(full)
+    lod_b = MeshLOD(full)
+
+    reductions = (0.5, 0.9)
+    assert lod_a.apply(a, 2, reductions)
+    assert not lod_a.apply(a, 2, reductions)
+    assert lod_b.apply(b, 2, reductions)
+    assert a.GetMapper().GetInput() is b.GetMapper().GetInput()
+
+    assert lod_a.apply(a, 0, reductions)
+    assert a.GetMapper().GetInput() is full
+
+
+def test_actor_from_trimesh_node():
+    s = Scene()
+    s.new_rigidbody("body", mass=1)
+    b = s.new_buoyancy("buoyancy", parent="body")
+    b.trimesh.load_file("res: cube.obj")
+
+    from_node = actor_from_trimesh(b.trimesh)
+    from_core = actor_from_trimesh(b.trimesh._TriMesh)
+
+    assert (
+        from_node.GetMapper().GetInput().GetNumberOfPolys()
+        == from_core.GetMapper().GetInput().GetNumberOfPolys()
+    )
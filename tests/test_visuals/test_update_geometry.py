@@ -0,0 +1,57 @@
+from numpy.testing import assert_allclose
+
+from DAVE import *
+from DAVE.visual_helpers.actors import (
+    UPDATE_TIMINGS,
+    reset_update_timings,
+    update_timings_report,
+)
+from DAVE.visual_helpers.simple_scene_renderer import SimpleSceneRenderer
+
+
+def many_frames(n=200):
+    s = Scene()
+    for i in range(n):
+        f = s.new_frame(f"frame{i}", position=(i, 0, 0))
+        s.new_point(f"point{i}", parent=f, position=(0, 1, 0))
+    return s
+
+
+def test_only_moved_nodes_are_updated():
+    s = many_frames(10)
+    renderer = SimpleSceneRenderer(s)
+    renderer.position_visuals()
+
+    reset_update_timings()
+    s["frame3"].z = 5
+    renderer.position_visuals()
+
+    assert UPDATE_TIMINGS["Frame"][:2] == [1, 9]
+    assert UPDATE_TIMINGS["Point"][:2] == [1, 9]
+
+    M = renderer.actor_from_node(s["point3"]).actors["main"].GetMatrix()
+    assert_allclose([M.GetElement(i, 3) for i in range(3)], (3, 1, 5))
+
+
+def test_settings_change_updates():
+    s = many_frames(3)
+    renderer = SimpleSceneRenderer(s)
+    renderer.position_visuals()
+
+    reset_update_timings()
+    renderer.settings.geometry_scale = 2 * renderer.settings.geometry_scale
+    renderer.position_visuals()
+
+    assert UPDATE_TIMINGS["Frame"][:2] == [3, 0]
+
+
+def test_invalidate_geometry():
+    s = many_frames(3)
+    renderer = SimpleSceneRenderer(s)
+    renderer.position_visuals()
+
+    reset_update_timings()
+    renderer.actor_from_node(s["frame1"]).invalidate_geometry()
+    renderer.position_visuals()
+
+    assert UPDATE_TIMINGS["Frame"][:2] == [1, 2]
@@ -0,0 +1,48 @@
+import numpy as np
+from numpy.testing import assert_allclose
+
+from DAVE.visual_helpers.wavefield import WaveField
+
+
+def waveplane(nt=20, nx=200):
+    wf = WaveField()
+    wf.create_waveplane(
+        wave_direction=30,
+        wave_amplitude=2,
+        wave_length=100,
+        wave_period=8,
+        nt=nt,
+        nx=nx,
+        ny=2,
+        dx=500,
+        dy=500,
+    )
+    return wf
+
+
+def test_make_grid_rotates():
+    wf = WaveField()
+    wf.make_grid(-10, 10, -5, 5, 11, 7, 30)
+
+    c, s = np.cos(np.deg2rad(30)), np.sin(np.deg2rad(30))
+    for ix, x in enumerate(np.linspace(-10, 10, 11)):
+        for iy, y in enumerate(np.linspace(-5, 5, 7)):
+            assert_allclose(wf.xv[ix, iy], c * x - s * y)
+            assert_allclose(wf.yv[ix, iy], s * x + c * y)
+
+
+def test_update_writes_elevation():
+    wf = waveplane()
+    nx, ny, nt = wf.elevation.shape
+
+    for i in (0, 3, nt - 1):
+        wf.update(i * wf.dt)
+        for ix in (0, 17, nx - 1):
+            for iy in range(ny):
+                x, y, z = wf.pts.GetPoint(ix + iy * nx)
+                assert_allclose(z, wf.elevation[ix, iy, i], atol=1e-4)
+                assert_allclose(x, wf.xv[ix, iy], atol=1e-3)
+                assert_allclose(y, wf.yv[ix, iy], atol=1e-3)
+
+        x, y, z = wf.line_pts.GetPoint(17)
+        assert_allclose(z, wf.elevation[17, 0, i], atol=1e-4)
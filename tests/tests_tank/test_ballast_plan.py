@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from DAVE import *
+
+
+def load_out_cases(n):
+    return [
+        {
+            "stage": f"stage {i}",
+            "target_elevation": -2.5,
+            "loads": {("load", "force"): (0, 0, -i * 20000 / (n - 1))},
+        }
+        for i in range(n)
+    ]
+
+
+def test_plan_in_process(barge_with_tanks):
+    s, bs = barge_with_tanks()
+    fills_before = [tank.fill_pct for tank in bs.tanks]
+
+    fills, report = bs.plan(load_out_cases(4), n_workers=1)
+
+    assert list(fills.columns) == bs.tank_names()
+    assert len(report) == 4
+    assert report["converged"].all()
+    assert np.all(np.abs(report["heel"]) < 0.01)
+    assert np.all(np.abs(report["trim"]) < 0.01)
+    assert np.all(np.abs(report["elevation_error"]) < 0.01)
+
+    # more load, less ballast
+    assert fills.iloc[0].sum() > fills.iloc[-1].sum()
+
+    # the scene itself is not changed
+    assert [tank.fill_pct for tank in bs.tanks] == fills_before
+
+
+def test_plan_respects_frozen(barge_with_tanks):
+    s, bs = barge_with_tanks()
+    s["tank00"].fill_pct = 20
+    bs.frozen = ["tank00"]
+
+    fills, report = bs.plan(load_out_cases(3), n_workers=1)
+
+    assert np.all(fills["tank00"] == pytest.approx(20))
+
+
+def test_plan_node_property_columns(barge_with_tanks):
+    s, bs = barge_with_tanks()
+
+    import pandas as pd
+
+    cases = pd.DataFrame(
+        {"stage": [1, 2], "target_elevation": [-2.5, -3], "Barge.mass": [4000, 4500]}
+    )
+    fills, report = bs.plan(cases, n_workers=1)
+
+    assert list(report.index) == [1, 2]
+    assert report["converged"].all()
+
+
+def test_plan_unknown_property(barge_with_tanks):
+    s, bs = barge_with_tanks()
+
+    with pytest.raises(ValueError):
+        bs.plan([{"target_elevation": -2.5, "load.not_a_property": 1}])
+
+
+def test_plan_parallel_same_as_in_process(barge_with_tanks):
+    s, bs = barge_with_tanks()
+    cases = load_out_cases(4)
+
+    fills, report = bs.plan(cases, n_workers=1)
+    fills_parallel, report_parallel = bs.plan(cases, n_workers=2)
+
+    assert report_parallel["converged"].all()
+    assert np.allclose(fills_parallel.values, fills.values, atol=0.01)
+
+
+def test_plan_terminated(barge_with_tanks):
+    s, bs = barge_with_tanks()
+
+    fills, report = bs.plan(load_out_cases(3), n_workers=1, do_terminate_func=lambda: True)
+
+    assert report["terminated"].all()
+    assert not report["converged"].any()
+    assert np.all(np.isnan(fills.values))
@@ -0,0 +1,52 @@
+import pytest
+
+from DAVE import *
+from DAVE.marine import ballast_to_even_keel
+
+
+def test_ballast_to_even_keel_influence(barge_with_tanks):
+    s, bs = barge_with_tanks(cog=(8, 2, 3))
+    assert abs(bs.parent.heel) > 0.1
+
+    ballast_to_even_keel(bs, tolerance=0.01, method="influence")
+
+    assert abs(bs.parent.heel) < 0.01
+    assert abs(bs.parent.trim) < 0.01
+
+    # only water was added
+    assert all(tank.fill_pct >= 0 for tank in bs.tanks)
+
+
+def test_ballast_to_even_keel_respects_frozen(barge_with_tanks):
+    s, bs = barge_with_tanks(cog=(8, 2, 3))
+    s["tank30"].fill_pct = 50
+    s["tank31"].fill_pct = 50
+    bs.frozen = ["tank30", "tank31"]
+    s.solve_statics()
+
+    ballast_to_even_keel(bs, tolerance=0.01, method="influence")
+
+    assert s["tank30"].fill_pct == pytest.approx(50)
+    assert s["tank31"].fill_pct == pytest.approx(50)
+    assert abs(bs.parent.heel) < 0.01
+    assert abs(bs.parent.trim) < 0.01
+
+
+def test_ballast_to_even_keel_terminate(barge_with_tanks):
+    s, bs = barge_with_tanks(cog=(8, 2, 3))
+    messages = []
+
+    log = ballast_to_even_keel(
+        bs, feedback_func=messages.append, do_terminate=lambda: True
+    )
+
+    assert messages  # feedback was given before terminating
+    assert isinstance(log, list)
+
+
+def test_ballast_to_even_keel_no_tanks(barge_with_tanks):
+    s, bs = barge_with_tanks(cog=(8, 2, 3))
+    bs.frozen = bs.tank_names()
+
+    with pytest.raises(ValueError):
+        ballast_to_even_keel(bs)